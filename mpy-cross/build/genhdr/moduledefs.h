@@ -0,0 +1,35 @@
+// Automatically generated by makemoduledefs.py.
+
+extern const struct _mp_obj_module_t mp_module_struct;
+#undef MODULE_DEF_STRUCT
+#define MODULE_DEF_STRUCT { MP_ROM_QSTR(MP_QSTR_struct), MP_ROM_PTR(&mp_module_struct) },
+
+extern const struct _mp_obj_module_t mp_module___main__;
+#undef MODULE_DEF___MAIN__
+#define MODULE_DEF___MAIN__ { MP_ROM_QSTR(MP_QSTR___main__), MP_ROM_PTR(&mp_module___main__) },
+
+extern const struct _mp_obj_module_t mp_module_builtins;
+#undef MODULE_DEF_BUILTINS
+#define MODULE_DEF_BUILTINS { MP_ROM_QSTR(MP_QSTR_builtins), MP_ROM_PTR(&mp_module_builtins) },
+
+extern const struct _mp_obj_module_t mp_module_math;
+#undef MODULE_DEF_MATH
+#define MODULE_DEF_MATH { MP_ROM_QSTR(MP_QSTR_math), MP_ROM_PTR(&mp_module_math) },
+
+extern const struct _mp_obj_module_t mp_module_micropython;
+#undef MODULE_DEF_MICROPYTHON
+#define MODULE_DEF_MICROPYTHON { MP_ROM_QSTR(MP_QSTR_micropython), MP_ROM_PTR(&mp_module_micropython) },
+
+
+#define MICROPY_REGISTERED_MODULES \
+    MODULE_DEF_BUILTINS \
+    MODULE_DEF_MATH \
+    MODULE_DEF_MICROPYTHON \
+    MODULE_DEF___MAIN__ \
+// MICROPY_REGISTERED_MODULES
+
+#define MICROPY_HAVE_REGISTERED_EXTENSIBLE_MODULES  1
+
+#define MICROPY_REGISTERED_EXTENSIBLE_MODULES \
+    MODULE_DEF_STRUCT \
+// MICROPY_REGISTERED_EXTENSIBLE_MODULES
@@ -0,0 +1,4 @@
+// This file was generated by py/makeversionhdr.py
+#define MICROPY_GIT_TAG "cb5c6e843a-dirty"
+#define MICROPY_GIT_HASH "cb5c6e8"
+#define MICROPY_BUILD_DATE "2026-10-19"
@@ -0,0 +1,1553 @@
+Q(ArithmeticError)
+
+Q(ArithmeticError)
+
+Q(AssertionError)
+
+Q(AssertionError)
+
+Q(AssertionError)
+
+Q(AttributeError)
+
+Q(AttributeError)
+
+Q(BaseException)
+
+Q(BaseException)
+
+Q(BaseException)
+
+Q(EOFError)
+
+Q(EOFError)
+
+Q(Ellipsis)
+
+Q(Ellipsis)
+
+Q(Exception)
+
+Q(Exception)
+
+Q(GeneratorExit)
+
+Q(GeneratorExit)
+
+Q(ImportError)
+
+Q(ImportError)
+
+Q(IndentationError)
+
+Q(IndentationError)
+
+Q(IndexError)
+
+Q(IndexError)
+
+Q(KeyError)
+
+Q(KeyError)
+
+Q(KeyboardInterrupt)
+
+Q(KeyboardInterrupt)
+
+Q(LookupError)
+
+Q(LookupError)
+
+Q(MemoryError)
+
+Q(MemoryError)
+
+Q(NameError)
+
+Q(NameError)
+
+Q(None)
+
+Q(NoneType)
+
+Q(NotImplementedError)
+
+Q(NotImplementedError)
+
+Q(OSError)
+
+Q(OSError)
+
+Q(OverflowError)
+
+Q(OverflowError)
+
+Q(RuntimeError)
+
+Q(RuntimeError)
+
+Q(StopAsyncIteration)
+
+Q(StopAsyncIteration)
+
+Q(StopAsyncIteration)
+
+Q(StopIteration)
+
+Q(StopIteration)
+
+Q(SyntaxError)
+
+Q(SyntaxError)
+
+Q(SystemExit)
+
+Q(SystemExit)
+
+Q(TypeError)
+
+Q(TypeError)
+
+Q(UnicodeError)
+
+Q(UnicodeError)
+
+Q(ValueError)
+
+Q(ValueError)
+
+Q(ViperTypeError)
+
+Q(ViperTypeError)
+
+Q(ZeroDivisionError)
+
+Q(ZeroDivisionError)
+
+Q(_0x0a_)
+
+Q(__add__)
+
+Q(__aenter__)
+
+Q(__aenter__)
+
+Q(__aexit__)
+
+Q(__aexit__)
+
+Q(__aiter__)
+
+Q(__anext__)
+
+Q(__bases__)
+
+Q(__bool__)
+
+Q(__build_class__)
+
+Q(__call__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__complex__)
+
+Q(__contains__)
+
+Q(__contains__)
+
+Q(__delitem__)
+
+Q(__delitem__)
+
+Q(__dict__)
+
+Q(__dict__)
+
+Q(__dict__)
+
+Q(__enter__)
+
+Q(__enter__)
+
+Q(__eq__)
+
+Q(__eq__)
+
+Q(__exit__)
+
+Q(__exit__)
+
+Q(__float__)
+
+Q(__ge__)
+
+Q(__getattr__)
+
+Q(__getattr__)
+
+Q(__getattr__)
+
+Q(__getattr__)
+
+Q(__getitem__)
+
+Q(__getitem__)
+
+Q(__getitem__)
+
+Q(__getitem__)
+
+Q(__gt__)
+
+Q(__hash__)
+
+Q(__iadd__)
+
+Q(__import__)
+
+Q(__init__)
+
+Q(__init__)
+
+Q(__init__)
+
+Q(__int__)
+
+Q(__isub__)
+
+Q(__iter__)
+
+Q(__le__)
+
+Q(__len__)
+
+Q(__lt__)
+
+Q(__main__)
+
+Q(__main__)
+
+Q(__module__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__ne__)
+
+Q(__new__)
+
+Q(__new__)
+
+Q(__new__)
+
+Q(__next__)
+
+Q(__next__)
+
+Q(__next__)
+
+Q(__next__)
+
+Q(__path__)
+
+Q(__path__)
+
+Q(__path__)
+
+Q(__path__)
+
+Q(__qualname__)
+
+Q(__repl_print__)
+
+Q(__repl_print__)
+
+Q(__repr__)
+
+Q(__repr__)
+
+Q(__reversed__)
+
+Q(__setitem__)
+
+Q(__setitem__)
+
+Q(__str__)
+
+Q(__sub__)
+
+Q(__traceback__)
+
+Q(_brace_open__colon__hash_b_brace_close_)
+
+Q(_lt_dictcomp_gt_)
+
+Q(_lt_dictcomp_gt_)
+
+Q(_lt_dictcomp_gt_)
+
+Q(_lt_genexpr_gt_)
+
+Q(_lt_genexpr_gt_)
+
+Q(_lt_genexpr_gt_)
+
+Q(_lt_lambda_gt_)
+
+Q(_lt_lambda_gt_)
+
+Q(_lt_lambda_gt_)
+
+Q(_lt_listcomp_gt_)
+
+Q(_lt_listcomp_gt_)
+
+Q(_lt_listcomp_gt_)
+
+Q(_lt_module_gt_)
+
+Q(_lt_module_gt_)
+
+Q(_lt_module_gt_)
+
+Q(_lt_module_gt_)
+
+Q(_lt_setcomp_gt_)
+
+Q(_lt_setcomp_gt_)
+
+Q(_lt_setcomp_gt_)
+
+Q(_lt_string_gt_)
+
+Q(_percent__hash_o)
+
+Q(_percent__hash_x)
+
+Q(_space_)
+
+Q(_star_)
+
+Q(_star_)
+
+Q(_star_)
+
+Q(a0)
+
+Q(a0)
+
+Q(a1)
+
+Q(a1)
+
+Q(a10)
+
+Q(a11)
+
+Q(a12)
+
+Q(a13)
+
+Q(a14)
+
+Q(a15)
+
+Q(a2)
+
+Q(a2)
+
+Q(a3)
+
+Q(a3)
+
+Q(a4)
+
+Q(a4)
+
+Q(a5)
+
+Q(a5)
+
+Q(a6)
+
+Q(a6)
+
+Q(a7)
+
+Q(a7)
+
+Q(a8)
+
+Q(a9)
+
+Q(abs)
+
+Q(abs_)
+
+Q(acos)
+
+Q(add)
+
+Q(add)
+
+Q(add)
+
+Q(add)
+
+Q(add)
+
+Q(add_n)
+
+Q(addi)
+
+Q(addi)
+
+Q(addi_n)
+
+Q(addmi)
+
+Q(addx2)
+
+Q(addx4)
+
+Q(addx8)
+
+Q(align)
+
+Q(all)
+
+Q(and_)
+
+Q(and_)
+
+Q(and_)
+
+Q(andi)
+
+Q(any)
+
+Q(append)
+
+Q(append)
+
+Q(args)
+
+Q(asin)
+
+Q(asm_rv32)
+
+Q(asm_thumb)
+
+Q(asm_xtensa)
+
+Q(asr)
+
+Q(atan)
+
+Q(atan2)
+
+Q(auipc)
+
+Q(b)
+
+Q(ball)
+
+Q(bany)
+
+Q(bbc)
+
+Q(bbci)
+
+Q(bbs)
+
+Q(bbsi)
+
+Q(bcc)
+
+Q(bccz)
+
+Q(beq)
+
+Q(beq)
+
+Q(beqz)
+
+Q(beqz_n)
+
+Q(bge)
+
+Q(bge)
+
+Q(bgeu)
+
+Q(bgeu)
+
+Q(bgez)
+
+Q(bin)
+
+Q(bit_branch)
+
+Q(bl)
+
+Q(blt)
+
+Q(blt)
+
+Q(bltu)
+
+Q(bltu)
+
+Q(bltz)
+
+Q(bnall)
+
+Q(bne)
+
+Q(bne)
+
+Q(bnez)
+
+Q(bnez_n)
+
+Q(bnone)
+
+Q(bool)
+
+Q(bool)
+
+Q(bool)
+
+Q(bool)
+
+Q(bool)
+
+Q(bound_method)
+
+Q(builtins)
+
+Q(builtins)
+
+Q(bx)
+
+Q(bytearray)
+
+Q(bytearray)
+
+Q(bytecode)
+
+Q(bytes)
+
+Q(bytes)
+
+Q(bytes)
+
+Q(c_add)
+
+Q(c_addi)
+
+Q(c_addi4spn)
+
+Q(c_and)
+
+Q(c_andi)
+
+Q(c_beqz)
+
+Q(c_bnez)
+
+Q(c_ebreak)
+
+Q(c_j)
+
+Q(c_jal)
+
+Q(c_jalr)
+
+Q(c_jr)
+
+Q(c_li)
+
+Q(c_lui)
+
+Q(c_lw)
+
+Q(c_lwsp)
+
+Q(c_mv)
+
+Q(c_nop)
+
+Q(c_or)
+
+Q(c_slli)
+
+Q(c_srai)
+
+Q(c_srli)
+
+Q(c_sub)
+
+Q(c_sw)
+
+Q(c_swsp)
+
+Q(c_xor)
+
+Q(calcsize)
+
+Q(call0)
+
+Q(call0)
+
+Q(call0)
+
+Q(call0)
+
+Q(callable)
+
+Q(callx0)
+
+Q(ceil)
+
+Q(chr)
+
+Q(classmethod)
+
+Q(classmethod)
+
+Q(clear)
+
+Q(clear)
+
+Q(clear)
+
+Q(close)
+
+Q(close)
+
+Q(closure)
+
+Q(clz)
+
+Q(cmp)
+
+Q(complex)
+
+Q(complex)
+
+Q(const)
+
+Q(const)
+
+Q(copy)
+
+Q(copy)
+
+Q(copy)
+
+Q(copysign)
+
+Q(cos)
+
+Q(count)
+
+Q(count)
+
+Q(count)
+
+Q(cpsid)
+
+Q(cpsie)
+
+Q(csrrc)
+
+Q(csrrci)
+
+Q(csrrs)
+
+Q(csrrsi)
+
+Q(csrrw)
+
+Q(csrrwi)
+
+Q(data)
+
+Q(decode)
+
+Q(default)
+
+Q(degrees)
+
+Q(delattr)
+
+Q(deleter)
+
+Q(dict)
+
+Q(dict)
+
+Q(dict_view)
+
+Q(difference)
+
+Q(difference_update)
+
+Q(dir)
+
+Q(discard)
+
+Q(div)
+
+Q(divmod)
+
+Q(divu)
+
+Q(doc)
+
+Q(e)
+
+Q(ebreak)
+
+Q(ecall)
+
+Q(encode)
+
+Q(end)
+
+Q(endswith)
+
+Q(enumerate)
+
+Q(enumerate)
+
+Q(errno)
+
+Q(eval)
+
+Q(exec)
+
+Q(exp)
+
+Q(extend)
+
+Q(extend)
+
+Q(fabs)
+
+Q(filter)
+
+Q(filter)
+
+Q(find)
+
+Q(float)
+
+Q(float)
+
+Q(floor)
+
+Q(fmod)
+
+Q(format)
+
+Q(frexp)
+
+Q(from_bytes)
+
+Q(fromkeys)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(generator)
+
+Q(generator)
+
+Q(generator)
+
+Q(get)
+
+Q(getattr)
+
+Q(getter)
+
+Q(globals)
+
+Q(gp)
+
+Q(hasattr)
+
+Q(hash)
+
+Q(heap_lock)
+
+Q(heap_unlock)
+
+Q(hex)
+
+Q(id)
+
+Q(imag)
+
+Q(index)
+
+Q(index)
+
+Q(index)
+
+Q(inf)
+
+Q(insert)
+
+Q(int)
+
+Q(int)
+
+Q(int)
+
+Q(int)
+
+Q(int)
+
+Q(integer)
+
+Q(integer)
+
+Q(intersection)
+
+Q(intersection_update)
+
+Q(isalpha)
+
+Q(isdigit)
+
+Q(isdisjoint)
+
+Q(isfinite)
+
+Q(isinf)
+
+Q(isinstance)
+
+Q(islower)
+
+Q(isnan)
+
+Q(isspace)
+
+Q(issubclass)
+
+Q(issubset)
+
+Q(issuperset)
+
+Q(isupper)
+
+Q(items)
+
+Q(iter)
+
+Q(iterable)
+
+Q(iterator)
+
+Q(iterator)
+
+Q(iterator)
+
+Q(iterator)
+
+Q(iterator)
+
+Q(j)
+
+Q(jal)
+
+Q(jalr)
+
+Q(join)
+
+Q(jx)
+
+Q(key)
+
+Q(key)
+
+Q(keys)
+
+Q(keys)
+
+Q(l16si)
+
+Q(l16ui)
+
+Q(l32i)
+
+Q(l32i_n)
+
+Q(l32r)
+
+Q(l32r)
+
+Q(l32r)
+
+Q(l32r)
+
+Q(l8ui)
+
+Q(la)
+
+Q(label)
+
+Q(label)
+
+Q(lb)
+
+Q(lbu)
+
+Q(ldexp)
+
+Q(ldr)
+
+Q(ldrb)
+
+Q(ldrex)
+
+Q(ldrh)
+
+Q(len)
+
+Q(lh)
+
+Q(lhu)
+
+Q(li)
+
+Q(list)
+
+Q(list)
+
+Q(little)
+
+Q(little)
+
+Q(locals)
+
+Q(location)
+
+Q(location)
+
+Q(log)
+
+Q(lower)
+
+Q(lsl)
+
+Q(lsr)
+
+Q(lstrip)
+
+Q(lui)
+
+Q(lw)
+
+Q(map)
+
+Q(map)
+
+Q(math)
+
+Q(math)
+
+Q(math)
+
+Q(max)
+
+Q(maximum_space_recursion_space_depth_space_exceeded)
+
+Q(micropython)
+
+Q(micropython)
+
+Q(micropython)
+
+Q(min)
+
+Q(modf)
+
+Q(module)
+
+Q(mov)
+
+Q(mov)
+
+Q(mov)
+
+Q(mov_n)
+
+Q(movi)
+
+Q(movi_n)
+
+Q(movt)
+
+Q(movw)
+
+Q(movwt)
+
+Q(mrs)
+
+Q(mul)
+
+Q(mulh)
+
+Q(mulhsu)
+
+Q(mulhu)
+
+Q(mull)
+
+Q(mv)
+
+Q(nan)
+
+Q(native)
+
+Q(neg)
+
+Q(next)
+
+Q(nop)
+
+Q(nop)
+
+Q(nop_n)
+
+Q(nsa)
+
+Q(nsau)
+
+Q(object)
+
+Q(object)
+
+Q(object)
+
+Q(object)
+
+Q(object)
+
+Q(oct)
+
+Q(offset)
+
+Q(opt_level)
+
+Q(or_)
+
+Q(or_)
+
+Q(ord)
+
+Q(ori)
+
+Q(pack)
+
+Q(pack_into)
+
+Q(pend_throw)
+
+Q(pi)
+
+Q(pop)
+
+Q(pop)
+
+Q(pop)
+
+Q(pop)
+
+Q(popitem)
+
+Q(pow)
+
+Q(pow)
+
+Q(print)
+
+Q(property)
+
+Q(property)
+
+Q(ptr)
+
+Q(ptr)
+
+Q(ptr16)
+
+Q(ptr16)
+
+Q(ptr32)
+
+Q(ptr32)
+
+Q(ptr8)
+
+Q(ptr8)
+
+Q(push)
+
+Q(ra)
+
+Q(radians)
+
+Q(range)
+
+Q(range)
+
+Q(range)
+
+Q(rbit)
+
+Q(real)
+
+Q(register)
+
+Q(rem)
+
+Q(remove)
+
+Q(remove)
+
+Q(remu)
+
+Q(replace)
+
+Q(repr)
+
+Q(ret)
+
+Q(ret_n)
+
+Q(reverse)
+
+Q(reverse)
+
+Q(reversed)
+
+Q(reversed)
+
+Q(rfind)
+
+Q(rindex)
+
+Q(round)
+
+Q(rsplit)
+
+Q(rstrip)
+
+Q(s0)
+
+Q(s1)
+
+Q(s10)
+
+Q(s11)
+
+Q(s16i)
+
+Q(s2)
+
+Q(s3)
+
+Q(s32i)
+
+Q(s32i_n)
+
+Q(s4)
+
+Q(s5)
+
+Q(s6)
+
+Q(s7)
+
+Q(s8)
+
+Q(s8i)
+
+Q(s9)
+
+Q(sb)
+
+Q(sdiv)
+
+Q(send)
+
+Q(send)
+
+Q(sep)
+
+Q(set)
+
+Q(set)
+
+Q(setattr)
+
+Q(setdefault)
+
+Q(setter)
+
+Q(sh)
+
+Q(sh1add)
+
+Q(sh2add)
+
+Q(sh3add)
+
+Q(sin)
+
+Q(slice)
+
+Q(slice)
+
+Q(sll)
+
+Q(sll)
+
+Q(slli)
+
+Q(slli)
+
+Q(slt)
+
+Q(slti)
+
+Q(sltiu)
+
+Q(sltu)
+
+Q(sort)
+
+Q(sorted)
+
+Q(sp)
+
+Q(split)
+
+Q(sqrt)
+
+Q(sra)
+
+Q(sra)
+
+Q(srai)
+
+Q(srai)
+
+Q(src)
+
+Q(srl)
+
+Q(srl)
+
+Q(srli)
+
+Q(srli)
+
+Q(ssa8b)
+
+Q(ssa8l)
+
+Q(ssai)
+
+Q(ssl)
+
+Q(ssr)
+
+Q(start)
+
+Q(start)
+
+Q(startswith)
+
+Q(staticmethod)
+
+Q(staticmethod)
+
+Q(step)
+
+Q(stop)
+
+Q(str)
+
+Q(str)
+
+Q(str)
+
+Q(str)
+
+Q(str)
+
+Q(strb)
+
+Q(strex)
+
+Q(strh)
+
+Q(strip)
+
+Q(struct)
+
+Q(struct)
+
+Q(sub)
+
+Q(sub)
+
+Q(sub)
+
+Q(sub)
+
+Q(subx2)
+
+Q(subx4)
+
+Q(subx8)
+
+Q(sum)
+
+Q(super)
+
+Q(super)
+
+Q(super)
+
+Q(sw)
+
+Q(symmetric_difference)
+
+Q(symmetric_difference_update)
+
+Q(t0)
+
+Q(t1)
+
+Q(t2)
+
+Q(t3)
+
+Q(t4)
+
+Q(t5)
+
+Q(t6)
+
+Q(tan)
+
+Q(target)
+
+Q(target)
+
+Q(tau)
+
+Q(throw)
+
+Q(throw)
+
+Q(to_bytes)
+
+Q(tp)
+
+Q(trunc)
+
+Q(tuple)
+
+Q(tuple)
+
+Q(type)
+
+Q(type)
+
+Q(udiv)
+
+Q(uint)
+
+Q(uint)
+
+Q(uint)
+
+Q(union)
+
+Q(unpack)
+
+Q(unpack_from)
+
+Q(update)
+
+Q(update)
+
+Q(upper)
+
+Q(utf_hyphen_8)
+
+Q(utf_hyphen_8)
+
+Q(value)
+
+Q(values)
+
+Q(vcmp)
+
+Q(vcvt_f32_s32)
+
+Q(vcvt_s32_f32)
+
+Q(viper)
+
+Q(vldr)
+
+Q(vmov)
+
+Q(vmrs)
+
+Q(vneg)
+
+Q(vsqrt)
+
+Q(vstr)
+
+Q(wfi)
+
+Q(x0)
+
+Q(x1)
+
+Q(x10)
+
+Q(x11)
+
+Q(x12)
+
+Q(x13)
+
+Q(x14)
+
+Q(x15)
+
+Q(x16)
+
+Q(x17)
+
+Q(x18)
+
+Q(x19)
+
+Q(x2)
+
+Q(x20)
+
+Q(x21)
+
+Q(x22)
+
+Q(x23)
+
+Q(x24)
+
+Q(x25)
+
+Q(x26)
+
+Q(x27)
+
+Q(x28)
+
+Q(x29)
+
+Q(x3)
+
+Q(x30)
+
+Q(x31)
+
+Q(x4)
+
+Q(x5)
+
+Q(x6)
+
+Q(x7)
+
+Q(x8)
+
+Q(x9)
+
+Q(xor)
+
+Q(xor)
+
+Q(xori)
+
+Q(zero)
+
+Q(zip)
+
+Q(zip)
+
+Q(zip)
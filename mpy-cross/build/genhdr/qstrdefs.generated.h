@@ -0,0 +1,561 @@
+// This file was automatically generated by makeqstrdata.py
+
+QDEF0(MP_QSTRnull, 0, 0, "")
+QDEF0(MP_QSTR_, 5, 0, "")
+QDEF0(MP_QSTR___dir__, 122, 7, "__dir__")
+QDEF0(MP_QSTR__0x0a_, 175, 1, "\x0a")
+QDEF0(MP_QSTR__space_, 133, 1, " ")
+QDEF0(MP_QSTR__star_, 143, 1, "*")
+QDEF0(MP_QSTR__slash_, 138, 1, "/")
+QDEF0(MP_QSTR__lt_module_gt_, 189, 8, "<module>")
+QDEF0(MP_QSTR__, 250, 1, "_")
+QDEF0(MP_QSTR___call__, 167, 8, "__call__")
+QDEF0(MP_QSTR___class__, 43, 9, "__class__")
+QDEF0(MP_QSTR___delitem__, 253, 11, "__delitem__")
+QDEF0(MP_QSTR___enter__, 109, 9, "__enter__")
+QDEF0(MP_QSTR___exit__, 69, 8, "__exit__")
+QDEF0(MP_QSTR___getattr__, 64, 11, "__getattr__")
+QDEF0(MP_QSTR___getitem__, 38, 11, "__getitem__")
+QDEF0(MP_QSTR___hash__, 247, 8, "__hash__")
+QDEF0(MP_QSTR___init__, 95, 8, "__init__")
+QDEF0(MP_QSTR___int__, 22, 7, "__int__")
+QDEF0(MP_QSTR___iter__, 207, 8, "__iter__")
+QDEF0(MP_QSTR___len__, 226, 7, "__len__")
+QDEF0(MP_QSTR___main__, 142, 8, "__main__")
+QDEF0(MP_QSTR___module__, 255, 10, "__module__")
+QDEF0(MP_QSTR___name__, 226, 8, "__name__")
+QDEF0(MP_QSTR___new__, 121, 7, "__new__")
+QDEF0(MP_QSTR___next__, 2, 8, "__next__")
+QDEF0(MP_QSTR___qualname__, 107, 12, "__qualname__")
+QDEF0(MP_QSTR___repr__, 16, 8, "__repr__")
+QDEF0(MP_QSTR___setitem__, 50, 11, "__setitem__")
+QDEF0(MP_QSTR___str__, 208, 7, "__str__")
+QDEF0(MP_QSTR_ArithmeticError, 45, 15, "ArithmeticError")
+QDEF0(MP_QSTR_AssertionError, 151, 14, "AssertionError")
+QDEF0(MP_QSTR_AttributeError, 33, 14, "AttributeError")
+QDEF0(MP_QSTR_BaseException, 7, 13, "BaseException")
+QDEF0(MP_QSTR_EOFError, 145, 8, "EOFError")
+QDEF0(MP_QSTR_Ellipsis, 240, 8, "Ellipsis")
+QDEF0(MP_QSTR_Exception, 242, 9, "Exception")
+QDEF0(MP_QSTR_GeneratorExit, 22, 13, "GeneratorExit")
+QDEF0(MP_QSTR_ImportError, 32, 11, "ImportError")
+QDEF0(MP_QSTR_IndentationError, 92, 16, "IndentationError")
+QDEF0(MP_QSTR_IndexError, 131, 10, "IndexError")
+QDEF0(MP_QSTR_KeyError, 234, 8, "KeyError")
+QDEF0(MP_QSTR_KeyboardInterrupt, 175, 17, "KeyboardInterrupt")
+QDEF0(MP_QSTR_LookupError, 255, 11, "LookupError")
+QDEF0(MP_QSTR_MemoryError, 220, 11, "MemoryError")
+QDEF0(MP_QSTR_NameError, 186, 9, "NameError")
+QDEF0(MP_QSTR_NoneType, 23, 8, "NoneType")
+QDEF0(MP_QSTR_NotImplementedError, 198, 19, "NotImplementedError")
+QDEF0(MP_QSTR_OSError, 161, 7, "OSError")
+QDEF0(MP_QSTR_OverflowError, 129, 13, "OverflowError")
+QDEF0(MP_QSTR_RuntimeError, 97, 12, "RuntimeError")
+QDEF0(MP_QSTR_StopIteration, 234, 13, "StopIteration")
+QDEF0(MP_QSTR_SyntaxError, 148, 11, "SyntaxError")
+QDEF0(MP_QSTR_SystemExit, 32, 10, "SystemExit")
+QDEF0(MP_QSTR_TypeError, 37, 9, "TypeError")
+QDEF0(MP_QSTR_ValueError, 150, 10, "ValueError")
+QDEF0(MP_QSTR_ZeroDivisionError, 182, 17, "ZeroDivisionError")
+QDEF0(MP_QSTR_abs, 149, 3, "abs")
+QDEF0(MP_QSTR_all, 68, 3, "all")
+QDEF0(MP_QSTR_any, 19, 3, "any")
+QDEF0(MP_QSTR_append, 107, 6, "append")
+QDEF0(MP_QSTR_args, 194, 4, "args")
+QDEF0(MP_QSTR_bool, 235, 4, "bool")
+QDEF0(MP_QSTR_builtins, 247, 8, "builtins")
+QDEF0(MP_QSTR_bytearray, 118, 9, "bytearray")
+QDEF0(MP_QSTR_bytecode, 34, 8, "bytecode")
+QDEF0(MP_QSTR_bytes, 92, 5, "bytes")
+QDEF0(MP_QSTR_callable, 13, 8, "callable")
+QDEF0(MP_QSTR_chr, 220, 3, "chr")
+QDEF0(MP_QSTR_classmethod, 180, 11, "classmethod")
+QDEF0(MP_QSTR_clear, 124, 5, "clear")
+QDEF0(MP_QSTR_close, 51, 5, "close")
+QDEF0(MP_QSTR_const, 192, 5, "const")
+QDEF0(MP_QSTR_copy, 224, 4, "copy")
+QDEF0(MP_QSTR_count, 166, 5, "count")
+QDEF0(MP_QSTR_dict, 63, 4, "dict")
+QDEF0(MP_QSTR_dir, 250, 3, "dir")
+QDEF0(MP_QSTR_divmod, 184, 6, "divmod")
+QDEF0(MP_QSTR_end, 10, 3, "end")
+QDEF0(MP_QSTR_endswith, 27, 8, "endswith")
+QDEF0(MP_QSTR_eval, 155, 4, "eval")
+QDEF0(MP_QSTR_exec, 30, 4, "exec")
+QDEF0(MP_QSTR_extend, 99, 6, "extend")
+QDEF0(MP_QSTR_find, 1, 4, "find")
+QDEF0(MP_QSTR_format, 38, 6, "format")
+QDEF0(MP_QSTR_from_bytes, 53, 10, "from_bytes")
+QDEF0(MP_QSTR_get, 51, 3, "get")
+QDEF0(MP_QSTR_getattr, 192, 7, "getattr")
+QDEF0(MP_QSTR_globals, 157, 7, "globals")
+QDEF0(MP_QSTR_hasattr, 140, 7, "hasattr")
+QDEF0(MP_QSTR_hash, 183, 4, "hash")
+QDEF0(MP_QSTR_id, 40, 2, "id")
+QDEF0(MP_QSTR_index, 123, 5, "index")
+QDEF0(MP_QSTR_insert, 18, 6, "insert")
+QDEF0(MP_QSTR_int, 22, 3, "int")
+QDEF0(MP_QSTR_isalpha, 235, 7, "isalpha")
+QDEF0(MP_QSTR_isdigit, 168, 7, "isdigit")
+QDEF0(MP_QSTR_isinstance, 182, 10, "isinstance")
+QDEF0(MP_QSTR_islower, 252, 7, "islower")
+QDEF0(MP_QSTR_isspace, 91, 7, "isspace")
+QDEF0(MP_QSTR_issubclass, 181, 10, "issubclass")
+QDEF0(MP_QSTR_isupper, 221, 7, "isupper")
+QDEF0(MP_QSTR_items, 227, 5, "items")
+QDEF0(MP_QSTR_iter, 143, 4, "iter")
+QDEF0(MP_QSTR_join, 167, 4, "join")
+QDEF0(MP_QSTR_key, 50, 3, "key")
+QDEF0(MP_QSTR_keys, 1, 4, "keys")
+QDEF0(MP_QSTR_len, 98, 3, "len")
+QDEF0(MP_QSTR_list, 39, 4, "list")
+QDEF0(MP_QSTR_little, 137, 6, "little")
+QDEF0(MP_QSTR_locals, 59, 6, "locals")
+QDEF0(MP_QSTR_lower, 198, 5, "lower")
+QDEF0(MP_QSTR_lstrip, 229, 6, "lstrip")
+QDEF0(MP_QSTR_main, 206, 4, "main")
+QDEF0(MP_QSTR_map, 185, 3, "map")
+QDEF0(MP_QSTR_micropython, 11, 11, "micropython")
+QDEF0(MP_QSTR_next, 66, 4, "next")
+QDEF0(MP_QSTR_object, 144, 6, "object")
+QDEF0(MP_QSTR_open, 209, 4, "open")
+QDEF0(MP_QSTR_ord, 28, 3, "ord")
+QDEF0(MP_QSTR_pop, 42, 3, "pop")
+QDEF0(MP_QSTR_popitem, 191, 7, "popitem")
+QDEF0(MP_QSTR_pow, 45, 3, "pow")
+QDEF0(MP_QSTR_print, 84, 5, "print")
+QDEF0(MP_QSTR_range, 26, 5, "range")
+QDEF0(MP_QSTR_read, 183, 4, "read")
+QDEF0(MP_QSTR_readinto, 75, 8, "readinto")
+QDEF0(MP_QSTR_readline, 249, 8, "readline")
+QDEF0(MP_QSTR_remove, 99, 6, "remove")
+QDEF0(MP_QSTR_replace, 73, 7, "replace")
+QDEF0(MP_QSTR_repr, 208, 4, "repr")
+QDEF0(MP_QSTR_reverse, 37, 7, "reverse")
+QDEF0(MP_QSTR_rfind, 210, 5, "rfind")
+QDEF0(MP_QSTR_rindex, 233, 6, "rindex")
+QDEF0(MP_QSTR_round, 231, 5, "round")
+QDEF0(MP_QSTR_rsplit, 165, 6, "rsplit")
+QDEF0(MP_QSTR_rstrip, 59, 6, "rstrip")
+QDEF0(MP_QSTR_self, 121, 4, "self")
+QDEF0(MP_QSTR_send, 185, 4, "send")
+QDEF0(MP_QSTR_sep, 35, 3, "sep")
+QDEF0(MP_QSTR_set, 39, 3, "set")
+QDEF0(MP_QSTR_setattr, 212, 7, "setattr")
+QDEF0(MP_QSTR_setdefault, 108, 10, "setdefault")
+QDEF0(MP_QSTR_sort, 191, 4, "sort")
+QDEF0(MP_QSTR_sorted, 94, 6, "sorted")
+QDEF0(MP_QSTR_split, 183, 5, "split")
+QDEF0(MP_QSTR_start, 133, 5, "start")
+QDEF0(MP_QSTR_startswith, 116, 10, "startswith")
+QDEF0(MP_QSTR_staticmethod, 98, 12, "staticmethod")
+QDEF0(MP_QSTR_step, 87, 4, "step")
+QDEF0(MP_QSTR_stop, 157, 4, "stop")
+QDEF0(MP_QSTR_str, 80, 3, "str")
+QDEF0(MP_QSTR_strip, 41, 5, "strip")
+QDEF0(MP_QSTR_sum, 46, 3, "sum")
+QDEF0(MP_QSTR_super, 196, 5, "super")
+QDEF0(MP_QSTR_throw, 179, 5, "throw")
+QDEF0(MP_QSTR_to_bytes, 216, 8, "to_bytes")
+QDEF0(MP_QSTR_tuple, 253, 5, "tuple")
+QDEF0(MP_QSTR_type, 157, 4, "type")
+QDEF0(MP_QSTR_update, 180, 6, "update")
+QDEF0(MP_QSTR_upper, 39, 5, "upper")
+QDEF0(MP_QSTR_utf_hyphen_8, 183, 5, "utf-8")
+QDEF0(MP_QSTR_value, 78, 5, "value")
+QDEF0(MP_QSTR_values, 125, 6, "values")
+QDEF0(MP_QSTR_write, 152, 5, "write")
+QDEF0(MP_QSTR_zip, 230, 3, "zip")
+QDEF1(MP_QSTR__percent__hash_o, 108, 3, "%#o")
+QDEF1(MP_QSTR__percent__hash_x, 123, 3, "%#x")
+QDEF0(MP_QSTR__lt_dictcomp_gt_, 204, 10, "<dictcomp>")
+QDEF0(MP_QSTR__lt_genexpr_gt_, 52, 9, "<genexpr>")
+QDEF0(MP_QSTR__lt_lambda_gt_, 128, 8, "<lambda>")
+QDEF0(MP_QSTR__lt_listcomp_gt_, 212, 10, "<listcomp>")
+QDEF0(MP_QSTR__lt_setcomp_gt_, 84, 9, "<setcomp>")
+QDEF1(MP_QSTR__lt_stdin_gt_, 227, 7, "<stdin>")
+QDEF1(MP_QSTR__lt_string_gt_, 82, 8, "<string>")
+QDEF1(MP_QSTR_None, 111, 4, "None")
+QDEF1(MP_QSTR_StopAsyncIteration, 236, 18, "StopAsyncIteration")
+QDEF1(MP_QSTR_UnicodeError, 34, 12, "UnicodeError")
+QDEF1(MP_QSTR_ViperTypeError, 221, 14, "ViperTypeError")
+QDEF0(MP_QSTR___add__, 196, 7, "__add__")
+QDEF1(MP_QSTR___aenter__, 76, 10, "__aenter__")
+QDEF1(MP_QSTR___aexit__, 196, 9, "__aexit__")
+QDEF1(MP_QSTR___aiter__, 78, 9, "__aiter__")
+QDEF1(MP_QSTR___anext__, 131, 9, "__anext__")
+QDEF1(MP_QSTR___bases__, 3, 9, "__bases__")
+QDEF0(MP_QSTR___bool__, 43, 8, "__bool__")
+QDEF1(MP_QSTR___build_class__, 66, 15, "__build_class__")
+QDEF0(MP_QSTR___complex__, 197, 11, "__complex__")
+QDEF0(MP_QSTR___contains__, 198, 12, "__contains__")
+QDEF1(MP_QSTR___dict__, 127, 8, "__dict__")
+QDEF0(MP_QSTR___eq__, 113, 6, "__eq__")
+QDEF0(MP_QSTR___float__, 53, 9, "__float__")
+QDEF0(MP_QSTR___ge__, 167, 6, "__ge__")
+QDEF0(MP_QSTR___gt__, 182, 6, "__gt__")
+QDEF0(MP_QSTR___iadd__, 109, 8, "__iadd__")
+QDEF1(MP_QSTR___import__, 56, 10, "__import__")
+QDEF0(MP_QSTR___isub__, 8, 8, "__isub__")
+QDEF0(MP_QSTR___le__, 204, 6, "__le__")
+QDEF0(MP_QSTR___lt__, 93, 6, "__lt__")
+QDEF0(MP_QSTR___ne__, 14, 6, "__ne__")
+QDEF1(MP_QSTR___path__, 200, 8, "__path__")
+QDEF1(MP_QSTR___repl_print__, 1, 14, "__repl_print__")
+QDEF1(MP_QSTR___reversed__, 97, 12, "__reversed__")
+QDEF0(MP_QSTR___sub__, 33, 7, "__sub__")
+QDEF1(MP_QSTR___traceback__, 79, 13, "__traceback__")
+QDEF1(MP_QSTR_a0, 116, 2, "a0")
+QDEF1(MP_QSTR_a1, 117, 2, "a1")
+QDEF1(MP_QSTR_a10, 37, 3, "a10")
+QDEF1(MP_QSTR_a11, 36, 3, "a11")
+QDEF1(MP_QSTR_a12, 39, 3, "a12")
+QDEF1(MP_QSTR_a13, 38, 3, "a13")
+QDEF1(MP_QSTR_a14, 33, 3, "a14")
+QDEF1(MP_QSTR_a15, 32, 3, "a15")
+QDEF1(MP_QSTR_a2, 118, 2, "a2")
+QDEF1(MP_QSTR_a3, 119, 2, "a3")
+QDEF1(MP_QSTR_a4, 112, 2, "a4")
+QDEF1(MP_QSTR_a5, 113, 2, "a5")
+QDEF1(MP_QSTR_a6, 114, 2, "a6")
+QDEF1(MP_QSTR_a7, 115, 2, "a7")
+QDEF1(MP_QSTR_a8, 124, 2, "a8")
+QDEF1(MP_QSTR_a9, 125, 2, "a9")
+QDEF1(MP_QSTR_abs_, 106, 4, "abs_")
+QDEF1(MP_QSTR_acos, 27, 4, "acos")
+QDEF1(MP_QSTR_add, 68, 3, "add")
+QDEF1(MP_QSTR_add_n, 149, 5, "add_n")
+QDEF1(MP_QSTR_addi, 173, 4, "addi")
+QDEF1(MP_QSTR_addi_n, 60, 6, "addi_n")
+QDEF1(MP_QSTR_addmi, 160, 5, "addmi")
+QDEF1(MP_QSTR_addx2, 14, 5, "addx2")
+QDEF1(MP_QSTR_addx4, 8, 5, "addx4")
+QDEF1(MP_QSTR_addx8, 4, 5, "addx8")
+QDEF1(MP_QSTR_align, 168, 5, "align")
+QDEF1(MP_QSTR_and_, 145, 4, "and_")
+QDEF1(MP_QSTR_andi, 167, 4, "andi")
+QDEF1(MP_QSTR_asin, 80, 4, "asin")
+QDEF1(MP_QSTR_asm_rv32, 1, 8, "asm_rv32")
+QDEF1(MP_QSTR_asm_thumb, 67, 9, "asm_thumb")
+QDEF1(MP_QSTR_asm_xtensa, 176, 10, "asm_xtensa")
+QDEF1(MP_QSTR_asr, 101, 3, "asr")
+QDEF1(MP_QSTR_atan, 31, 4, "atan")
+QDEF1(MP_QSTR_atan2, 205, 5, "atan2")
+QDEF1(MP_QSTR_auipc, 43, 5, "auipc")
+QDEF1(MP_QSTR_b, 199, 1, "b")
+QDEF1(MP_QSTR_ball, 70, 4, "ball")
+QDEF1(MP_QSTR_bany, 145, 4, "bany")
+QDEF1(MP_QSTR_bbc, 6, 3, "bbc")
+QDEF1(MP_QSTR_bbci, 175, 4, "bbci")
+QDEF1(MP_QSTR_bbs, 22, 3, "bbs")
+QDEF1(MP_QSTR_bbsi, 191, 4, "bbsi")
+QDEF1(MP_QSTR_bcc, 39, 3, "bcc")
+QDEF1(MP_QSTR_bccz, 125, 4, "bccz")
+QDEF1(MP_QSTR_beq, 115, 3, "beq")
+QDEF1(MP_QSTR_beqz, 169, 4, "beqz")
+QDEF1(MP_QSTR_beqz_n, 56, 6, "beqz_n")
+QDEF1(MP_QSTR_bge, 165, 3, "bge")
+QDEF1(MP_QSTR_bgeu, 48, 4, "bgeu")
+QDEF1(MP_QSTR_bgez, 63, 4, "bgez")
+QDEF1(MP_QSTR_bin, 224, 3, "bin")
+QDEF1(MP_QSTR_bit_branch, 113, 10, "bit_branch")
+QDEF1(MP_QSTR_bl, 203, 2, "bl")
+QDEF1(MP_QSTR_blt, 95, 3, "blt")
+QDEF1(MP_QSTR_bltu, 74, 4, "bltu")
+QDEF1(MP_QSTR_bltz, 69, 4, "bltz")
+QDEF1(MP_QSTR_bnall, 8, 5, "bnall")
+QDEF1(MP_QSTR_bne, 140, 3, "bne")
+QDEF1(MP_QSTR_bnez, 118, 4, "bnez")
+QDEF1(MP_QSTR_bnez_n, 231, 6, "bnez_n")
+QDEF1(MP_QSTR_bnone, 77, 5, "bnone")
+QDEF1(MP_QSTR_bound_method, 151, 12, "bound_method")
+QDEF1(MP_QSTR_bx, 223, 2, "bx")
+QDEF1(MP_QSTR_c_add, 24, 5, "c_add")
+QDEF1(MP_QSTR_c_addi, 113, 6, "c_addi")
+QDEF1(MP_QSTR_c_addi4spn, 40, 10, "c_addi4spn")
+QDEF1(MP_QSTR_c_and, 210, 5, "c_and")
+QDEF1(MP_QSTR_c_andi, 123, 6, "c_andi")
+QDEF1(MP_QSTR_c_beqz, 117, 6, "c_beqz")
+QDEF1(MP_QSTR_c_bnez, 42, 6, "c_bnez")
+QDEF1(MP_QSTR_c_ebreak, 195, 8, "c_ebreak")
+QDEF1(MP_QSTR_c_j, 147, 3, "c_j")
+QDEF1(MP_QSTR_c_jal, 190, 5, "c_jal")
+QDEF1(MP_QSTR_c_jalr, 12, 6, "c_jalr")
+QDEF1(MP_QSTR_c_jr, 129, 4, "c_jr")
+QDEF1(MP_QSTR_c_li, 92, 4, "c_li")
+QDEF1(MP_QSTR_c_lui, 41, 5, "c_lui")
+QDEF1(MP_QSTR_c_lw, 66, 4, "c_lw")
+QDEF1(MP_QSTR_c_lwsp, 97, 6, "c_lwsp")
+QDEF1(MP_QSTR_c_mv, 98, 4, "c_mv")
+QDEF1(MP_QSTR_c_nop, 104, 5, "c_nop")
+QDEF1(MP_QSTR_c_or, 36, 4, "c_or")
+QDEF1(MP_QSTR_c_slli, 35, 6, "c_slli")
+QDEF1(MP_QSTR_c_srai, 144, 6, "c_srai")
+QDEF1(MP_QSTR_c_srli, 61, 6, "c_srli")
+QDEF1(MP_QSTR_c_sub, 253, 5, "c_sub")
+QDEF1(MP_QSTR_c_sw, 189, 4, "c_sw")
+QDEF1(MP_QSTR_c_swsp, 158, 6, "c_swsp")
+QDEF1(MP_QSTR_c_xor, 252, 5, "c_xor")
+QDEF1(MP_QSTR_calcsize, 77, 8, "calcsize")
+QDEF1(MP_QSTR_call0, 119, 5, "call0")
+QDEF1(MP_QSTR_callx0, 47, 6, "callx0")
+QDEF1(MP_QSTR_ceil, 6, 4, "ceil")
+QDEF1(MP_QSTR_closure, 116, 7, "closure")
+QDEF1(MP_QSTR_clz, 80, 3, "clz")
+QDEF1(MP_QSTR_cmp, 59, 3, "cmp")
+QDEF1(MP_QSTR_complex, 197, 7, "complex")
+QDEF1(MP_QSTR_copysign, 51, 8, "copysign")
+QDEF1(MP_QSTR_cos, 122, 3, "cos")
+QDEF1(MP_QSTR_cpsid, 232, 5, "cpsid")
+QDEF1(MP_QSTR_cpsie, 233, 5, "cpsie")
+QDEF1(MP_QSTR_csrrc, 54, 5, "csrrc")
+QDEF1(MP_QSTR_csrrci, 159, 6, "csrrci")
+QDEF1(MP_QSTR_csrrs, 38, 5, "csrrs")
+QDEF1(MP_QSTR_csrrsi, 143, 6, "csrrsi")
+QDEF1(MP_QSTR_csrrw, 34, 5, "csrrw")
+QDEF1(MP_QSTR_csrrwi, 11, 6, "csrrwi")
+QDEF1(MP_QSTR_data, 21, 4, "data")
+QDEF1(MP_QSTR_decode, 169, 6, "decode")
+QDEF1(MP_QSTR_default, 206, 7, "default")
+QDEF1(MP_QSTR_degrees, 2, 7, "degrees")
+QDEF1(MP_QSTR_delattr, 219, 7, "delattr")
+QDEF1(MP_QSTR_deleter, 110, 7, "deleter")
+QDEF1(MP_QSTR_dict_view, 45, 9, "dict_view")
+QDEF1(MP_QSTR_difference, 114, 10, "difference")
+QDEF1(MP_QSTR_difference_update, 156, 17, "difference_update")
+QDEF1(MP_QSTR_discard, 15, 7, "discard")
+QDEF1(MP_QSTR_div, 254, 3, "div")
+QDEF1(MP_QSTR_divu, 203, 4, "divu")
+QDEF1(MP_QSTR_doc, 45, 3, "doc")
+QDEF1(MP_QSTR_e, 192, 1, "e")
+QDEF1(MP_QSTR_ebreak, 31, 6, "ebreak")
+QDEF1(MP_QSTR_ecall, 226, 5, "ecall")
+QDEF1(MP_QSTR_encode, 67, 6, "encode")
+QDEF1(MP_QSTR_enumerate, 113, 9, "enumerate")
+QDEF1(MP_QSTR_errno, 193, 5, "errno")
+QDEF1(MP_QSTR_exp, 200, 3, "exp")
+QDEF1(MP_QSTR_fabs, 147, 4, "fabs")
+QDEF1(MP_QSTR_filter, 37, 6, "filter")
+QDEF1(MP_QSTR_float, 53, 5, "float")
+QDEF1(MP_QSTR_floor, 125, 5, "floor")
+QDEF1(MP_QSTR_fmod, 229, 4, "fmod")
+QDEF1(MP_QSTR_frexp, 28, 5, "frexp")
+QDEF1(MP_QSTR_fromkeys, 55, 8, "fromkeys")
+QDEF1(MP_QSTR_function, 39, 8, "function")
+QDEF1(MP_QSTR_generator, 150, 9, "generator")
+QDEF1(MP_QSTR_getter, 144, 6, "getter")
+QDEF1(MP_QSTR_gp, 114, 2, "gp")
+QDEF1(MP_QSTR_heap_lock, 173, 9, "heap_lock")
+QDEF1(MP_QSTR_heap_unlock, 86, 11, "heap_unlock")
+QDEF1(MP_QSTR_hex, 112, 3, "hex")
+QDEF1(MP_QSTR_imag, 71, 4, "imag")
+QDEF1(MP_QSTR_inf, 4, 3, "inf")
+QDEF1(MP_QSTR_integer, 195, 7, "integer")
+QDEF1(MP_QSTR_intersection, 40, 12, "intersection")
+QDEF1(MP_QSTR_intersection_update, 6, 19, "intersection_update")
+QDEF1(MP_QSTR_isdisjoint, 247, 10, "isdisjoint")
+QDEF1(MP_QSTR_isfinite, 166, 8, "isfinite")
+QDEF1(MP_QSTR_isinf, 62, 5, "isinf")
+QDEF1(MP_QSTR_isnan, 158, 5, "isnan")
+QDEF1(MP_QSTR_issubset, 185, 8, "issubset")
+QDEF1(MP_QSTR_issuperset, 252, 10, "issuperset")
+QDEF1(MP_QSTR_iterable, 37, 8, "iterable")
+QDEF1(MP_QSTR_iterator, 71, 8, "iterator")
+QDEF1(MP_QSTR_j, 207, 1, "j")
+QDEF1(MP_QSTR_jal, 226, 3, "jal")
+QDEF1(MP_QSTR_jalr, 80, 4, "jalr")
+QDEF1(MP_QSTR_jx, 215, 2, "jx")
+QDEF1(MP_QSTR_l16si, 20, 5, "l16si")
+QDEF1(MP_QSTR_l16ui, 82, 5, "l16ui")
+QDEF1(MP_QSTR_l32i, 65, 4, "l32i")
+QDEF1(MP_QSTR_l32i_n, 144, 6, "l32i_n")
+QDEF1(MP_QSTR_l32r, 90, 4, "l32r")
+QDEF1(MP_QSTR_l8ui, 109, 4, "l8ui")
+QDEF1(MP_QSTR_la, 136, 2, "la")
+QDEF1(MP_QSTR_label, 67, 5, "label")
+QDEF1(MP_QSTR_lb, 139, 2, "lb")
+QDEF1(MP_QSTR_lbu, 158, 3, "lbu")
+QDEF1(MP_QSTR_ldexp, 64, 5, "ldexp")
+QDEF1(MP_QSTR_ldr, 95, 3, "ldr")
+QDEF1(MP_QSTR_ldrb, 93, 4, "ldrb")
+QDEF1(MP_QSTR_ldrex, 226, 5, "ldrex")
+QDEF1(MP_QSTR_ldrh, 87, 4, "ldrh")
+QDEF1(MP_QSTR_lh, 129, 2, "lh")
+QDEF1(MP_QSTR_lhu, 212, 3, "lhu")
+QDEF1(MP_QSTR_li, 128, 2, "li")
+QDEF1(MP_QSTR_location, 152, 8, "location")
+QDEF1(MP_QSTR_log, 33, 3, "log")
+QDEF1(MP_QSTR_lsl, 182, 3, "lsl")
+QDEF1(MP_QSTR_lsr, 168, 3, "lsr")
+QDEF1(MP_QSTR_lui, 117, 3, "lui")
+QDEF1(MP_QSTR_lw, 158, 2, "lw")
+QDEF1(MP_QSTR_math, 53, 4, "math")
+QDEF1(MP_QSTR_max, 177, 3, "max")
+QDEF1(MP_QSTR_maximum_space_recursion_space_depth_space_exceeded, 115, 32, "maximum recursion depth exceeded")
+QDEF1(MP_QSTR_min, 175, 3, "min")
+QDEF1(MP_QSTR_modf, 37, 4, "modf")
+QDEF1(MP_QSTR_module, 191, 6, "module")
+QDEF1(MP_QSTR_mov, 241, 3, "mov")
+QDEF1(MP_QSTR_mov_n, 96, 5, "mov_n")
+QDEF1(MP_QSTR_movi, 120, 4, "movi")
+QDEF1(MP_QSTR_movi_n, 105, 6, "movi_n")
+QDEF1(MP_QSTR_movt, 101, 4, "movt")
+QDEF1(MP_QSTR_movw, 102, 4, "movw")
+QDEF1(MP_QSTR_movwt, 82, 5, "movwt")
+QDEF1(MP_QSTR_mrs, 137, 3, "mrs")
+QDEF1(MP_QSTR_mul, 49, 3, "mul")
+QDEF1(MP_QSTR_mulh, 57, 4, "mulh")
+QDEF1(MP_QSTR_mulhsu, 31, 6, "mulhsu")
+QDEF1(MP_QSTR_mulhu, 44, 5, "mulhu")
+QDEF1(MP_QSTR_mull, 61, 4, "mull")
+QDEF1(MP_QSTR_mv, 190, 2, "mv")
+QDEF1(MP_QSTR_nan, 228, 3, "nan")
+QDEF1(MP_QSTR_native, 132, 6, "native")
+QDEF1(MP_QSTR_neg, 105, 3, "neg")
+QDEF1(MP_QSTR_nop, 180, 3, "nop")
+QDEF1(MP_QSTR_nop_n, 165, 5, "nop_n")
+QDEF1(MP_QSTR_nsa, 57, 3, "nsa")
+QDEF1(MP_QSTR_nsau, 44, 4, "nsau")
+QDEF1(MP_QSTR_oct, 253, 3, "oct")
+QDEF1(MP_QSTR_offset, 72, 6, "offset")
+QDEF1(MP_QSTR_opt_level, 135, 9, "opt_level")
+QDEF1(MP_QSTR_or_, 39, 3, "or_")
+QDEF1(MP_QSTR_ori, 17, 3, "ori")
+QDEF1(MP_QSTR_pack, 188, 4, "pack")
+QDEF1(MP_QSTR_pack_into, 31, 9, "pack_into")
+QDEF1(MP_QSTR_pend_throw, 243, 10, "pend_throw")
+QDEF1(MP_QSTR_pi, 28, 2, "pi")
+QDEF1(MP_QSTR_property, 194, 8, "property")
+QDEF1(MP_QSTR_ptr, 83, 3, "ptr")
+QDEF1(MP_QSTR_ptr16, 244, 5, "ptr16")
+QDEF1(MP_QSTR_ptr32, 178, 5, "ptr32")
+QDEF1(MP_QSTR_ptr8, 139, 4, "ptr8")
+QDEF1(MP_QSTR_push, 187, 4, "push")
+QDEF1(MP_QSTR_ra, 214, 2, "ra")
+QDEF1(MP_QSTR_radians, 135, 7, "radians")
+QDEF1(MP_QSTR_rbit, 232, 4, "rbit")
+QDEF1(MP_QSTR_real, 191, 4, "real")
+QDEF1(MP_QSTR_register, 172, 8, "register")
+QDEF1(MP_QSTR_rem, 127, 3, "rem")
+QDEF1(MP_QSTR_remu, 42, 4, "remu")
+QDEF1(MP_QSTR_ret, 102, 3, "ret")
+QDEF1(MP_QSTR_ret_n, 247, 5, "ret_n")
+QDEF1(MP_QSTR_reversed, 161, 8, "reversed")
+QDEF1(MP_QSTR_s0, 166, 2, "s0")
+QDEF1(MP_QSTR_s1, 167, 2, "s1")
+QDEF1(MP_QSTR_s10, 183, 3, "s10")
+QDEF1(MP_QSTR_s11, 182, 3, "s11")
+QDEF1(MP_QSTR_s16i, 184, 4, "s16i")
+QDEF1(MP_QSTR_s2, 164, 2, "s2")
+QDEF1(MP_QSTR_s3, 165, 2, "s3")
+QDEF1(MP_QSTR_s32i, 62, 4, "s32i")
+QDEF1(MP_QSTR_s32i_n, 175, 6, "s32i_n")
+QDEF1(MP_QSTR_s4, 162, 2, "s4")
+QDEF1(MP_QSTR_s5, 163, 2, "s5")
+QDEF1(MP_QSTR_s6, 160, 2, "s6")
+QDEF1(MP_QSTR_s7, 161, 2, "s7")
+QDEF1(MP_QSTR_s8, 174, 2, "s8")
+QDEF1(MP_QSTR_s8i, 7, 3, "s8i")
+QDEF1(MP_QSTR_s9, 175, 2, "s9")
+QDEF1(MP_QSTR_sb, 244, 2, "sb")
+QDEF1(MP_QSTR_sdiv, 205, 4, "sdiv")
+QDEF1(MP_QSTR_setter, 4, 6, "setter")
+QDEF1(MP_QSTR_sh, 254, 2, "sh")
+QDEF1(MP_QSTR_sh1add, 142, 6, "sh1add")
+QDEF1(MP_QSTR_sh2add, 237, 6, "sh2add")
+QDEF1(MP_QSTR_sh3add, 204, 6, "sh3add")
+QDEF1(MP_QSTR_sin, 177, 3, "sin")
+QDEF1(MP_QSTR_slice, 181, 5, "slice")
+QDEF1(MP_QSTR_sll, 86, 3, "sll")
+QDEF1(MP_QSTR_slli, 127, 4, "slli")
+QDEF1(MP_QSTR_slt, 78, 3, "slt")
+QDEF1(MP_QSTR_slti, 103, 4, "slti")
+QDEF1(MP_QSTR_sltiu, 50, 5, "sltiu")
+QDEF1(MP_QSTR_sltu, 123, 4, "sltu")
+QDEF1(MP_QSTR_sp, 230, 2, "sp")
+QDEF1(MP_QSTR_sqrt, 33, 4, "sqrt")
+QDEF1(MP_QSTR_sra, 5, 3, "sra")
+QDEF1(MP_QSTR_srai, 204, 4, "srai")
+QDEF1(MP_QSTR_src, 7, 3, "src")
+QDEF1(MP_QSTR_srl, 8, 3, "srl")
+QDEF1(MP_QSTR_srli, 97, 4, "srli")
+QDEF1(MP_QSTR_ssa8b, 190, 5, "ssa8b")
+QDEF1(MP_QSTR_ssa8l, 176, 5, "ssa8l")
+QDEF1(MP_QSTR_ssai, 13, 4, "ssai")
+QDEF1(MP_QSTR_ssl, 233, 3, "ssl")
+QDEF1(MP_QSTR_ssr, 247, 3, "ssr")
+QDEF1(MP_QSTR_strb, 50, 4, "strb")
+QDEF1(MP_QSTR_strex, 173, 5, "strex")
+QDEF1(MP_QSTR_strh, 56, 4, "strh")
+QDEF1(MP_QSTR_struct, 18, 6, "struct")
+QDEF1(MP_QSTR_sub, 33, 3, "sub")
+QDEF1(MP_QSTR_subx2, 107, 5, "subx2")
+QDEF1(MP_QSTR_subx4, 109, 5, "subx4")
+QDEF1(MP_QSTR_subx8, 97, 5, "subx8")
+QDEF1(MP_QSTR_sw, 225, 2, "sw")
+QDEF1(MP_QSTR_symmetric_difference, 206, 20, "symmetric_difference")
+QDEF1(MP_QSTR_symmetric_difference_update, 96, 27, "symmetric_difference_update")
+QDEF1(MP_QSTR_t0, 193, 2, "t0")
+QDEF1(MP_QSTR_t1, 192, 2, "t1")
+QDEF1(MP_QSTR_t2, 195, 2, "t2")
+QDEF1(MP_QSTR_t3, 194, 2, "t3")
+QDEF1(MP_QSTR_t4, 197, 2, "t4")
+QDEF1(MP_QSTR_t5, 196, 2, "t5")
+QDEF1(MP_QSTR_t6, 199, 2, "t6")
+QDEF1(MP_QSTR_tan, 254, 3, "tan")
+QDEF1(MP_QSTR_target, 244, 6, "target")
+QDEF1(MP_QSTR_tau, 229, 3, "tau")
+QDEF1(MP_QSTR_tp, 129, 2, "tp")
+QDEF1(MP_QSTR_trunc, 91, 5, "trunc")
+QDEF1(MP_QSTR_udiv, 139, 4, "udiv")
+QDEF1(MP_QSTR_uint, 227, 4, "uint")
+QDEF1(MP_QSTR_union, 246, 5, "union")
+QDEF1(MP_QSTR_unpack, 7, 6, "unpack")
+QDEF1(MP_QSTR_unpack_from, 14, 11, "unpack_from")
+QDEF1(MP_QSTR_vcmp, 173, 4, "vcmp")
+QDEF1(MP_QSTR_vcvt_f32_s32, 71, 12, "vcvt_f32_s32")
+QDEF1(MP_QSTR_vcvt_s32_f32, 7, 12, "vcvt_s32_f32")
+QDEF1(MP_QSTR_viper, 93, 5, "viper")
+QDEF1(MP_QSTR_vldr, 201, 4, "vldr")
+QDEF1(MP_QSTR_vmov, 231, 4, "vmov")
+QDEF1(MP_QSTR_vmrs, 159, 4, "vmrs")
+QDEF1(MP_QSTR_vneg, 255, 4, "vneg")
+QDEF1(MP_QSTR_vsqrt, 247, 5, "vsqrt")
+QDEF1(MP_QSTR_vstr, 198, 4, "vstr")
+QDEF1(MP_QSTR_wfi, 157, 3, "wfi")
+QDEF1(MP_QSTR_x0, 77, 2, "x0")
+QDEF1(MP_QSTR_x1, 76, 2, "x1")
+QDEF1(MP_QSTR_x10, 252, 3, "x10")
+QDEF1(MP_QSTR_x11, 253, 3, "x11")
+QDEF1(MP_QSTR_x12, 254, 3, "x12")
+QDEF1(MP_QSTR_x13, 255, 3, "x13")
+QDEF1(MP_QSTR_x14, 248, 3, "x14")
+QDEF1(MP_QSTR_x15, 249, 3, "x15")
+QDEF1(MP_QSTR_x16, 250, 3, "x16")
+QDEF1(MP_QSTR_x17, 251, 3, "x17")
+QDEF1(MP_QSTR_x18, 244, 3, "x18")
+QDEF1(MP_QSTR_x19, 245, 3, "x19")
+QDEF1(MP_QSTR_x2, 79, 2, "x2")
+QDEF1(MP_QSTR_x20, 31, 3, "x20")
+QDEF1(MP_QSTR_x21, 30, 3, "x21")
+QDEF1(MP_QSTR_x22, 29, 3, "x22")
+QDEF1(MP_QSTR_x23, 28, 3, "x23")
+QDEF1(MP_QSTR_x24, 27, 3, "x24")
+QDEF1(MP_QSTR_x25, 26, 3, "x25")
+QDEF1(MP_QSTR_x26, 25, 3, "x26")
+QDEF1(MP_QSTR_x27, 24, 3, "x27")
+QDEF1(MP_QSTR_x28, 23, 3, "x28")
+QDEF1(MP_QSTR_x29, 22, 3, "x29")
+QDEF1(MP_QSTR_x3, 78, 2, "x3")
+QDEF1(MP_QSTR_x30, 62, 3, "x30")
+QDEF1(MP_QSTR_x31, 63, 3, "x31")
+QDEF1(MP_QSTR_x4, 73, 2, "x4")
+QDEF1(MP_QSTR_x5, 72, 2, "x5")
+QDEF1(MP_QSTR_x6, 75, 2, "x6")
+QDEF1(MP_QSTR_x7, 74, 2, "x7")
+QDEF1(MP_QSTR_x8, 69, 2, "x8")
+QDEF1(MP_QSTR_x9, 68, 2, "x9")
+QDEF1(MP_QSTR_xor, 32, 3, "xor")
+QDEF1(MP_QSTR_xori, 73, 4, "xori")
+QDEF1(MP_QSTR_zero, 7, 4, "zero")
+QDEF1(MP_QSTR__brace_open__colon__hash_b_brace_close_, 88, 5, "{:#b}")
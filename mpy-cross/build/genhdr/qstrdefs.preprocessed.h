@@ -0,0 +1,1922 @@
+# 0 "<stdin>"
+# 0 "<built-in>"
+# 0 "<command-line>"
+# 1 "/usr/include/stdc-predef.h" 1 3 4
+# 0 "<command-line>" 2
+# 1 "<stdin>"
+# 29 "<stdin>"
+# 1 "../py/mpconfig.h" 1
+# 29 "../py/mpconfig.h"
+# 1 "/usr/lib/gcc/x86_64-linux-gnu/12/include/stdint.h" 1 3 4
+# 9 "/usr/lib/gcc/x86_64-linux-gnu/12/include/stdint.h" 3 4
+# 1 "/usr/include/stdint.h" 1 3 4
+# 26 "/usr/include/stdint.h" 3 4
+# 1 "/usr/include/x86_64-linux-gnu/bits/libc-header-start.h" 1 3 4
+# 33 "/usr/include/x86_64-linux-gnu/bits/libc-header-start.h" 3 4
+# 1 "/usr/include/features.h" 1 3 4
+# 392 "/usr/include/features.h" 3 4
+# 1 "/usr/include/features-time64.h" 1 3 4
+# 20 "/usr/include/features-time64.h" 3 4
+# 1 "/usr/include/x86_64-linux-gnu/bits/wordsize.h" 1 3 4
+# 21 "/usr/include/features-time64.h" 2 3 4
+# 1 "/usr/include/x86_64-linux-gnu/bits/timesize.h" 1 3 4
+# 19 "/usr/include/x86_64-linux-gnu/bits/timesize.h" 3 4
+# 1 "/usr/include/x86_64-linux-gnu/bits/wordsize.h" 1 3 4
+# 20 "/usr/include/x86_64-linux-gnu/bits/timesize.h" 2 3 4
+# 22 "/usr/include/features-time64.h" 2 3 4
+# 393 "/usr/include/features.h" 2 3 4
+# 489 "/usr/include/features.h" 3 4
+# 1 "/usr/include/x86_64-linux-gnu/sys/cdefs.h" 1 3 4
+# 561 "/usr/include/x86_64-linux-gnu/sys/cdefs.h" 3 4
+# 1 "/usr/include/x86_64-linux-gnu/bits/wordsize.h" 1 3 4
+# 562 "/usr/include/x86_64-linux-gnu/sys/cdefs.h" 2 3 4
+# 1 "/usr/include/x86_64-linux-gnu/bits/long-double.h" 1 3 4
+# 563 "/usr/include/x86_64-linux-gnu/sys/cdefs.h" 2 3 4
+# 490 "/usr/include/features.h" 2 3 4
+# 513 "/usr/include/features.h" 3 4
+# 1 "/usr/include/x86_64-linux-gnu/gnu/stubs.h" 1 3 4
+# 10 "/usr/include/x86_64-linux-gnu/gnu/stubs.h" 3 4
+# 1 "/usr/include/x86_64-linux-gnu/gnu/stubs-64.h" 1 3 4
+# 11 "/usr/include/x86_64-linux-gnu/gnu/stubs.h" 2 3 4
+# 514 "/usr/include/features.h" 2 3 4
+# 34 "/usr/include/x86_64-linux-gnu/bits/libc-header-start.h" 2 3 4
+# 27 "/usr/include/stdint.h" 2 3 4
+# 1 "/usr/include/x86_64-linux-gnu/bits/types.h" 1 3 4
+# 27 "/usr/include/x86_64-linux-gnu/bits/types.h" 3 4
+# 1 "/usr/include/x86_64-linux-gnu/bits/wordsize.h" 1 3 4
+# 28 "/usr/include/x86_64-linux-gnu/bits/types.h" 2 3 4
+# 1 "/usr/include/x86_64-linux-gnu/bits/timesize.h" 1 3 4
+# 19 "/usr/include/x86_64-linux-gnu/bits/timesize.h" 3 4
+# 1 "/usr/include/x86_64-linux-gnu/bits/wordsize.h" 1 3 4
+# 20 "/usr/include/x86_64-linux-gnu/bits/timesize.h" 2 3 4
+# 29 "/usr/include/x86_64-linux-gnu/bits/types.h" 2 3 4
+
+
+
+# 31 "/usr/include/x86_64-linux-gnu/bits/types.h" 3 4
+typedef unsigned char __u_char;
+typedef unsigned short int __u_short;
+typedef unsigned int __u_int;
+typedef unsigned long int __u_long;
+
+
+typedef signed char __int8_t;
+typedef unsigned char __uint8_t;
+typedef signed short int __int16_t;
+typedef unsigned short int __uint16_t;
+typedef signed int __int32_t;
+typedef unsigned int __uint32_t;
+
+typedef signed long int __int64_t;
+typedef unsigned long int __uint64_t;
+
+
+
+
+
+
+typedef __int8_t __int_least8_t;
+typedef __uint8_t __uint_least8_t;
+typedef __int16_t __int_least16_t;
+typedef __uint16_t __uint_least16_t;
+typedef __int32_t __int_least32_t;
+typedef __uint32_t __uint_least32_t;
+typedef __int64_t __int_least64_t;
+typedef __uint64_t __uint_least64_t;
+
+
+
+typedef long int __quad_t;
+typedef unsigned long int __u_quad_t;
+
+
+
+
+
+
+
+typedef long int __intmax_t;
+typedef unsigned long int __uintmax_t;
+# 141 "/usr/include/x86_64-linux-gnu/bits/types.h" 3 4
+# 1 "/usr/include/x86_64-linux-gnu/bits/typesizes.h" 1 3 4
+# 142 "/usr/include/x86_64-linux-gnu/bits/types.h" 2 3 4
+# 1 "/usr/include/x86_64-linux-gnu/bits/time64.h" 1 3 4
+# 143 "/usr/include/x86_64-linux-gnu/bits/types.h" 2 3 4
+
+
+typedef unsigned long int __dev_t;
+typedef unsigned int __uid_t;
+typedef unsigned int __gid_t;
+typedef unsigned long int __ino_t;
+typedef unsigned long int __ino64_t;
+typedef unsigned int __mode_t;
+typedef unsigned long int __nlink_t;
+typedef long int __off_t;
+typedef long int __off64_t;
+typedef int __pid_t;
+typedef struct { int __val[2]; } __fsid_t;
+typedef long int __clock_t;
+typedef unsigned long int __rlim_t;
+typedef unsigned long int __rlim64_t;
+typedef unsigned int __id_t;
+typedef long int __time_t;
+typedef unsigned int __useconds_t;
+typedef long int __suseconds_t;
+typedef long int __suseconds64_t;
+
+typedef int __daddr_t;
+typedef int __key_t;
+
+
+typedef int __clockid_t;
+
+
+typedef void * __timer_t;
+
+
+typedef long int __blksize_t;
+
+
+
+
+typedef long int __blkcnt_t;
+typedef long int __blkcnt64_t;
+
+
+typedef unsigned long int __fsblkcnt_t;
+typedef unsigned long int __fsblkcnt64_t;
+
+
+typedef unsigned long int __fsfilcnt_t;
+typedef unsigned long int __fsfilcnt64_t;
+
+
+typedef long int __fsword_t;
+
+typedef long int __ssize_t;
+
+
+typedef long int __syscall_slong_t;
+
+typedef unsigned long int __syscall_ulong_t;
+
+
+
+typedef __off64_t __loff_t;
+typedef char *__caddr_t;
+
+
+typedef long int __intptr_t;
+
+
+typedef unsigned int __socklen_t;
+
+
+
+
+typedef int __sig_atomic_t;
+# 28 "/usr/include/stdint.h" 2 3 4
+# 1 "/usr/include/x86_64-linux-gnu/bits/wchar.h" 1 3 4
+# 29 "/usr/include/stdint.h" 2 3 4
+# 1 "/usr/include/x86_64-linux-gnu/bits/wordsize.h" 1 3 4
+# 30 "/usr/include/stdint.h" 2 3 4
+
+
+
+
+# 1 "/usr/include/x86_64-linux-gnu/bits/stdint-intn.h" 1 3 4
+# 24 "/usr/include/x86_64-linux-gnu/bits/stdint-intn.h" 3 4
+typedef __int8_t int8_t;
+typedef __int16_t int16_t;
+typedef __int32_t int32_t;
+typedef __int64_t int64_t;
+# 35 "/usr/include/stdint.h" 2 3 4
+
+
+# 1 "/usr/include/x86_64-linux-gnu/bits/stdint-uintn.h" 1 3 4
+# 24 "/usr/include/x86_64-linux-gnu/bits/stdint-uintn.h" 3 4
+typedef __uint8_t uint8_t;
+typedef __uint16_t uint16_t;
+typedef __uint32_t uint32_t;
+typedef __uint64_t uint64_t;
+# 38 "/usr/include/stdint.h" 2 3 4
+
+
+
+
+
+typedef __int_least8_t int_least8_t;
+typedef __int_least16_t int_least16_t;
+typedef __int_least32_t int_least32_t;
+typedef __int_least64_t int_least64_t;
+
+
+typedef __uint_least8_t uint_least8_t;
+typedef __uint_least16_t uint_least16_t;
+typedef __uint_least32_t uint_least32_t;
+typedef __uint_least64_t uint_least64_t;
+
+
+
+
+
+typedef signed char int_fast8_t;
+
+typedef long int int_fast16_t;
+typedef long int int_fast32_t;
+typedef long int int_fast64_t;
+# 71 "/usr/include/stdint.h" 3 4
+typedef unsigned char uint_fast8_t;
+
+typedef unsigned long int uint_fast16_t;
+typedef unsigned long int uint_fast32_t;
+typedef unsigned long int uint_fast64_t;
+# 87 "/usr/include/stdint.h" 3 4
+typedef long int intptr_t;
+
+
+typedef unsigned long int uintptr_t;
+# 101 "/usr/include/stdint.h" 3 4
+typedef __intmax_t intmax_t;
+typedef __uintmax_t uintmax_t;
+# 10 "/usr/lib/gcc/x86_64-linux-gnu/12/include/stdint.h" 2 3 4
+# 30 "../py/mpconfig.h" 2
+
+
+
+
+# 1 "/usr/lib/gcc/x86_64-linux-gnu/12/include/limits.h" 1 3 4
+# 34 "/usr/lib/gcc/x86_64-linux-gnu/12/include/limits.h" 3 4
+# 1 "/usr/lib/gcc/x86_64-linux-gnu/12/include/syslimits.h" 1 3 4
+
+
+
+
+
+
+# 1 "/usr/lib/gcc/x86_64-linux-gnu/12/include/limits.h" 1 3 4
+# 203 "/usr/lib/gcc/x86_64-linux-gnu/12/include/limits.h" 3 4
+# 1 "/usr/include/limits.h" 1 3 4
+# 26 "/usr/include/limits.h" 3 4
+# 1 "/usr/include/x86_64-linux-gnu/bits/libc-header-start.h" 1 3 4
+# 27 "/usr/include/limits.h" 2 3 4
+# 195 "/usr/include/limits.h" 3 4
+# 1 "/usr/include/x86_64-linux-gnu/bits/posix1_lim.h" 1 3 4
+# 27 "/usr/include/x86_64-linux-gnu/bits/posix1_lim.h" 3 4
+# 1 "/usr/include/x86_64-linux-gnu/bits/wordsize.h" 1 3 4
+# 28 "/usr/include/x86_64-linux-gnu/bits/posix1_lim.h" 2 3 4
+# 161 "/usr/include/x86_64-linux-gnu/bits/posix1_lim.h" 3 4
+# 1 "/usr/include/x86_64-linux-gnu/bits/local_lim.h" 1 3 4
+# 38 "/usr/include/x86_64-linux-gnu/bits/local_lim.h" 3 4
+# 1 "/usr/include/linux/limits.h" 1 3 4
+# 39 "/usr/include/x86_64-linux-gnu/bits/local_lim.h" 2 3 4
+# 81 "/usr/include/x86_64-linux-gnu/bits/local_lim.h" 3 4
+# 1 "/usr/include/x86_64-linux-gnu/bits/pthread_stack_min-dynamic.h" 1 3 4
+# 29 "/usr/include/x86_64-linux-gnu/bits/pthread_stack_min-dynamic.h" 3 4
+# 1 "/usr/include/x86_64-linux-gnu/bits/pthread_stack_min.h" 1 3 4
+# 30 "/usr/include/x86_64-linux-gnu/bits/pthread_stack_min-dynamic.h" 2 3 4
+# 82 "/usr/include/x86_64-linux-gnu/bits/local_lim.h" 2 3 4
+# 162 "/usr/include/x86_64-linux-gnu/bits/posix1_lim.h" 2 3 4
+# 196 "/usr/include/limits.h" 2 3 4
+
+
+
+# 1 "/usr/include/x86_64-linux-gnu/bits/posix2_lim.h" 1 3 4
+# 200 "/usr/include/limits.h" 2 3 4
+# 204 "/usr/lib/gcc/x86_64-linux-gnu/12/include/limits.h" 2 3 4
+# 8 "/usr/lib/gcc/x86_64-linux-gnu/12/include/syslimits.h" 2 3 4
+# 35 "/usr/lib/gcc/x86_64-linux-gnu/12/include/limits.h" 2 3 4
+# 35 "../py/mpconfig.h" 2
+# 100 "../py/mpconfig.h"
+# 1 "./mpconfigport.h" 1
+# 106 "./mpconfigport.h"
+
+# 106 "./mpconfigport.h"
+typedef long mp_off_t;
+# 117 "./mpconfigport.h"
+# 1 "/usr/include/alloca.h" 1 3 4
+# 24 "/usr/include/alloca.h" 3 4
+# 1 "/usr/lib/gcc/x86_64-linux-gnu/12/include/stddef.h" 1 3 4
+# 214 "/usr/lib/gcc/x86_64-linux-gnu/12/include/stddef.h" 3 4
+
+# 214 "/usr/lib/gcc/x86_64-linux-gnu/12/include/stddef.h" 3 4
+typedef long unsigned int size_t;
+# 25 "/usr/include/alloca.h" 2 3 4
+
+
+
+
+
+
+
+extern void *alloca (size_t __size) __attribute__ ((__nothrow__ , __leaf__));
+
+
+
+
+
+
+# 118 "./mpconfigport.h" 2
+# 157 "./mpconfigport.h"
+
+# 157 "./mpconfigport.h"
+extern const struct _mp_print_t mp_stdout_print;
+# 101 "../py/mpconfig.h" 2
+# 195 "../py/mpconfig.h"
+typedef intptr_t mp_int_t;
+typedef uintptr_t mp_uint_t;
+# 969 "../py/mpconfig.h"
+typedef double mp_float_t;
+# 1082 "../py/mpconfig.h"
+typedef long long mp_timestamp_t;
+# 30 "<stdin>" 2
+
+
+
+
+
+QCFG(BYTES_IN_LEN, (1))
+QCFG(BYTES_IN_HASH, (1))
+
+Q()
+Q(*)
+Q(_)
+Q(/)
+
+
+
+
+
+Q(%#o)
+Q(%#x)
+
+
+
+
+Q({:#b})
+Q( )
+Q(\n)
+Q(maximum recursion depth exceeded)
+Q(<module>)
+Q(<lambda>)
+Q(<listcomp>)
+Q(<dictcomp>)
+Q(<setcomp>)
+Q(<genexpr>)
+Q(<string>)
+Q(<stdin>)
+Q(utf-8)
+# 80 "<stdin>"
+Q(ArithmeticError)
+
+Q(ArithmeticError)
+
+Q(AssertionError)
+
+Q(AssertionError)
+
+Q(AssertionError)
+
+Q(AttributeError)
+
+Q(AttributeError)
+
+Q(BaseException)
+
+Q(BaseException)
+
+Q(BaseException)
+
+Q(EOFError)
+
+Q(EOFError)
+
+Q(Ellipsis)
+
+Q(Ellipsis)
+
+Q(Exception)
+
+Q(Exception)
+
+Q(GeneratorExit)
+
+Q(GeneratorExit)
+
+Q(ImportError)
+
+Q(ImportError)
+
+Q(IndentationError)
+
+Q(IndentationError)
+
+Q(IndexError)
+
+Q(IndexError)
+
+Q(KeyError)
+
+Q(KeyError)
+
+Q(KeyboardInterrupt)
+
+Q(KeyboardInterrupt)
+
+Q(LookupError)
+
+Q(LookupError)
+
+Q(MemoryError)
+
+Q(MemoryError)
+
+Q(NameError)
+
+Q(NameError)
+
+Q(None)
+
+Q(NoneType)
+
+Q(NotImplementedError)
+
+Q(NotImplementedError)
+
+Q(OSError)
+
+Q(OSError)
+
+Q(OverflowError)
+
+Q(OverflowError)
+
+Q(RuntimeError)
+
+Q(RuntimeError)
+
+Q(StopAsyncIteration)
+
+Q(StopAsyncIteration)
+
+Q(StopAsyncIteration)
+
+Q(StopIteration)
+
+Q(StopIteration)
+
+Q(SyntaxError)
+
+Q(SyntaxError)
+
+Q(SystemExit)
+
+Q(SystemExit)
+
+Q(TypeError)
+
+Q(TypeError)
+
+Q(UnicodeError)
+
+Q(UnicodeError)
+
+Q(ValueError)
+
+Q(ValueError)
+
+Q(ViperTypeError)
+
+Q(ViperTypeError)
+
+Q(ZeroDivisionError)
+
+Q(ZeroDivisionError)
+
+Q(_0x0a_)
+
+Q(__add__)
+
+Q(__aenter__)
+
+Q(__aenter__)
+
+Q(__aexit__)
+
+Q(__aexit__)
+
+Q(__aiter__)
+
+Q(__anext__)
+
+Q(__bases__)
+
+Q(__bool__)
+
+Q(__build_class__)
+
+Q(__call__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__class__)
+
+Q(__complex__)
+
+Q(__contains__)
+
+Q(__contains__)
+
+Q(__delitem__)
+
+Q(__delitem__)
+
+Q(__dict__)
+
+Q(__dict__)
+
+Q(__dict__)
+
+Q(__enter__)
+
+Q(__enter__)
+
+Q(__eq__)
+
+Q(__eq__)
+
+Q(__exit__)
+
+Q(__exit__)
+
+Q(__float__)
+
+Q(__ge__)
+
+Q(__getattr__)
+
+Q(__getattr__)
+
+Q(__getattr__)
+
+Q(__getattr__)
+
+Q(__getitem__)
+
+Q(__getitem__)
+
+Q(__getitem__)
+
+Q(__getitem__)
+
+Q(__gt__)
+
+Q(__hash__)
+
+Q(__iadd__)
+
+Q(__import__)
+
+Q(__init__)
+
+Q(__init__)
+
+Q(__init__)
+
+Q(__int__)
+
+Q(__isub__)
+
+Q(__iter__)
+
+Q(__le__)
+
+Q(__len__)
+
+Q(__lt__)
+
+Q(__main__)
+
+Q(__main__)
+
+Q(__module__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__name__)
+
+Q(__ne__)
+
+Q(__new__)
+
+Q(__new__)
+
+Q(__new__)
+
+Q(__next__)
+
+Q(__next__)
+
+Q(__next__)
+
+Q(__next__)
+
+Q(__path__)
+
+Q(__path__)
+
+Q(__path__)
+
+Q(__path__)
+
+Q(__qualname__)
+
+Q(__repl_print__)
+
+Q(__repl_print__)
+
+Q(__repr__)
+
+Q(__repr__)
+
+Q(__reversed__)
+
+Q(__setitem__)
+
+Q(__setitem__)
+
+Q(__str__)
+
+Q(__sub__)
+
+Q(__traceback__)
+
+Q(_brace_open__colon__hash_b_brace_close_)
+
+Q(_lt_dictcomp_gt_)
+
+Q(_lt_dictcomp_gt_)
+
+Q(_lt_dictcomp_gt_)
+
+Q(_lt_genexpr_gt_)
+
+Q(_lt_genexpr_gt_)
+
+Q(_lt_genexpr_gt_)
+
+Q(_lt_lambda_gt_)
+
+Q(_lt_lambda_gt_)
+
+Q(_lt_lambda_gt_)
+
+Q(_lt_listcomp_gt_)
+
+Q(_lt_listcomp_gt_)
+
+Q(_lt_listcomp_gt_)
+
+Q(_lt_module_gt_)
+
+Q(_lt_module_gt_)
+
+Q(_lt_module_gt_)
+
+Q(_lt_module_gt_)
+
+Q(_lt_setcomp_gt_)
+
+Q(_lt_setcomp_gt_)
+
+Q(_lt_setcomp_gt_)
+
+Q(_lt_string_gt_)
+
+Q(_percent__hash_o)
+
+Q(_percent__hash_x)
+
+Q(_space_)
+
+Q(_star_)
+
+Q(_star_)
+
+Q(_star_)
+
+Q(a0)
+
+Q(a0)
+
+Q(a1)
+
+Q(a1)
+
+Q(a10)
+
+Q(a11)
+
+Q(a12)
+
+Q(a13)
+
+Q(a14)
+
+Q(a15)
+
+Q(a2)
+
+Q(a2)
+
+Q(a3)
+
+Q(a3)
+
+Q(a4)
+
+Q(a4)
+
+Q(a5)
+
+Q(a5)
+
+Q(a6)
+
+Q(a6)
+
+Q(a7)
+
+Q(a7)
+
+Q(a8)
+
+Q(a9)
+
+Q(abs)
+
+Q(abs_)
+
+Q(acos)
+
+Q(add)
+
+Q(add)
+
+Q(add)
+
+Q(add)
+
+Q(add)
+
+Q(add_n)
+
+Q(addi)
+
+Q(addi)
+
+Q(addi_n)
+
+Q(addmi)
+
+Q(addx2)
+
+Q(addx4)
+
+Q(addx8)
+
+Q(align)
+
+Q(all)
+
+Q(and_)
+
+Q(and_)
+
+Q(and_)
+
+Q(andi)
+
+Q(any)
+
+Q(append)
+
+Q(append)
+
+Q(args)
+
+Q(asin)
+
+Q(asm_rv32)
+
+Q(asm_thumb)
+
+Q(asm_xtensa)
+
+Q(asr)
+
+Q(atan)
+
+Q(atan2)
+
+Q(auipc)
+
+Q(b)
+
+Q(ball)
+
+Q(bany)
+
+Q(bbc)
+
+Q(bbci)
+
+Q(bbs)
+
+Q(bbsi)
+
+Q(bcc)
+
+Q(bccz)
+
+Q(beq)
+
+Q(beq)
+
+Q(beqz)
+
+Q(beqz_n)
+
+Q(bge)
+
+Q(bge)
+
+Q(bgeu)
+
+Q(bgeu)
+
+Q(bgez)
+
+Q(bin)
+
+Q(bit_branch)
+
+Q(bl)
+
+Q(blt)
+
+Q(blt)
+
+Q(bltu)
+
+Q(bltu)
+
+Q(bltz)
+
+Q(bnall)
+
+Q(bne)
+
+Q(bne)
+
+Q(bnez)
+
+Q(bnez_n)
+
+Q(bnone)
+
+Q(bool)
+
+Q(bool)
+
+Q(bool)
+
+Q(bool)
+
+Q(bool)
+
+Q(bound_method)
+
+Q(builtins)
+
+Q(builtins)
+
+Q(bx)
+
+Q(bytearray)
+
+Q(bytearray)
+
+Q(bytecode)
+
+Q(bytes)
+
+Q(bytes)
+
+Q(bytes)
+
+Q(c_add)
+
+Q(c_addi)
+
+Q(c_addi4spn)
+
+Q(c_and)
+
+Q(c_andi)
+
+Q(c_beqz)
+
+Q(c_bnez)
+
+Q(c_ebreak)
+
+Q(c_j)
+
+Q(c_jal)
+
+Q(c_jalr)
+
+Q(c_jr)
+
+Q(c_li)
+
+Q(c_lui)
+
+Q(c_lw)
+
+Q(c_lwsp)
+
+Q(c_mv)
+
+Q(c_nop)
+
+Q(c_or)
+
+Q(c_slli)
+
+Q(c_srai)
+
+Q(c_srli)
+
+Q(c_sub)
+
+Q(c_sw)
+
+Q(c_swsp)
+
+Q(c_xor)
+
+Q(calcsize)
+
+Q(call0)
+
+Q(call0)
+
+Q(call0)
+
+Q(call0)
+
+Q(callable)
+
+Q(callx0)
+
+Q(ceil)
+
+Q(chr)
+
+Q(classmethod)
+
+Q(classmethod)
+
+Q(clear)
+
+Q(clear)
+
+Q(clear)
+
+Q(close)
+
+Q(close)
+
+Q(closure)
+
+Q(clz)
+
+Q(cmp)
+
+Q(complex)
+
+Q(complex)
+
+Q(const)
+
+Q(const)
+
+Q(copy)
+
+Q(copy)
+
+Q(copy)
+
+Q(copysign)
+
+Q(cos)
+
+Q(count)
+
+Q(count)
+
+Q(count)
+
+Q(cpsid)
+
+Q(cpsie)
+
+Q(csrrc)
+
+Q(csrrci)
+
+Q(csrrs)
+
+Q(csrrsi)
+
+Q(csrrw)
+
+Q(csrrwi)
+
+Q(data)
+
+Q(decode)
+
+Q(default)
+
+Q(degrees)
+
+Q(delattr)
+
+Q(deleter)
+
+Q(dict)
+
+Q(dict)
+
+Q(dict_view)
+
+Q(difference)
+
+Q(difference_update)
+
+Q(dir)
+
+Q(discard)
+
+Q(div)
+
+Q(divmod)
+
+Q(divu)
+
+Q(doc)
+
+Q(e)
+
+Q(ebreak)
+
+Q(ecall)
+
+Q(encode)
+
+Q(end)
+
+Q(endswith)
+
+Q(enumerate)
+
+Q(enumerate)
+
+Q(errno)
+
+Q(eval)
+
+Q(exec)
+
+Q(exp)
+
+Q(extend)
+
+Q(extend)
+
+Q(fabs)
+
+Q(filter)
+
+Q(filter)
+
+Q(find)
+
+Q(float)
+
+Q(float)
+
+Q(floor)
+
+Q(fmod)
+
+Q(format)
+
+Q(frexp)
+
+Q(from_bytes)
+
+Q(fromkeys)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(function)
+
+Q(generator)
+
+Q(generator)
+
+Q(generator)
+
+Q(get)
+
+Q(getattr)
+
+Q(getter)
+
+Q(globals)
+
+Q(gp)
+
+Q(hasattr)
+
+Q(hash)
+
+Q(heap_lock)
+
+Q(heap_unlock)
+
+Q(hex)
+
+Q(id)
+
+Q(imag)
+
+Q(index)
+
+Q(index)
+
+Q(index)
+
+Q(inf)
+
+Q(insert)
+
+Q(int)
+
+Q(int)
+
+Q(int)
+
+Q(int)
+
+Q(int)
+
+Q(integer)
+
+Q(integer)
+
+Q(intersection)
+
+Q(intersection_update)
+
+Q(isalpha)
+
+Q(isdigit)
+
+Q(isdisjoint)
+
+Q(isfinite)
+
+Q(isinf)
+
+Q(isinstance)
+
+Q(islower)
+
+Q(isnan)
+
+Q(isspace)
+
+Q(issubclass)
+
+Q(issubset)
+
+Q(issuperset)
+
+Q(isupper)
+
+Q(items)
+
+Q(iter)
+
+Q(iterable)
+
+Q(iterator)
+
+Q(iterator)
+
+Q(iterator)
+
+Q(iterator)
+
+Q(iterator)
+
+Q(j)
+
+Q(jal)
+
+Q(jalr)
+
+Q(join)
+
+Q(jx)
+
+Q(key)
+
+Q(key)
+
+Q(keys)
+
+Q(keys)
+
+Q(l16si)
+
+Q(l16ui)
+
+Q(l32i)
+
+Q(l32i_n)
+
+Q(l32r)
+
+Q(l32r)
+
+Q(l32r)
+
+Q(l32r)
+
+Q(l8ui)
+
+Q(la)
+
+Q(label)
+
+Q(label)
+
+Q(lb)
+
+Q(lbu)
+
+Q(ldexp)
+
+Q(ldr)
+
+Q(ldrb)
+
+Q(ldrex)
+
+Q(ldrh)
+
+Q(len)
+
+Q(lh)
+
+Q(lhu)
+
+Q(li)
+
+Q(list)
+
+Q(list)
+
+Q(little)
+
+Q(little)
+
+Q(locals)
+
+Q(location)
+
+Q(location)
+
+Q(log)
+
+Q(lower)
+
+Q(lsl)
+
+Q(lsr)
+
+Q(lstrip)
+
+Q(lui)
+
+Q(lw)
+
+Q(map)
+
+Q(map)
+
+Q(math)
+
+Q(math)
+
+Q(math)
+
+Q(max)
+
+Q(maximum_space_recursion_space_depth_space_exceeded)
+
+Q(micropython)
+
+Q(micropython)
+
+Q(micropython)
+
+Q(min)
+
+Q(modf)
+
+Q(module)
+
+Q(mov)
+
+Q(mov)
+
+Q(mov)
+
+Q(mov_n)
+
+Q(movi)
+
+Q(movi_n)
+
+Q(movt)
+
+Q(movw)
+
+Q(movwt)
+
+Q(mrs)
+
+Q(mul)
+
+Q(mulh)
+
+Q(mulhsu)
+
+Q(mulhu)
+
+Q(mull)
+
+Q(mv)
+
+Q(nan)
+
+Q(native)
+
+Q(neg)
+
+Q(next)
+
+Q(nop)
+
+Q(nop)
+
+Q(nop_n)
+
+Q(nsa)
+
+Q(nsau)
+
+Q(object)
+
+Q(object)
+
+Q(object)
+
+Q(object)
+
+Q(object)
+
+Q(oct)
+
+Q(offset)
+
+Q(opt_level)
+
+Q(or_)
+
+Q(or_)
+
+Q(ord)
+
+Q(ori)
+
+Q(pack)
+
+Q(pack_into)
+
+Q(pend_throw)
+
+Q(pi)
+
+Q(pop)
+
+Q(pop)
+
+Q(pop)
+
+Q(pop)
+
+Q(popitem)
+
+Q(pow)
+
+Q(pow)
+
+Q(print)
+
+Q(property)
+
+Q(property)
+
+Q(ptr)
+
+Q(ptr)
+
+Q(ptr16)
+
+Q(ptr16)
+
+Q(ptr32)
+
+Q(ptr32)
+
+Q(ptr8)
+
+Q(ptr8)
+
+Q(push)
+
+Q(ra)
+
+Q(radians)
+
+Q(range)
+
+Q(range)
+
+Q(range)
+
+Q(rbit)
+
+Q(real)
+
+Q(register)
+
+Q(rem)
+
+Q(remove)
+
+Q(remove)
+
+Q(remu)
+
+Q(replace)
+
+Q(repr)
+
+Q(ret)
+
+Q(ret_n)
+
+Q(reverse)
+
+Q(reverse)
+
+Q(reversed)
+
+Q(reversed)
+
+Q(rfind)
+
+Q(rindex)
+
+Q(round)
+
+Q(rsplit)
+
+Q(rstrip)
+
+Q(s0)
+
+Q(s1)
+
+Q(s10)
+
+Q(s11)
+
+Q(s16i)
+
+Q(s2)
+
+Q(s3)
+
+Q(s32i)
+
+Q(s32i_n)
+
+Q(s4)
+
+Q(s5)
+
+Q(s6)
+
+Q(s7)
+
+Q(s8)
+
+Q(s8i)
+
+Q(s9)
+
+Q(sb)
+
+Q(sdiv)
+
+Q(send)
+
+Q(send)
+
+Q(sep)
+
+Q(set)
+
+Q(set)
+
+Q(setattr)
+
+Q(setdefault)
+
+Q(setter)
+
+Q(sh)
+
+Q(sh1add)
+
+Q(sh2add)
+
+Q(sh3add)
+
+Q(sin)
+
+Q(slice)
+
+Q(slice)
+
+Q(sll)
+
+Q(sll)
+
+Q(slli)
+
+Q(slli)
+
+Q(slt)
+
+Q(slti)
+
+Q(sltiu)
+
+Q(sltu)
+
+Q(sort)
+
+Q(sorted)
+
+Q(sp)
+
+Q(split)
+
+Q(sqrt)
+
+Q(sra)
+
+Q(sra)
+
+Q(srai)
+
+Q(srai)
+
+Q(src)
+
+Q(srl)
+
+Q(srl)
+
+Q(srli)
+
+Q(srli)
+
+Q(ssa8b)
+
+Q(ssa8l)
+
+Q(ssai)
+
+Q(ssl)
+
+Q(ssr)
+
+Q(start)
+
+Q(start)
+
+Q(startswith)
+
+Q(staticmethod)
+
+Q(staticmethod)
+
+Q(step)
+
+Q(stop)
+
+Q(str)
+
+Q(str)
+
+Q(str)
+
+Q(str)
+
+Q(str)
+
+Q(strb)
+
+Q(strex)
+
+Q(strh)
+
+Q(strip)
+
+Q(struct)
+
+Q(struct)
+
+Q(sub)
+
+Q(sub)
+
+Q(sub)
+
+Q(sub)
+
+Q(subx2)
+
+Q(subx4)
+
+Q(subx8)
+
+Q(sum)
+
+Q(super)
+
+Q(super)
+
+Q(super)
+
+Q(sw)
+
+Q(symmetric_difference)
+
+Q(symmetric_difference_update)
+
+Q(t0)
+
+Q(t1)
+
+Q(t2)
+
+Q(t3)
+
+Q(t4)
+
+Q(t5)
+
+Q(t6)
+
+Q(tan)
+
+Q(target)
+
+Q(target)
+
+Q(tau)
+
+Q(throw)
+
+Q(throw)
+
+Q(to_bytes)
+
+Q(tp)
+
+Q(trunc)
+
+Q(tuple)
+
+Q(tuple)
+
+Q(type)
+
+Q(type)
+
+Q(udiv)
+
+Q(uint)
+
+Q(uint)
+
+Q(uint)
+
+Q(union)
+
+Q(unpack)
+
+Q(unpack_from)
+
+Q(update)
+
+Q(update)
+
+Q(upper)
+
+Q(utf_hyphen_8)
+
+Q(utf_hyphen_8)
+
+Q(value)
+
+Q(values)
+
+Q(vcmp)
+
+Q(vcvt_f32_s32)
+
+Q(vcvt_s32_f32)
+
+Q(viper)
+
+Q(vldr)
+
+Q(vmov)
+
+Q(vmrs)
+
+Q(vneg)
+
+Q(vsqrt)
+
+Q(vstr)
+
+Q(wfi)
+
+Q(x0)
+
+Q(x1)
+
+Q(x10)
+
+Q(x11)
+
+Q(x12)
+
+Q(x13)
+
+Q(x14)
+
+Q(x15)
+
+Q(x16)
+
+Q(x17)
+
+Q(x18)
+
+Q(x19)
+
+Q(x2)
+
+Q(x20)
+
+Q(x21)
+
+Q(x22)
+
+Q(x23)
+
+Q(x24)
+
+Q(x25)
+
+Q(x26)
+
+Q(x27)
+
+Q(x28)
+
+Q(x29)
+
+Q(x3)
+
+Q(x30)
+
+Q(x31)
+
+Q(x4)
+
+Q(x5)
+
+Q(x6)
+
+Q(x7)
+
+Q(x8)
+
+Q(x9)
+
+Q(xor)
+
+Q(xor)
+
+Q(xori)
+
+Q(zero)
+
+Q(zip)
+
+Q(zip)
+
+Q(zip)
@@ -0,0 +1,2 @@
+// Automatically generated by make_root_pointers.py.
+
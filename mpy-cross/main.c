@@ -70,38 +70,52 @@ static void stderr_print_strn(void *env, const char *str, size_t len) {
 
 static const mp_print_t mp_stderr_print = {NULL, stderr_print_strn};
 
-static int compile_and_save(const char *file, const char *output_file, const char *source_file) {
-    nlr_buf_t nlr;
-    if (nlr_push(&nlr) == 0) {
-        mp_lexer_t *lex;
-        if (strcmp(file, "-") == 0) {
-            lex = mp_lexer_new_from_fd(MP_QSTR__lt_stdin_gt_, STDIN_FILENO, false);
-        } else {
-            lex = mp_lexer_new_from_file(qstr_from_str(file));
+static char *backslash_to_forwardslash(char *path) {
+    for (char *p = path; p != NULL && *p != '\0'; ++p) {
+        if (*p == '\\') {
+            *p = '/';
         }
+    }
+    return path;
+}
 
-        qstr source_name;
-        if (source_file == NULL) {
-            source_name = lex->source_name;
-        } else {
-            source_name = qstr_from_str(source_file);
-        }
+// Compile the given file, raising an exception if there is an error.
+static void compile_file(const char *file, const char *source_file, mp_compiled_module_t *cm) {
+    mp_lexer_t *lex;
+    if (strcmp(file, "-") == 0) {
+        lex = mp_lexer_new_from_fd(MP_QSTR__lt_stdin_gt_, STDIN_FILENO, false);
+    } else {
+        lex = mp_lexer_new_from_file(qstr_from_str(file));
+    }
 
-        #if MICROPY_MODULE___FILE__
-        mp_store_global(MP_QSTR___file__, MP_OBJ_NEW_QSTR(source_name));
-        #endif
+    qstr source_name;
+    if (source_file == NULL) {
+        source_name = lex->source_name;
+    } else {
+        source_name = qstr_from_str(source_file);
+    }
 
-        mp_parse_tree_t parse_tree = mp_parse(lex, MP_PARSE_FILE_INPUT);
-        mp_compiled_module_t cm;
-        cm.context = m_new_obj(mp_module_context_t);
-        cm.arch_flags = 0;
-        #if MICROPY_EMIT_NATIVE && MICROPY_EMIT_RV32
-        if (mp_dynamic_compiler.native_arch == MP_NATIVE_ARCH_RV32IMC && mp_dynamic_compiler.backend_options != NULL) {
-            cm.arch_flags = ((asm_rv32_backend_options_t *)mp_dynamic_compiler.backend_options)->allowed_extensions;
-        }
-        #endif
+    #if MICROPY_MODULE___FILE__
+    mp_store_global(MP_QSTR___file__, MP_OBJ_NEW_QSTR(source_name));
+    #endif
+
+    mp_parse_tree_t parse_tree = mp_parse(lex, MP_PARSE_FILE_INPUT);
+    cm->context = m_new_obj(mp_module_context_t);
+    cm->arch_flags = 0;
+    #if MICROPY_EMIT_NATIVE && MICROPY_EMIT_RV32
+    if (mp_dynamic_compiler.native_arch == MP_NATIVE_ARCH_RV32IMC && mp_dynamic_compiler.backend_options != NULL) {
+        cm->arch_flags = ((asm_rv32_backend_options_t *)mp_dynamic_compiler.backend_options)->allowed_extensions;
+    }
+    #endif
+
+    mp_compile_to_raw_code(&parse_tree, source_name, false, cm);
+}
 
-        mp_compile_to_raw_code(&parse_tree, source_name, false, &cm);
+static int compile_and_save(const char *file, const char *output_file, const char *source_file) {
+    nlr_buf_t nlr;
+    if (nlr_push(&nlr) == 0) {
+        mp_compiled_module_t cm;
+        compile_file(file, source_file, &cm);
 
         if ((output_file != NULL && strcmp(output_file, "-") == 0) ||
             (output_file == NULL && strcmp(file, "-") == 0)) {
@@ -130,6 +144,108 @@ static int compile_and_save(const char *file, const char *output_file, const cha
     }
 }
 
+static void write_all(const char *buf, size_t len) {
+    while (len > 0) {
+        ssize_t n = write(STDOUT_FILENO, buf, len);
+        if (n <= 0) {
+            exit(1);
+        }
+        buf += n;
+        len -= n;
+    }
+}
+
+static void write_batch_result(const char *status, const char *buf, size_t len) {
+    char header[32];
+    int header_len = snprintf(header, sizeof(header), "%s %u\n", status, (unsigned int)len);
+    write_all(header, header_len);
+    write_all(buf, len);
+}
+
+// Compile a sequence of files, given as lines on stdin of the form:
+//
+//     <input filename>[\t<source filename>[\t<optimisation level>]]
+//
+// For each line, write to stdout "mpy <n>\n" followed by the n bytes of the compiled
+// .mpy file, or "error <n>\n" followed by the n bytes of the error message.  The VM is
+// reset for each file, so the output is the same as compiling each one on its own.
+static int compile_batch(char *heap, uint default_opt_level) {
+    char line[4096];
+    while (fgets(line, sizeof(line), stdin) != NULL) {
+        size_t len = strlen(line);
+        if (len > 0 && line[len - 1] == '\n') {
+            line[--len] = '\0';
+        } else if (!feof(stdin)) {
+            // The line doesn't fit in the buffer.  Skip the rest of it and give a
+            // single error for it, so that each line still gets exactly one result.
+            int c;
+            while ((c = fgetc(stdin)) != EOF && c != '\n') {
+            }
+            static const char msg[] = "mpy-cross: input line too long\n";
+            write_batch_result("error", msg, sizeof(msg) - 1);
+            continue;
+        }
+        if (len > 0 && line[len - 1] == '\r') {
+            line[--len] = '\0';
+        }
+        if (len == 0) {
+            continue;
+        }
+
+        // Split the line into its fields.
+        char *input_file = line;
+        char *source_file = NULL;
+        uint opt_level = default_opt_level;
+        char *field = strchr(input_file, '\t');
+        if (field != NULL) {
+            *field++ = '\0';
+            source_file = field;
+            field = strchr(field, '\t');
+            if (field != NULL) {
+                *field++ = '\0';
+                if (unichar_isdigit(*field)) {
+                    opt_level = *field & 0xf;
+                }
+            }
+            if (*source_file == '\0') {
+                source_file = NULL;
+            } else {
+                backslash_to_forwardslash(source_file);
+            }
+        }
+        backslash_to_forwardslash(input_file);
+
+        gc_init(heap, heap + heap_size);
+        mp_init();
+        #if MICROPY_EMIT_NATIVE
+        MP_STATE_VM(default_emit_opt) = emit_opt;
+        #endif
+        MP_STATE_VM(mp_optimise_value) = opt_level;
+
+        vstr_t vstr;
+        mp_print_t print;
+        vstr_init_print(&vstr, 1024, &print);
+        const char *status = "mpy";
+        nlr_buf_t nlr;
+        if (nlr_push(&nlr) == 0) {
+            mp_compiled_module_t cm;
+            compile_file(input_file, source_file, &cm);
+            mp_raw_code_save(&cm, &print);
+            nlr_pop();
+        } else {
+            status = "error";
+            vstr_reset(&vstr);
+            mp_obj_print_exception(&print, (mp_obj_t)nlr.ret_val);
+        }
+
+        write_batch_result(status, vstr.buf, vstr.len);
+        vstr_clear(&vstr);
+
+        mp_deinit();
+    }
+    return 0;
+}
+
 static int usage(char **argv) {
     printf(
         "usage: %s [<opts>] [-X <implopt>] [--] <input filename>\n"
@@ -139,6 +255,7 @@ static int usage(char **argv) {
         "-s : source filename to embed in the compiled bytecode (defaults to input file)\n"
         "-v : verbose (trace various operations); can be multiple\n"
         "-O[N] : apply bytecode optimizations of level N\n"
+        "--batch : compile the files named on each line of stdin, writing the results to stdout\n"
         "\n"
         "Target specific options:\n"
         "-msmall-int-bits=number : set the maximum bits used to encode a small-int\n"
@@ -218,15 +335,6 @@ static void pre_process_options(int argc, char **argv) {
     }
 }
 
-static char *backslash_to_forwardslash(char *path) {
-    for (char *p = path; p != NULL && *p != '\0'; ++p) {
-        if (*p == '\\') {
-            *p = '/';
-        }
-    }
-    return path;
-}
-
 // This will need to be reworked in case mpy-cross needs to set more bits than
 // what its small int representation allows to fit in there.
 static bool parse_integer(const char *value, mp_uint_t *integer) {
@@ -317,6 +425,7 @@ MP_NOINLINE int main_(int argc, char **argv) {
     const char *source_file = NULL;
     bool option_parsing_active = true;
     const char *arch_flags = NULL;
+    bool batch = false;
 
     // parse main options
     for (int a = 1; a < argc; a++) {
@@ -329,6 +438,8 @@ MP_NOINLINE int main_(int argc, char **argv) {
                 return 0;
             } else if (strcmp(argv[a], "-v") == 0) {
                 mp_verbose_flag++;
+            } else if (strcmp(argv[a], "--batch") == 0) {
+                batch = true;
             } else if (strncmp(argv[a], "-O", 2) == 0) {
                 if (unichar_isdigit(argv[a][2])) {
                     MP_STATE_VM(mp_optimise_value) = argv[a][2] & 0xf;
@@ -463,6 +574,16 @@ MP_NOINLINE int main_(int argc, char **argv) {
     }
     #endif
 
+    if (batch) {
+        if (input_file != NULL || output_file != NULL || source_file != NULL) {
+            mp_printf(&mp_stderr_print, "input and output files can't be given with --batch\n");
+            exit(1);
+        }
+        uint opt_level = MP_STATE_VM(mp_optimise_value);
+        mp_deinit();
+        return compile_batch(heap, opt_level);
+    }
+
     if (input_file == NULL) {
         mp_printf(&mp_stderr_print, "no input file\n");
         exit(1);
@@ -29,6 +29,7 @@ import os
 import re
 import stat
 import subprocess
+import tempfile
 
 NATIVE_ARCHS = {
     "NATIVE_ARCH_NONE": "",
@@ -48,7 +49,9 @@ NATIVE_ARCHS = {
 
 globals().update(NATIVE_ARCHS)
 
-__all__ = ["version", "compile", "run", "CrossCompileError"] + list(NATIVE_ARCHS.keys())
+__all__ = ["version", "compile", "run", "Compiler", "CrossCompileError"] + list(
+    NATIVE_ARCHS.keys()
+)
 
 
 class CrossCompileError(Exception):
@@ -150,3 +153,106 @@ def run(args, mpy_cross=None):
         return subprocess.check_output([mpy_cross] + args, stderr=subprocess.STDOUT).decode()
     except subprocess.CalledProcessError as er:
         raise CrossCompileError(er.output.decode())
+
+
+class Compiler:
+    """
+    A long-running mpy-cross process which compiles many .py files, avoiding the cost of
+    starting mpy-cross for each one.  The compiled .mpy files are returned as bytes.
+
+    Use as a context manager, or call `close()` when finished, eg:
+
+        with mpy_cross.Compiler(march=mpy_cross.NATIVE_ARCH_X64) as compiler:
+            for src in files:
+                mpy = compiler.compile(src, src_path=os.path.basename(src))
+
+    Optional keyword arguments, which apply to every file compiled:
+     - march:      One of the `NATIVE_ARCH_*` constants (defaults to NATIVE_ARCH_NONE)
+     - mpy_cross:  Specific mpy-cross binary to use
+     - extra_args: Additional arguments to pass to mpy-cross (e.g. `["-X", "emit=native"]`)
+    """
+
+    def __init__(self, march=None, mpy_cross=None, extra_args=None):
+        mpy_cross = _find_mpy_cross_binary(mpy_cross)
+
+        if not os.path.exists(mpy_cross):
+            raise CrossCompileError("mpy-cross binary not found at {}.".format(mpy_cross))
+
+        args = [mpy_cross, "--batch"]
+
+        if march:
+            args += ["-march=" + march]
+
+        if extra_args:
+            args += extra_args
+
+        # stderr is only needed if something goes wrong, so it goes to a file rather than
+        # a pipe that would fill up (and block mpy-cross) if nothing ever read it.
+        self._stderr = tempfile.TemporaryFile()
+        self._process = subprocess.Popen(
+            args, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=self._stderr
+        )
+
+    def compile(self, src, src_path=None, opt=None):
+        """
+        Compile the specified .py file.
+
+        Returns: The contents of the compiled .mpy file as bytes.
+
+        Required arguments:
+         - src:        The path to the .py file
+
+        Optional keyword arguments:
+         - src_path:   The path to embed in the .mpy file (defaults to `src`)
+         - opt:        Optimisation level (0-3, default 0)
+        """
+        if not src:
+            raise ValueError("src is required")
+
+        # Each file is given to mpy-cross as a line of tab-separated fields.
+        fields = [
+            os.fsencode(src),
+            os.fsencode(src_path or ""),
+            b"" if opt is None else b"%d" % opt,
+        ]
+        if any(b"\t" in field or b"\n" in field for field in fields):
+            raise ValueError("paths can't contain tabs or newlines")
+
+        try:
+            self._process.stdin.write(b"\t".join(fields) + b"\n")
+            self._process.stdin.flush()
+            # The result is a header line of "<status> <length>" followed by the data.
+            status, length = self._process.stdout.readline().split()
+            data = self._process.stdout.read(int(length))
+        except (OSError, ValueError):
+            self._stop()
+            self._stderr.seek(0)
+            error = self._stderr.read().decode()
+            self.close()
+            raise CrossCompileError("mpy-cross --batch failed: {}".format(error))
+
+        if status != b"mpy":
+            raise CrossCompileError(data.decode())
+        return data
+
+    def close(self):
+        """
+        Stop the mpy-cross process.
+        """
+        self._stop()
+        self._stderr.close()
+
+    def _stop(self):
+        try:
+            self._process.stdin.close()
+        except OSError:
+            # The process has already exited.
+            pass
+        self._process.wait()
+        self._process.stdout.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,4 @@
+// This file was generated by py/makeversionhdr.py
+#define MICROPY_GIT_TAG "5b90335c56"
+#define MICROPY_GIT_HASH "5b90335"
+#define MICROPY_BUILD_DATE "2026-10-19"
@@ -6,6 +6,7 @@ BUILD ?= build
 ECHO = @echo
 RM = /bin/rm
 MKDIR = /bin/mkdir
+TOUCH = touch
 PYTHON = python3
 MPY_CROSS = $(MPY_DIR)/mpy-cross/build/mpy-cross
 MPY_TOOL = $(PYTHON) $(MPY_DIR)/tools/mpy-tool.py
@@ -20,7 +21,10 @@ endif
 endif
 
 ARCH_UPPER = $(shell echo $(ARCH) | tr '[:lower:]' '[:upper:]')
-CONFIG_H = $(BUILD)/$(MOD).config.h
+CONFIG_H ?= $(BUILD)/$(MOD).config.h
+
+# Final output file, may be overridden to build several architectures side by side
+MPY_FILE ?= $(MOD).mpy
 
 CFLAGS += -I. -I$(MPY_DIR)
 CFLAGS += -std=c99
@@ -39,7 +43,7 @@ MPY_CROSS_FLAGS += -march=$(ARCH)
 SRC_O += $(addprefix $(BUILD)/, $(patsubst %.c,%.o,$(filter %.c,$(SRC))) $(patsubst %.S,%.o,$(filter %.S,$(SRC))))
 SRC_MPY += $(addprefix $(BUILD)/, $(patsubst %.py,%.mpy,$(filter %.py,$(SRC))))
 
-CLEAN_EXTRA += $(MOD).mpy .mpy_ld_cache
+CLEAN_EXTRA += $(MPY_FILE)
 
 ################################################################################
 # Architecture configuration
@@ -205,21 +209,28 @@ CFLAGS += $(CFLAGS_EXTRA)
 
 .PHONY: all clean
 
-all: $(MOD).mpy
+all: $(MPY_FILE)
 
 clean:
 	$(RM) -rf $(BUILD) $(CLEAN_EXTRA)
 
 # Create build destination directories first
 BUILD_DIRS = $(sort $(dir $(CONFIG_H) $(SRC_O) $(SRC_MPY)))
-$(CONFIG_H) $(SRC_O) $(SRC_MPY): | $(BUILD_DIRS)
+$(CONFIG_H) $(CONFIG_H).stamp $(SRC_O) $(SRC_MPY): | $(BUILD_DIRS)
 $(BUILD_DIRS):
 	$(Q)$(MKDIR) -p $@
 
-# Preprocess all source files to generate $(CONFIG_H)
-$(CONFIG_H): $(SRC)
-	$(ECHO) "GEN $@"
-	$(Q)$(MPY_LD) --arch $(ARCH) --preprocess -o $@ $^
+# Preprocess all source files to generate $(CONFIG_H).  mpy_ld only rewrites
+# $(CONFIG_H) when its content changes, so that objects aren't rebuilt for
+# nothing, and the stamp records that it's up to date with $(SRC).
+$(CONFIG_H).stamp: $(SRC)
+	$(ECHO) "GEN $(CONFIG_H)"
+	$(Q)$(MPY_LD) --arch $(ARCH) --preprocess -o $(CONFIG_H) $^
+	$(Q)$(TOUCH) $@
+
+# Regenerate $(CONFIG_H) if it was removed but the stamp wasn't
+$(CONFIG_H): $(CONFIG_H).stamp
+	$(Q)test -f $@ || $(MPY_LD) --arch $(ARCH) --preprocess -o $@ $(SRC)
 
 # Build .o from .c source files
 $(BUILD)/%.o: %.c $(CONFIG_H) Makefile
@@ -242,6 +253,6 @@ $(BUILD)/$(MOD).native.mpy: $(SRC_O)
 	$(Q)$(MPY_LD) --arch $(ARCH) --qstrs $(CONFIG_H) $(MPY_LD_FLAGS) -o $@ $^
 
 # Build final .mpy from all intermediate .mpy files
-$(MOD).mpy: $(BUILD)/$(MOD).native.mpy $(SRC_MPY)
+$(MPY_FILE): $(BUILD)/$(MOD).native.mpy $(SRC_MPY)
 	$(ECHO) "GEN $@"
 	$(Q)$(MPY_TOOL) --merge -o $@ $^
@@ -26,12 +26,14 @@
 
 import os
 import re
+import sys
 import hashlib
 import functools
 import pickle
+import tempfile
 
 from elftools.elf import elffile
-from collections import defaultdict
+from collections import defaultdict, deque
 
 try:
     from ar import Archive
@@ -55,15 +57,38 @@ class PickleCache:
                     "# This file is a cache directory tag created by MicroPython.\n"
                     "# For information about cache directory tags see https://bford.info/cachedir/\n"
                 )
-        with open(self._get_fn(key), "wb") as f:
-            pickle.dump(data, f)
+        # Builds run concurrently and share the cache, so write each entry to a temporary
+        # file and then move it into place, so that a partial entry is never seen.
+        fd, tmp_fn = tempfile.mkstemp(dir=self.path, prefix=".tmp_")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(data, f)
+            os.replace(tmp_fn, self._get_fn(key))
+        except:
+            os.unlink(tmp_fn)
+            raise
 
     def load(self, key):
         with open(self._get_fn(key), "rb") as f:
             return pickle.load(f)
 
 
-def cached(key, cache):
+def user_cache_dir():
+    # The cache is shared by all builds of the user, so each library only has to be loaded
+    # once, rather than once in every directory where a native module is built.
+    path = os.getenv("MICROPY_MPY_LD_CACHE")
+    if path:
+        return path
+    if sys.platform == "win32":
+        base = os.getenv("LOCALAPPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "micropython", "mpy_ld")
+
+
+def cached(key, cache, check=None):
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
@@ -72,6 +97,8 @@ def cached(key, cache):
                 d = cache.load(cache_key)
                 if d["key"] != cache_key:
                     raise Exception("Cache key mismatch")
+                if check is not None and not check(*args, d["data"]):
+                    raise Exception("Cache data out of date")
                 return d["data"]
             except Exception:
                 res = func(*args, **kwargs)
@@ -93,28 +120,77 @@ def cached(key, cache):
 
 
 class CachedArFile:
-    def __init__(self, fn):
+    def __init__(self, fn, verify=False):
         if not Archive:
             raise RuntimeError("Please run 'pip install ar' to link .a files")
         self.fn = fn
         self._archive = Archive(open(fn, "rb"))
+        self._key = self._archive_key()
+        self._verify = verify
         info = self.load_symbols()
         self.objs = info["objs"]
         self.symbols = info["symbols"]
+        self._content_hash = info["content_hash"]
 
     def open(self, obj):
         return self._archive.open(obj, "rb")
 
-    def _cache_key(self):
+    def _archive_key(self):
+        # Identify the archive by its path, size, modification time and inode, which is
+        # much cheaper than hashing its content.
+        st = os.stat(self.fn)
+        sha = hashlib.sha256()
+        sha.update(
+            repr((os.path.realpath(self.fn), st.st_size, st.st_mtime_ns, st.st_ino)).encode()
+        )
+        # Change this salt if the cache data format changes
+        sha.update(bytes.fromhex("00000000000000000000000000000002"))
+        return sha.hexdigest()
+
+    def _hash_content(self):
         sha = hashlib.sha256()
         with open(self.fn, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+            for chunk in iter(lambda: f.read(1 << 20), b""):
                 sha.update(chunk)
-        # Change this salt if the cache data format changes
-        sha.update(bytes.fromhex("00000000000000000000000000000001"))
         return sha.hexdigest()
 
-    @cached(key=_cache_key, cache=PickleCache(path=".mpy_ld_cache", prefix="ar_"))
+    # Cache entries are named by the path of the archive (and the object within it), not
+    # by _key, so that when an archive changes its entries are overwritten rather than
+    # new ones added.  The entries store _key to tell whether they are up to date.
+    def _cache_key(self):
+        return hashlib.sha256(os.path.realpath(self.fn).encode()).hexdigest()
+
+    def _check_cache(self, info):
+        if info["archive_key"] != self._key:
+            return False
+        # With verify=True, only use the cached data if the content is also the same.
+        return not self._verify or info["content_hash"] == self._hash_content()
+
+    def _symtab_cache_key(self, obj):
+        key = os.path.realpath(self.fn) + ":" + obj
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def _check_symtab_cache(self, obj, info):
+        # Includes the content hash, so these are invalidated along with the archive info.
+        return info["archive"] == self._key + ":" + self._content_hash
+
+    @cached(
+        key=_symtab_cache_key,
+        cache=PickleCache(path=user_cache_dir(), prefix="sym_"),
+        check=_check_symtab_cache,
+    )
+    def _load_symtab(self, obj):
+        elf = elffile.ELFFile(self.open(obj))
+        symtab = list(elf.get_section_by_name(".symtab").iter_symbols())
+        return {"archive": self._key + ":" + self._content_hash, "symtab": symtab}
+
+    def load_symtab(self, obj):
+        # Return the full symbol table of an object in the archive, as needed to link it.
+        return self._load_symtab(obj)["symtab"]
+
+    @cached(
+        key=_cache_key, cache=PickleCache(path=user_cache_dir(), prefix="ar_"), check=_check_cache
+    )
     def load_symbols(self):
         print("Loading", self.fn)
         objs = defaultdict(lambda: {"def": set(), "undef": set(), "weak": set()})
@@ -142,14 +218,26 @@ class CachedArFile:
                     if sym_bind == "STB_WEAK":
                         obj["weak"].add(sym_name)
 
-        return {"objs": dict(objs), "symbols": symbols}
+        return {
+            "objs": dict(objs),
+            "symbols": symbols,
+            "archive_key": self._key,
+            "content_hash": self._hash_content(),
+        }
 
 
 def resolve(archives, symbols):
-    resolved_objs = []  # Object files needed to resolve symbols
+    resolved_objs = []  # Object files needed to resolve symbols, in the order found
+    resolved_objs_set = set()  # The same objects, for fast lookup
     unresolved_symbols = set()
     provided_symbols = {}  # Which symbol is provided by which object
-    symbol_stack = list(symbols)
+    symbol_stack = deque(symbols)
+
+    # Index of which archive defines each symbol, where the first archive takes precedence
+    archive_by_symbol = {}
+    for archive in archives:
+        for symbol in archive.symbols:
+            archive_by_symbol.setdefault(symbol, archive)
 
     # A helper function to handle symbol resolution from a particular object
     def add_obj(archive, symbol):
@@ -157,10 +245,11 @@ def resolve(archives, symbols):
         obj_info = archive.objs[obj_name]
 
         obj_tuple = (archive, obj_name)
-        if obj_tuple in resolved_objs:
+        if obj_tuple in resolved_objs_set:
             return  # Already processed this object
 
         resolved_objs.append(obj_tuple)
+        resolved_objs_set.add(obj_tuple)
 
         # Add the symbols this object defines
         for defined_symbol in obj_info["def"]:
@@ -182,19 +271,15 @@ def resolve(archives, symbols):
                 symbol_stack.append(undef_symbol)  # Add undefined symbol to resolve
 
     while symbol_stack:
-        symbol = symbol_stack.pop(0)
+        symbol = symbol_stack.popleft()
 
         if symbol in provided_symbols:
             continue  # Symbol is already resolved
 
-        found = False
-        for archive in archives:
-            if symbol in archive.symbols:
-                add_obj(archive, symbol)
-                found = True
-                break
-
-        if not found:
+        archive = archive_by_symbol.get(symbol)
+        if archive is not None:
+            add_obj(archive, symbol)
+        else:
             unresolved_symbols.add(symbol)
 
     return resolved_objs, list(unresolved_symbols)
@@ -226,11 +311,11 @@ def expand_ld_script(fn):
     return files
 
 
-def load_archive(fn):
+def load_archive(fn, verify=False):
     ar_header = b"!<arch>\012"
     with open(fn, "rb") as f:
         is_ar_file = f.read(len(ar_header)) == ar_header
     if is_ar_file:
-        return [CachedArFile(fn)]
+        return [CachedArFile(fn, verify)]
     else:
-        return [CachedArFile(item) for item in expand_ld_script(fn)]
+        return [CachedArFile(item, verify) for item in expand_ld_script(fn)]
@@ -758,8 +758,16 @@ function ci_unix_coverage_run_mpy_merge_tests {
         $mptop/mpy-cross/build/mpy-cross -o $outmpy $inpy
         (cd $outdir && $mptop/ports/unix/build-coverage/micropython -m $test >> out-individual)
         allmpy+=($outmpy)
+        echo $inpy >> $outdir/batch-in
+        printf "mpy %d\n" $(wc -c < $outmpy) >> $outdir/batch-expected
+        cat $outmpy >> $outdir/batch-expected
     done
 
+    # Compile the same tests with mpy-cross --batch, which must give the same .mpy
+    # files as compiling each one on its own.
+    $mptop/mpy-cross/build/mpy-cross --batch < $outdir/batch-in > $outdir/batch-out
+    cmp $outdir/batch-expected $outdir/batch-out
+
     # Merge all the tests into one .mpy file, and then execute it.
     python3 $mptop/tools/mpy-tool.py --merge -o $outdir/merged.mpy ${allmpy[@]}
     (cd $outdir && $mptop/ports/unix/build-coverage/micropython -m merged > out-merged)
@@ -768,6 +776,29 @@ function ci_unix_coverage_run_mpy_merge_tests {
     diff $outdir/out-individual $outdir/out-merged && /bin/rm -rf $outdir
 }
 
+function ci_unix_coverage_run_mpy_optimize_tests {
+    mptop=$(pwd)
+    outdir=$(mktemp -d)
+    mkdir $outdir/plain $outdir/optimized
+
+    # Compile the tests to .mpy, optimise each one with mpy-tool.py, and execute both
+    # the plain and optimised versions, collecting the output.  Tracebacks are
+    # included so that any change to the line numbers is caught, as is the exit status
+    # because some tests end with an uncaught exception.
+    for inpy in $mptop/tests/basics/*.py $mptop/tests/misc/print_exception.py; do
+        test=$(basename $inpy .py)
+        echo $test
+        $mptop/mpy-cross/build/mpy-cross -o $outdir/plain/$test.mpy $inpy
+        python3 $mptop/tools/mpy-tool.py --optimize --merge -o $outdir/optimized/$test.mpy $outdir/plain/$test.mpy
+        for variant in plain optimized; do
+            (cd $outdir/$variant && $mptop/ports/unix/build-coverage/micropython -m $test || echo "exit status $?") >> $outdir/out-$variant 2>&1
+        done
+    done
+
+    # Make sure the outputs match.
+    diff $outdir/out-plain $outdir/out-optimized && /bin/rm -rf $outdir
+}
+
 function ci_unix_coverage_run_native_mpy_tests {
     MICROPYPATH=examples/natmod/features2 ./ports/unix/build-coverage/micropython -m features2
     (cd tests && ./run-natmodtests.py "$@" extmod/*.py)
@@ -26,6 +26,8 @@
 
 import sys
 import os
+import hashlib
+import json
 import subprocess
 
 # Always use the mpy-cross from this repo.
@@ -37,10 +39,6 @@ import manifestfile
 VARS = {}
 
 
-class FreezeError(Exception):
-    pass
-
-
 def system(cmd):
     try:
         output = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
@@ -49,22 +47,102 @@ def system(cmd):
         return -1, er.output
 
 
-def get_timestamp(path, default=None):
-    try:
-        stat = os.stat(path)
-        return stat.st_mtime
-    except OSError:
-        if default is None:
-            raise FreezeError("cannot stat {}".format(path))
-        return default
-
-
 def mkdir(filename):
     path = os.path.dirname(filename)
     if not os.path.isdir(path):
         os.makedirs(path)
 
 
+def hash_file(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def hash_values(*values):
+    # Combine the given values (strings, numbers, None, or lists of these) into a key.
+    return hashlib.sha256(repr(values).encode()).hexdigest()
+
+
+# The build state records a key for each output, computed from the content of all of its
+# inputs, and an output is rebuilt when its key changes.  This is used instead of file
+# timestamps, which change on checkout and don't cover things like the mpy-cross flags.
+def load_build_state(path):
+    try:
+        with open(path) as f:
+            state = json.load(f)
+        if isinstance(state.get("mpy"), dict):
+            return state
+    except (OSError, ValueError, AttributeError):
+        pass
+    return {"mpy": {}, "output": None}
+
+
+def save_build_state(path, state):
+    mkdir(path)
+    with open(path + ".tmp", "w") as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+    os.replace(path + ".tmp", path)
+
+
+def get_jobs():
+    # Get the number of parallel jobs from the -j option passed to make, if any.  When
+    # not run by make, use all CPUs.
+    makeflags = os.getenv("MAKEFLAGS")
+    if makeflags is None:
+        return os.cpu_count() or 1
+    for flag in makeflags.split():
+        if flag in ("-j", "--jobs"):
+            # A -j without a number means no limit.
+            return os.cpu_count() or 1
+        for prefix in ("-j", "--jobs="):
+            if flag.startswith(prefix) and flag[len(prefix) :].isdigit():
+                return max(1, int(flag[len(prefix) :]))
+    return 1
+
+
+def compile_mpy(result, outfile, compiler):
+    # Compile a single .py file from the manifest to .mpy, returning any error message.
+    # Add __version__ to the end of the file before compiling.
+    with manifestfile.tagged_py_file(result.full_path, result.metadata) as tagged_path:
+        try:
+            data = compiler.compile(tagged_path, src_path=result.target_path, opt=result.opt)
+        except mpy_cross.CrossCompileError as ex:
+            return ex.args[0]
+    with open(outfile, "wb") as f:
+        f.write(data)
+    return None
+
+
+def compile_mpy_files(to_compile, mpy_cross_path, extra_args, jobs):
+    # Compile the given (result, outfile) pairs, returning a list of the error message
+    # (or None) for each one in order.  Each worker thread passes its files to its own
+    # mpy-cross process, so threads are enough to run them in parallel.
+    import threading
+
+    local = threading.local()
+    compilers = []
+
+    def compile_one(job):
+        compiler = getattr(local, "compiler", None)
+        if compiler is None:
+            compiler = mpy_cross.Compiler(mpy_cross=mpy_cross_path, extra_args=extra_args)
+            local.compiler = compiler
+            compilers.append(compiler)
+        return compile_mpy(job[0], job[1], compiler)
+
+    try:
+        if jobs <= 1 or len(to_compile) <= 1:
+            return [compile_one(job) for job in to_compile]
+
+        import concurrent.futures
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+            return list(executor.map(compile_one, to_compile))
+    finally:
+        for compiler in compilers:
+            compiler.close()
+
+
 # Formerly make-frozen.py.
 # This generates:
 # - MP_FROZEN_STR_NAMES macro
@@ -162,7 +240,9 @@ def main():
         print("mpy-cross not found at {}, please build it first".format(MPY_CROSS))
         sys.exit(1)
 
-    manifest = manifestfile.ManifestFile(manifestfile.MODE_FREEZE, VARS)
+    manifest = manifestfile.ManifestFile(
+        manifestfile.MODE_FREEZE, VARS, cache_dir=args.build_dir + "/manifest_cache"
+    )
 
     # Include top-level inputs, to generate the manifest
     for input_manifest in args.files:
@@ -172,10 +252,19 @@ def main():
             print('freeze error executing "{}": {}'.format(input_manifest, er.args[0]))
             sys.exit(1)
 
+    # Load the state of the previous build.
+    state_file = args.build_dir + "/frozen_mpy_state.json"
+    state = load_build_state(state_file)
+    old_mpy_keys = state["mpy"]
+    state["mpy"] = {}
+
+    # Each compiled .mpy depends on the mpy-cross binary and the flags passed to it.
+    mpy_cross_key = hash_values(hash_file(MPY_CROSS), args.mpy_cross_flags)
+
     # Process the manifest
     str_paths = []
     mpy_files = []
-    ts_newest = 0
+    mpy_to_compile = []
     for result in manifest.files():
         if result.kind == manifestfile.KIND_FREEZE_AS_STR:
             str_paths.append(
@@ -184,39 +273,54 @@ def main():
                     result.target_path,
                 )
             )
-            ts_outfile = result.timestamp
         elif result.kind == manifestfile.KIND_FREEZE_AS_MPY:
             outfile = "{}/frozen_mpy/{}.mpy".format(args.build_dir, result.target_path[:-3])
-            ts_outfile = get_timestamp(outfile, 0)
-            if result.timestamp >= ts_outfile:
+            # The version is included because it's added to the source by tagged_py_file().
+            key = hash_values(
+                hash_file(result.full_path),
+                result.target_path,
+                result.metadata.version,
+                result.opt,
+                mpy_cross_key,
+            )
+            state["mpy"][result.target_path] = key
+            if old_mpy_keys.get(result.target_path) != key or not os.path.exists(outfile):
                 print("MPY", result.target_path)
                 mkdir(outfile)
-                # Add __version__ to the end of the file before compiling.
-                with manifestfile.tagged_py_file(result.full_path, result.metadata) as tagged_path:
-                    try:
-                        mpy_cross.compile(
-                            tagged_path,
-                            dest=outfile,
-                            src_path=result.target_path,
-                            opt=result.opt,
-                            mpy_cross=MPY_CROSS,
-                            extra_args=args.mpy_cross_flags.split(),
-                        )
-                    except mpy_cross.CrossCompileError as ex:
-                        print("error compiling {}:".format(result.target_path))
-                        print(ex.args[0])
-                        raise SystemExit(1)
-                ts_outfile = get_timestamp(outfile)
+                mpy_to_compile.append((result, outfile))
             mpy_files.append(outfile)
         else:
             assert result.kind == manifestfile.KIND_FREEZE_MPY
             mpy_files.append(result.full_path)
-            ts_outfile = result.timestamp
-        ts_newest = max(ts_newest, ts_outfile)
+
+    # Compile the out-of-date .py files, in parallel.  Errors are reported in manifest
+    # order so the output is the same regardless of the order the compiles finish in.
+    errors = compile_mpy_files(mpy_to_compile, MPY_CROSS, args.mpy_cross_flags.split(), get_jobs())
+    for (result, outfile), error in zip(mpy_to_compile, errors):
+        if error is not None:
+            print("error compiling {}:".format(result.target_path))
+            print(error)
+            # Make sure this file is compiled again next time.
+            del state["mpy"][result.target_path]
+    if any(error is not None for error in errors):
+        save_build_state(state_file, state)
+        raise SystemExit(1)
+
+    # The output depends on the content of all the frozen files, and on mpy-tool.py, the
+    # flags passed to it and the qstrs in the firmware that it freezes against.
+    qstr_header = args.build_dir + "/genhdr/qstrdefs.preprocessed.h"
+    output_key = hash_values(
+        [(target_path, hash_file(full_path)) for full_path, target_path in str_paths],
+        [(mpy_file, hash_file(mpy_file)) for mpy_file in mpy_files],
+        hash_file(MPY_TOOL),
+        args.mpy_tool_flags,
+        hash_file(qstr_header) if mpy_files else None,
+    )
 
     # Check if output file needs generating
-    if ts_newest < get_timestamp(args.output, 0):
-        # No files are newer than output file so it does not need updating
+    if state["output"] == output_key and os.path.exists(args.output):
+        # None of the inputs have changed so it does not need updating
+        save_build_state(state_file, state)
         return
 
     # Freeze paths as strings
@@ -231,6 +335,9 @@ def main():
                 "-f",
                 "-q",
                 args.build_dir + "/genhdr/qstrdefs.preprocessed.h",
+                # Reuse the frozen code of modules that have not changed.
+                "--cache-dir",
+                args.build_dir + "/frozen_mpy_cache",
             ]
             + args.mpy_tool_flags.split()
             + mpy_files
@@ -263,6 +370,9 @@ def main():
         f.write(b"//\n// Content for MICROPY_MODULE_FROZEN_MPY\n//\n")
         f.write(output_mpy)
 
+    state["output"] = output_key
+    save_build_state(state_file, state)
+
 
 if __name__ == "__main__":
     main()
@@ -26,7 +26,10 @@
 # THE SOFTWARE.
 
 import contextlib
+import hashlib
+import json
 import os
+import pickle
 import sys
 import glob
 import tempfile
@@ -183,11 +186,14 @@ class IncludeOptions:
 
 
 class ManifestFile:
-    def __init__(self, mode, path_vars=None):
+    def __init__(self, mode, path_vars=None, cache_dir=None):
         # See MODE_* constants above.
         self._mode = mode
         # Path substitution variables.
         self._path_vars = path_vars or {}
+        # Directory in which to persist data between runs, eg the library indexes.
+        # This is made absolute because manifests are executed from their own directory.
+        self._cache_dir = os.path.abspath(cache_dir) if cache_dir else None
         # List of files (as ManifestFileResult) references by this manifest.
         self._manifest_files = []
         # List of PyPI dependencies (when mode=MODE_PYPROJECT).
@@ -200,6 +206,13 @@ class ManifestFile:
         self._libraries = {}
         # List of directories to search for packages.
         self._library_dirs = []
+        # Map of library path to its index of package name to package directory.
+        self._library_indexes = {}
+        # Inputs the evaluated manifests depended on, for the result cache: the hash of
+        # each manifest file read and the mtime of each directory searched.
+        self._deps = {"files": {}, "dirs": {}}
+        # Key of the result cache entry for the manifests executed so far.
+        self._result_key = None
         # Add default micropython-lib libraries if $(MPY_LIB_DIR) has been specified.
         if self._path_vars["MPY_LIB_DIR"]:
             for lib in BASE_LIBRARY_NAMES:
@@ -245,6 +258,11 @@ class ManifestFile:
         return self._pypi_dependencies
 
     def execute(self, manifest_file):
+        if self._cache_dir:
+            key = self._result_cache_key(manifest_file)
+            if self._load_result(key):
+                return
+
         if manifest_file.endswith(".py"):
             # Execute file from filesystem.
             self.include(manifest_file)
@@ -255,6 +273,110 @@ class ManifestFile:
             except Exception as er:
                 raise ManifestFileError("Error in manifest: {}".format(er))
 
+        if self._cache_dir:
+            self._save_result(key)
+
+    # The result of executing manifests is cached in the cache directory, so that a
+    # rebuild where nothing changed doesn't need to execute any manifest files or walk
+    # any directories.  A cached result is used if the content of every manifest file
+    # that was executed is the same, and none of the directories that files were
+    # searched for or added from have been modified.  Note that the timestamps of the
+    # files in a cached result are from when the manifests were executed.
+    def _result_cache_key(self, manifest_file):
+        # The result also depends on what was executed before, which is chained in via
+        # the key of the previous result, and on this file, so that a result computed
+        # by an older version of the manifest semantics is never used.
+        h = hashlib.sha256()
+        with open(__file__, "rb") as f:
+            h.update(f.read())
+        h.update(
+            json.dumps(
+                [
+                    self._result_key,
+                    self._mode,
+                    self._path_vars,
+                    self._libraries,
+                    self._library_dirs,
+                    manifest_file,
+                ],
+                sort_keys=True,
+            ).encode()
+        )
+        return h.hexdigest()
+
+    def _result_file(self, key):
+        return os.path.join(self._cache_dir, "manifest_{}.pickle".format(key[:16]))
+
+    def _record_file(self, path, data):
+        self._deps["files"][path] = hashlib.sha256(data.encode()).hexdigest()
+
+    def _record_dir(self, path):
+        if path not in self._deps["dirs"]:
+            self._deps["dirs"][path] = os.stat(path).st_mtime_ns
+
+    def _load_result(self, key):
+        try:
+            with open(self._result_file(key), "rb") as f:
+                data = pickle.load(f)
+            if data["key"] != key:
+                return False
+            deps = data["deps"]
+            for path, mtime in deps["dirs"].items():
+                if os.stat(path).st_mtime_ns != mtime:
+                    return False
+            for path, digest in deps["files"].items():
+                with open(path) as f:
+                    if hashlib.sha256(f.read().encode()).hexdigest() != digest:
+                        return False
+            (
+                manifest_files,
+                pypi_dependencies,
+                visited,
+                metadata,
+                libraries,
+                library_dirs,
+            ) = data["state"]
+        except Exception:
+            # Any problem with the cached result (including one written by a different
+            # version of this file) just means it isn't used.
+            return False
+        self._manifest_files = manifest_files
+        self._pypi_dependencies = pypi_dependencies
+        self._visited = visited
+        self._metadata = metadata
+        self._libraries = libraries
+        self._library_dirs = library_dirs
+        self._deps = deps
+        self._result_key = key
+        return True
+
+    def _save_result(self, key):
+        self._result_key = key
+        result_file = self._result_file(key)
+        state = (
+            self._manifest_files,
+            self._pypi_dependencies,
+            self._visited,
+            self._metadata,
+            self._libraries,
+            self._library_dirs,
+        )
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            # Builds may run concurrently and share the cache directory, so write to a
+            # unique temporary file and then move it into place.
+            fd, tmp_file = tempfile.mkstemp(dir=self._cache_dir, prefix=".tmp_")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump({"key": key, "deps": self._deps, "state": state}, f)
+                os.replace(tmp_file, result_file)
+            except:
+                os.unlink(tmp_file)
+                raise
+        except OSError:
+            # The result is only a cache, so it's fine if it can't be written.
+            pass
+
     def _add_file(self, full_path, target_path, kind=KIND_AUTO, opt=None):
         # Check file exists and get timestamp.
         try:
@@ -262,6 +384,8 @@ class ManifestFile:
             timestamp = stat.st_mtime
         except OSError:
             raise ManifestFileError("Cannot stat {}".format(full_path))
+        # Adding or removing the file changes the mtime of its directory.
+        self._record_dir(os.path.dirname(full_path))
 
         # Map the AUTO kinds to their actual kind based on mode and extension.
         _, ext = os.path.splitext(full_path)
@@ -303,6 +427,7 @@ class ManifestFile:
 
             # Find all candidate files.
             for dirpath, _, filenames in os.walk(package_path or ".", followlinks=True):
+                self._record_dir(os.path.abspath(dirpath))
                 for file in filenames:
                     file = os.path.relpath(os.path.join(dirpath, file), ".")
                     _, ext = os.path.splitext(file)
@@ -384,7 +509,9 @@ class ManifestFile:
                     prev_cwd = os.getcwd()
                     os.chdir(os.path.dirname(manifest_path))
                     try:
-                        exec(f.read(), self._manifest_globals(kwargs))
+                        source = f.read()
+                        self._record_file(manifest_path, source)
+                        exec(source, self._manifest_globals(kwargs))
                     finally:
                         os.chdir(prev_cwd)
             except ManifestIgnoreException:
@@ -399,12 +526,73 @@ class ManifestFile:
             if is_require:
                 self._metadata.pop()
 
+    def _library_index_file(self, library_path):
+        digest = hashlib.sha1(library_path.encode()).hexdigest()[:16]
+        return os.path.join(self._cache_dir, "library_index_{}.json".format(digest))
+
+    def _load_library_index(self, library_path):
+        # Load the persisted index for this library, if it is still valid.  Adding or
+        # removing a package changes the mtime of the directory it's in, so the index
+        # is valid if none of the directories in the library have been modified.
+        try:
+            with open(self._library_index_file(library_path)) as f:
+                data = json.load(f)
+            if data["path"] != library_path:
+                return None
+            for path, mtime in data["dirs"].items():
+                if os.stat(path).st_mtime_ns != mtime:
+                    return None
+            return data["index"], data["dirs"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _save_library_index(self, library_path, dirs, index):
+        index_file = self._library_index_file(library_path)
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            with open(index_file + ".tmp", "w") as f:
+                json.dump({"path": library_path, "dirs": dirs, "index": index}, f)
+            os.replace(index_file + ".tmp", index_file)
+        except OSError:
+            # The index is only a cache, so it's fine if it can't be written.
+            pass
+
+    def _library_index(self, library_path):
+        # Return the index of package name to package directory for the library.  This
+        # is built once by walking the library (or loaded from the cache directory),
+        # rather than walking the whole library for every require().
+        index = self._library_indexes.get(library_path)
+        if index is not None:
+            return index
+
+        if self._cache_dir:
+            index = self._load_library_index(library_path)
+            if index is not None:
+                index, dirs = index
+
+        if index is None:
+            dirs = {}
+            index = {}
+            for root, dirnames, filenames in os.walk(library_path):
+                dirs[root] = os.stat(root).st_mtime_ns
+                name = os.path.basename(root)
+                # The first package found with a given name is the one that is used.
+                if "manifest.py" in filenames and name not in index:
+                    index[name] = root
+            if self._cache_dir:
+                self._save_library_index(library_path, dirs, index)
+
+        # Which package require() finds depends on all of the library's directories.
+        self._deps["dirs"].update(dirs)
+        self._library_indexes[library_path] = index
+        return index
+
     def _require_from_path(self, library_path, name, version, extra_kwargs):
-        for root, dirnames, filenames in os.walk(library_path):
-            if os.path.basename(root) == name and "manifest.py" in filenames:
-                self.include(root, is_require=True, **extra_kwargs)
-                return True
-        return False
+        package_path = self._library_index(library_path).get(name)
+        if package_path is None:
+            return False
+        self.include(package_path, is_require=True, **extra_kwargs)
+        return True
 
     def require(self, name, version=None, pypi=None, library=None, **kwargs):
         """
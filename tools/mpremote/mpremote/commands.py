@@ -4,6 +4,7 @@ import hashlib
 import os
 import sys
 import tempfile
+import time
 import zlib
 
 import serial.tools.list_ports
@@ -43,6 +44,7 @@ def do_connect(state, args=None):
                 if p.vid is not None and p.pid is not None:
                     try:
                         state.transport = SerialTransport(p.device, baudrate=115200)
+                        state.transport.serial_number = p.serial_number
                         return
                     except TransportError as er:
                         if not er.args[0].startswith("failed to access"):
@@ -55,6 +57,7 @@ def do_connect(state, args=None):
             for p in serial.tools.list_ports.comports():
                 if p.serial_number == serial_number:
                     state.transport = SerialTransport(p.device, baudrate=115200)
+                    state.transport.serial_number = serial_number
                     return
             raise TransportError("no device with serial number {}".format(serial_number))
         else:
@@ -70,6 +73,41 @@ def do_connect(state, args=None):
         raise CommandError(msg)
 
 
+def do_reconnect(state, timeout=10):
+    """
+    Reconnect to the current device after its port has gone away, eg because
+    it was reset and re-enumerated on USB.  The device is looked for by its USB
+    serial number (if known, in case its port name changed) and otherwise by
+    its port name, retrying with an increasing delay until the timeout.
+    """
+    device_name = state.transport.device_name
+    serial_number = state.transport.serial_number
+    try:
+        state.transport.close()
+    except OSError:
+        pass
+    state.transport = None
+
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    while True:
+        dev = device_name
+        if serial_number is not None:
+            for p in serial.tools.list_ports.comports():
+                if p.serial_number == serial_number:
+                    dev = p.device
+                    break
+        try:
+            state.transport = SerialTransport(dev, baudrate=115200)
+            state.transport.serial_number = serial_number
+            return
+        except TransportError:
+            if time.monotonic() + delay > deadline:
+                raise CommandError("could not reconnect to {}".format(device_name))
+        time.sleep(delay)
+        delay = min(delay * 2, 1)
+
+
 def do_disconnect(state, _args=None):
     if not state.transport:
         return
@@ -377,6 +415,26 @@ def do_filesystem_tree(state, path, args):
     _tree_recursive(path)
 
 
+def do_filesystem_tail(state, path, args):
+    def notify(msg):
+        sys.stdout.flush()
+        print(f"tail: {path}: {msg}", file=sys.stderr)
+
+    if args.output is None:
+        state.transport.fs_tailfile(path, args.lines, args.force, notify=notify)
+        return
+
+    with open(args.output, "ab") as f:
+
+        def output_consumer(b):
+            f.write(b)
+            f.flush()
+
+        state.transport.fs_tailfile(
+            path, args.lines, args.force, data_consumer=output_consumer, notify=notify
+        )
+
+
 def do_filesystem(state, args):
     state.ensure_raw_repl()
     state.did_action()
@@ -384,8 +442,8 @@ def do_filesystem(state, args):
     command = args.command[0]
     paths = args.path
 
-    if command == "cat":
-        # Don't do verbose output for `cat` unless explicitly requested.
+    if command in ("cat", "tail"):
+        # Don't do verbose output for `cat` and `tail` unless explicitly requested.
         verbose = args.verbose is True
     else:
         verbose = args.verbose is not False
@@ -404,6 +462,11 @@ def do_filesystem(state, args):
         # leading ':' if the user included them.
         paths = [path[1:] if path.startswith(":") else path for path in paths]
 
+    if command == "tail" and args.force and len(paths) > 1:
+        raise CommandError("tail: -f can only follow a single file")
+    if command == "tail" and args.lines < 0:
+        raise CommandError("tail: number of lines can't be negative")
+
     # ls and tree implicitly lists the cwd.
     if command in ("ls", "tree") and not paths:
         paths = [""]
@@ -419,6 +482,8 @@ def do_filesystem(state, args):
 
             if command == "cat":
                 state.transport.fs_printfile(path)
+            elif command == "tail":
+                do_filesystem_tail(state, path, args)
             elif command == "ls":
                 for result in state.transport.fs_listdir(path):
                     print(
@@ -48,7 +48,15 @@ class ConsolePosix:
             return None
 
     def write(self, buf):
-        self.outfile.write(buf)
+        # The output file is unbuffered, so large writes may be partial.
+        buf = memoryview(buf)
+        while buf:
+            n = self.outfile.write(buf)
+            if n is None:
+                # Output would block, wait until it can be written to.
+                select.select([], [self.outfile], [])
+                continue
+            buf = buf[n:]
 
 
 class ConsoleWindows:
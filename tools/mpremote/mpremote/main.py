@@ -28,6 +28,7 @@ from .commands import (
     CommandError,
     do_connect,
     do_disconnect,
+    do_reconnect,
     do_edit,
     do_filesystem,
     do_mount,
@@ -42,6 +43,7 @@ from .commands import (
 )
 from .mip import do_mip
 from .repl import do_repl
+from .tracing import Tracer
 
 _PROG = "mpremote"
 
@@ -50,6 +52,12 @@ def do_sleep(state, args):
     time.sleep(args.ms[0])
 
 
+def do_trace(state, args):
+    state.tracer = Tracer(args.output)
+    if state.transport is not None:
+        state.tracer.attach(state.transport)
+
+
 def do_help(state, _args=None):
     def print_commands_help(cmds, help_key):
         max_command_len = max(len(cmd) for cmd in cmds.keys())
@@ -140,6 +148,12 @@ def argparse_repl():
         required=False,
         help="saves a copy of the REPL session to the specified path",
     )
+    cmd_parser.add_argument(
+        "--capture-raw",
+        type=str,
+        required=False,
+        help="saves the raw output from the device to the specified path",
+    )
     cmd_parser.add_argument(
         "--inject-code", type=str, required=False, help="code to be run when Ctrl-J is pressed"
     )
@@ -152,6 +166,20 @@ def argparse_repl():
     return cmd_parser
 
 
+def argparse_trace():
+    cmd_parser = argparse.ArgumentParser(
+        description="trace transport and command timing, and report it at exit"
+    )
+    cmd_parser.add_argument(
+        "--output",
+        "-o",
+        type=str,
+        required=False,
+        help="write a Chrome trace JSON file to the specified path (default is to print a summary)",
+    )
+    return cmd_parser
+
+
 def argparse_eval():
     cmd_parser = argparse.ArgumentParser(description="evaluate and print the string")
     cmd_parser.add_argument("expr", nargs=1, help="expression to execute")
@@ -194,14 +222,26 @@ def argparse_filesystem():
         "force",
         "f",
         False,
-        "force copy even if file is unchanged (for cp command only)",
+        "force copy even if file is unchanged (for cp command), or follow the file (for tail command)",
     )
     _bool_flag(
         cmd_parser,
         "verbose",
         "v",
         None,
-        "enable verbose output (defaults to True for all commands except cat)",
+        "enable verbose output (defaults to True for all commands except cat and tail)",
+    )
+    cmd_parser.add_argument(
+        "--lines",
+        "-n",
+        type=int,
+        default=10,
+        help="number of trailing lines to show (tail command only)",
+    )
+    cmd_parser.add_argument(
+        "--output",
+        "-o",
+        help="append the file contents to this local file (tail command only)",
     )
     size_group = cmd_parser.add_mutually_exclusive_group()
     size_group.add_argument(
@@ -222,7 +262,7 @@ def argparse_filesystem():
     cmd_parser.add_argument(
         "command",
         nargs=1,
-        help="filesystem command (e.g. cat, cp, sha256sum, ls, rm, rmdir, touch, tree)",
+        help="filesystem command (e.g. cat, cp, sha256sum, ls, rm, rmdir, tail, touch, tree)",
     )
     cmd_parser.add_argument("path", nargs="+", help="local and remote paths")
     return cmd_parser
@@ -355,6 +395,10 @@ _COMMANDS = {
         do_romfs,
         argparse_romfs,
     ),
+    "trace": (
+        do_trace,
+        argparse_trace,
+    ),
 }
 
 # Additional commands aliases.
@@ -376,6 +420,7 @@ _BUILTIN_COMMAND_EXPANSIONS = {
     "rm": "fs rm",
     "rmdir": "fs rmdir",
     "sha256sum": "fs sha256sum",
+    "tail": "fs tail",
     "touch": "fs touch",
     "tree": "fs tree",
     # Disk used/free.
@@ -423,6 +468,7 @@ for _v,_p in _ms:
     # Simple aliases.
     "--help": "help",
     "--version": "version",
+    "--trace": "trace",
 }
 
 # Add "a0", "a1", ..., "u0", "u1", ..., "c0", "c1", ... as aliases
@@ -531,6 +577,7 @@ def do_command_expansion(args):
 class State:
     def __init__(self):
         self.transport = None
+        self.tracer = None
         self._did_action = False
         self._auto_soft_reset = True
 
@@ -543,12 +590,22 @@ class State:
     def ensure_connected(self):
         if self.transport is None:
             do_connect(self)
+        if self.tracer is not None:
+            self.tracer.attach(self.transport)
 
     def ensure_raw_repl(self, soft_reset=None):
         self.ensure_connected()
         soft_reset = self._auto_soft_reset if soft_reset is None else soft_reset
         if soft_reset or not self.transport.in_raw_repl:
-            self.transport.enter_raw_repl(soft_reset=soft_reset)
+            try:
+                self.transport.enter_raw_repl(soft_reset=soft_reset)
+            except OSError:
+                # The port is no longer usable, most likely because the device
+                # was reset and re-enumerated on USB, so connect to it again.
+                do_reconnect(self)
+                if self.tracer is not None:
+                    self.tracer.attach(self.transport)
+                self.transport.enter_raw_repl(soft_reset=soft_reset)
             self._auto_soft_reset = False
 
     def ensure_friendly_repl(self):
@@ -611,7 +668,11 @@ def main():
             args = cmd_parser.parse_args(command_args)
 
             # Execute command.
-            handler_func(state, args)
+            if state.tracer is None:
+                handler_func(state, args)
+            else:
+                with state.tracer.span(cmd, "command"):
+                    handler_func(state, args)
 
             # Get any leftover unprocessed args.
             remaining_args = args.next_command + extra_args
@@ -634,3 +695,5 @@ def main():
         return 1
     finally:
         do_disconnect(state)
+        if state.tracer is not None:
+            state.tracer.finish()
@@ -1,58 +1,192 @@
+import os, re, threading, time
+
 from .console import Console, ConsolePosix
 
 from .transport import TransportError
 
 
+_NON_PRINTABLE = re.compile(rb"[^\x08\x09\x0a\x0d\x1b\x20-\x7e]")
+
+
+class DeviceReader:
+    """
+    Reads output from the device in a background thread, so that the device
+    is always serviced even while the console is slow to accept output.
+
+    Data is accumulated in a bounded buffer.  The consumer is woken (via
+    the `fd` pipe, or by polling `inWaiting`) once a newline is received,
+    the device goes quiet, or `flush_interval` seconds have passed, so
+    console writes are done in batches rather than a few bytes at a time.
+    If the buffer is full then reading from the device pauses until the
+    consumer catches up.
+
+    All serial access must be done while holding `lock`, which the reader
+    only holds while it is reading available data.
+    """
+
+    def __init__(self, transport, max_size=1 << 20, flush_interval=0.02, capture_file=None):
+        self.transport = transport
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.capture_file = capture_file
+        self.lock = threading.RLock()
+        self._cond = threading.Condition()
+        self._buf = bytearray()
+        self._signalled = False
+        self._pending_since = None
+        self._error = None
+        self._stop = False
+        self.fd, self._wakeup_fd = os.pipe()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._stop = True
+            self._cond.notify_all()
+        self._thread.join(1)
+        os.close(self.fd)
+        os.close(self._wakeup_fd)
+
+    def inWaiting(self):
+        if self._error is not None:
+            return 1
+        return len(self._buf) if self._signalled else 0
+
+    def read(self):
+        with self._cond:
+            if self._signalled:
+                os.read(self.fd, 1)
+                self._signalled = False
+            if self._error is not None:
+                raise self._error
+            data = bytes(self._buf)
+            self._buf.clear()
+            self._pending_since = None
+            self._cond.notify_all()
+        return data
+
+    def write(self, buf):
+        with self.lock:
+            self.transport.serial.write(buf)
+
+    def _signal(self):
+        # Must be called with self._cond held.
+        if not self._signalled:
+            self._signalled = True
+            os.write(self._wakeup_fd, b"\x00")
+
+    def _put(self, data):
+        if self.capture_file is not None:
+            self.capture_file.write(data)
+        with self._cond:
+            while len(self._buf) >= self.max_size and not self._stop:
+                self._cond.wait()
+            self._buf.extend(data)
+            t = time.monotonic()
+            if self._pending_since is None:
+                self._pending_since = t
+            if b"\n" in data or t - self._pending_since >= self.flush_interval:
+                self._signal()
+
+    def _wait_for_data(self, serial):
+        fd = getattr(serial, "fd", None)
+        if fd is not None and os.name != "nt":
+            import select
+
+            select.select([fd], [], [], self.flush_interval)
+        else:
+            time.sleep(0.005)
+
+    def _run(self):
+        try:
+            while not self._stop:
+                with self.lock:
+                    serial = self.transport.serial
+                    n = serial.inWaiting()
+                    data = serial.read(n) if n > 0 else None
+                if data:
+                    self._put(data)
+                    continue
+                # The device is quiet, so pass on whatever has been received.
+                with self._cond:
+                    if self._buf:
+                        self._signal()
+                if self.capture_file is not None:
+                    self.capture_file.flush()
+                self._wait_for_data(serial)
+        except Exception as er:
+            with self._cond:
+                if not self._stop:
+                    self._error = er
+                    self._signal()
+
+
+def _escape_non_printable(data):
+    return _NON_PRINTABLE.sub(lambda m: b"[%02x]" % m.group()[0], data)
+
+
 def do_repl_main_loop(
-    state, console_in, console_out_write, *, escape_non_printable, code_to_inject, file_to_inject
+    state,
+    console_in,
+    console_out_write,
+    *,
+    escape_non_printable,
+    code_to_inject,
+    file_to_inject,
+    capture_raw_file=None,
 ):
-    while True:
-        try:
-            console_in.waitchar(state.transport.serial)
+    reader = DeviceReader(state.transport, capture_file=capture_raw_file)
+
+    def reader_flush():
+        dev_data_in = reader.read()
+        if dev_data_in:
+            if escape_non_printable:
+                # Pass data through to the console, with escaping of non-printables.
+                dev_data_in = _escape_non_printable(dev_data_in)
+            console_out_write(dev_data_in)
+
+    reader.start()
+    try:
+        while True:
+            console_in.waitchar(reader)
             c = console_in.readchar()
             if c:
                 if c in (b"\x1d", b"\x18"):  # ctrl-] or ctrl-x, quit
                     break
                 elif c == b"\x04":  # ctrl-D
                     # special handling needed for ctrl-D if filesystem is mounted
-                    state.transport.write_ctrl_d(console_out_write)
+                    with reader.lock:
+                        reader_flush()
+                        state.transport.write_ctrl_d(console_out_write)
                 elif c == b"\x0a" and code_to_inject is not None:  # ctrl-j, inject code
-                    state.transport.serial.write(code_to_inject)
+                    reader.write(code_to_inject)
                 elif c == b"\x0b" and file_to_inject is not None:  # ctrl-k, inject script
-                    console_out_write(bytes("Injecting %s\r\n" % file_to_inject, "utf8"))
-                    state.transport.enter_raw_repl(soft_reset=False)
-                    with open(file_to_inject, "rb") as f:
-                        pyfile = f.read()
-                    try:
-                        state.transport.exec_raw_no_follow(pyfile)
-                    except TransportError as er:
-                        console_out_write(b"Error:\r\n")
-                        console_out_write(er)
-                    state.transport.exit_raw_repl()
+                    with reader.lock:
+                        reader_flush()
+                        console_out_write(bytes("Injecting %s\r\n" % file_to_inject, "utf8"))
+                        state.transport.enter_raw_repl(soft_reset=False)
+                        with open(file_to_inject, "rb") as f:
+                            pyfile = f.read()
+                        try:
+                            state.transport.exec_raw_no_follow(pyfile)
+                        except TransportError as er:
+                            console_out_write(b"Error:\r\n")
+                            console_out_write(er)
+                        state.transport.exit_raw_repl()
                 else:
-                    state.transport.serial.write(c)
-
-            n = state.transport.serial.inWaiting()
-            if n > 0:
-                dev_data_in = state.transport.serial.read(n)
-                if dev_data_in is not None:
-                    if escape_non_printable:
-                        # Pass data through to the console, with escaping of non-printables.
-                        console_data_out = bytearray()
-                        for c in dev_data_in:
-                            if c in (8, 9, 10, 13, 27) or 32 <= c <= 126:
-                                console_data_out.append(c)
-                            else:
-                                console_data_out.extend(b"[%02x]" % c)
-                    else:
-                        console_data_out = dev_data_in
-                    console_out_write(console_data_out)
-
-        except OSError as er:
-            if _is_disconnect_exception(er):
-                return True
-            else:
-                raise
+                    reader.write(c)
+
+            reader_flush()
+    except OSError as er:
+        if _is_disconnect_exception(er):
+            return True
+        else:
+            raise
+    finally:
+        reader.stop()
     return False
 
 
@@ -62,6 +196,7 @@ def do_repl(state, args):
 
     escape_non_printable = args.escape_non_printable
     capture_file = args.capture
+    capture_raw_file = args.capture_raw
     code_to_inject = args.inject_code
     file_to_inject = args.inject_file
 
@@ -72,6 +207,9 @@ def do_repl(state, args):
     if capture_file is not None:
         print('Capturing session to file "%s"' % capture_file)
         capture_file = open(capture_file, "wb")
+    if capture_raw_file is not None:
+        print('Capturing raw device output to file "%s"' % capture_raw_file)
+        capture_raw_file = open(capture_raw_file, "wb")
     if code_to_inject is not None:
         code_to_inject = bytes(code_to_inject.replace("\\n", "\r\n"), "utf8")
         print("Use Ctrl-J to inject", code_to_inject)
@@ -95,11 +233,14 @@ def do_repl(state, args):
             escape_non_printable=escape_non_printable,
             code_to_inject=code_to_inject,
             file_to_inject=file_to_inject,
+            capture_raw_file=capture_raw_file,
         )
     finally:
         console.exit()
         if capture_file is not None:
             capture_file.close()
+        if capture_raw_file is not None:
+            capture_raw_file.close()
 
 
 def _is_disconnect_exception(exception):
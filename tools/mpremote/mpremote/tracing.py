@@ -0,0 +1,135 @@
+# Records timing of transport-level events (serial reads and writes, raw REPL
+# handshakes, exec requests, stalls waiting for the device) and of each
+# mpremote command, and reports them at exit either as a summary table or as
+# a JSON file in the Chrome trace event format (viewable in about:tracing or
+# https://ui.perfetto.dev).
+
+import json, sys, threading, time
+
+
+class _Span:
+    def __init__(self, tracer, name, cat, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.tracer.add(self.name, self.cat, self.start, time.perf_counter(), **self.args)
+
+
+class Tracer:
+    def __init__(self, output=None):
+        self.output = output
+        self.events = []
+        self.t0 = time.perf_counter()
+        self._thread_ids = {}
+
+    def attach(self, transport):
+        if transport.tracer is not self:
+            transport.set_tracer(self)
+
+    def span(self, name, cat, **args):
+        # Use as a context manager; args may be updated (eg with the number of
+        # bytes transferred) before the span ends.
+        return _Span(self, name, cat, args)
+
+    def add(self, name, cat, start, end, **args):
+        tid = self._thread_ids.setdefault(threading.get_ident(), len(self._thread_ids) + 1)
+        self.events.append((name, cat, start, end, tid, args))
+
+    def write_chrome_trace(self, f):
+        trace_events = []
+        for name, cat, start, end, tid, args in self.events:
+            trace_events.append(
+                {
+                    "name": name,
+                    "cat": cat,
+                    "ph": "X",
+                    "ts": round((start - self.t0) * 1e6, 3),
+                    "dur": round((end - start) * 1e6, 3),
+                    "pid": 1,
+                    "tid": tid,
+                    "args": args,
+                }
+            )
+        json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f)
+
+    def print_summary(self, f):
+        totals = {}
+        for name, cat, start, end, _, args in self.events:
+            count, duration, num_bytes = totals.get((cat, name), (0, 0, 0))
+            totals[(cat, name)] = (
+                count + 1,
+                duration + end - start,
+                num_bytes + args.get("bytes", 0),
+            )
+        print(
+            "{:10} {:24} {:>8} {:>10} {:>10} {:>10}".format(
+                "category", "event", "count", "total ms", "mean ms", "bytes"
+            ),
+            file=f,
+        )
+        for (cat, name), (count, duration, num_bytes) in sorted(totals.items()):
+            print(
+                "{:10} {:24} {:8} {:10.1f} {:10.3f} {:10}".format(
+                    cat, name, count, duration * 1e3, duration * 1e3 / count, num_bytes
+                ),
+                file=f,
+            )
+        print("total elapsed: {:.1f} ms".format((time.perf_counter() - self.t0) * 1e3), file=f)
+
+    def finish(self):
+        if self.output is None:
+            self.print_summary(sys.stderr)
+        else:
+            with open(self.output, "w") as f:
+                self.write_chrome_trace(f)
+
+
+def traced(name):
+    # Decorator for transport methods, to record a span for each call when
+    # the transport has a tracer attached.
+    def decorator(f):
+        def wrapper(self, *args, **kwargs):
+            if self.tracer is None:
+                return f(self, *args, **kwargs)
+            with self.tracer.span(name, "transport"):
+                return f(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class TracingSerial:
+    """
+    Wraps a serial object and records the time spent in, and the amount of
+    data transferred by, each read and write.
+    """
+
+    def __init__(self, serial, tracer):
+        object.__setattr__(self, "_serial", serial)
+        object.__setattr__(self, "_tracer", tracer)
+
+    def __getattr__(self, name):
+        return getattr(self._serial, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._serial, name, value)
+
+    def read(self, n=1):
+        start = time.perf_counter()
+        data = self._serial.read(n)
+        self._tracer.add("read", "serial", start, time.perf_counter(), bytes=len(data))
+        return data
+
+    def write(self, data):
+        start = time.perf_counter()
+        n = self._serial.write(data)
+        self._tracer.add("write", "serial", start, time.perf_counter(), bytes=len(data))
+        return n
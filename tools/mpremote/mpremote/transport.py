@@ -76,17 +76,75 @@ def _convert_filesystem_error(e, info):
     return e
 
 
+# Helper functions used by the filesystem commands.  Each one is installed on
+# the device the first time it is needed, as an attribute of the _mpr class
+# which acts as a private namespace.  Subsequent uses in the same raw REPL
+# session just call it by name, so its source is only sent and compiled once.
+_device_helpers = {
+    "ls": "def ls(*s):\n import os\n for f in os.ilistdir(*s):print(repr(f),end=',')",
+    "stat": "def stat(p):\n import os\n return os.stat(p)",
+    "cat": (
+        "def cat(p,n):\n with open(p) as f:\n  while 1:\n"
+        "   b=f.read(n)\n   if not b:break\n   print(b,end='')"
+    ),
+    "ropen": "def ropen(p):\n global f,r\n f=open(p,'rb')\n r=f.read",
+    "wopen": "def wopen(p):\n global f,w\n f=open(p,'wb')\n w=f.write",
+    "hash": (
+        "def hash(p,a,n):\n"
+        " try:\n  import hashlib\n  h=getattr(hashlib,a)()\n except:\n  return\n"
+        " b=memoryview(bytearray(n))\n with open(p,'rb') as f:\n  while 1:\n"
+        "   k=f.readinto(b)\n   if not k:break\n   h.update(b[:k])\n"
+        " return h.digest()"
+    ),
+    # Bytes that are special to the raw REPL (0x04), the mount hook (0x18) and
+    # the escape byte itself (0x10) are sent as 0x10 followed by the byte XOR
+    # 0x10.  An unescaped 0x10 "R" pair indicates that the file was truncated
+    # or rotated.
+    "tail": (
+        "def tail(p,k,fl,c):\n import os,sys,time\n w=sys.stdout.buffer.write\n"
+        " def e(b):\n"
+        "  if b'\\x10' in b or b'\\x04' in b or b'\\x18' in b:\n"
+        "   b=b.replace(b'\\x10',b'\\x10\\x00').replace(b'\\x04',b'\\x10\\x14')"
+        ".replace(b'\\x18',b'\\x10\\x08')\n"
+        "  w(b)\n"
+        " f=open(p,'rb')\n try:\n  s=o=f.seek(0,2)\n"
+        "  if o and k:\n   f.seek(o-1)\n   k+=f.read(1)==b'\\n'\n"
+        "  while s and k:\n   a=max(s-c,0)\n   f.seek(a)\n   b=f.read(s-a)\n   i=len(b)\n"
+        "   while k:\n    i=b.rfind(b'\\n',0,i)\n    if i<0:break\n    k-=1\n"
+        "   s=a if k else a+i+1\n"
+        "  f.seek(s)\n"
+        "  while 1:\n   b=f.read(c)\n   if b:\n    e(b)\n    s+=len(b)\n    continue\n"
+        "   if not fl:break\n   time.sleep_ms(50)\n"
+        "   try:\n    z=os.stat(p)[6]\n   except OSError:\n    continue\n"
+        "   if z<s:\n    f.close()\n    f=open(p,'rb')\n    s=0\n    w(b'\\x10R')\n"
+        " finally:\n  f.close()"
+    ),
+}
+
+
 class Transport:
+    def helper(self, name):
+        """
+        Return the name to call the given device helper function by,
+        installing it on the device first if needed.
+        """
+        if name not in self.installed_helpers:
+            self.exec(
+                "try:\n _mpr\nexcept NameError:\n class _mpr:pass\n{}\n_mpr.{}={}\ndel {}".format(
+                    _device_helpers[name], name, name, name
+                )
+            )
+            self.installed_helpers.add(name)
+        return "_mpr." + name
+
     def fs_listdir(self, src=""):
         buf = bytearray()
 
         def repr_consumer(b):
             buf.extend(b.replace(b"\x04", b""))
 
-        cmd = "import os\nfor f in os.ilistdir(%s):\n print(repr(f), end=',')" % (
-            ("'%s'" % src) if src else ""
-        )
         try:
+            cmd = "%s(%s)" % (self.helper("ls"), ("'%s'" % src) if src else "")
             buf.extend(b"[")
             self.exec(cmd, data_consumer=repr_consumer)
             buf.extend(b"]")
@@ -100,8 +158,7 @@ class Transport:
 
     def fs_stat(self, src):
         try:
-            self.exec("import os")
-            return os.stat_result(self.eval("os.stat(%s)" % ("'%s'" % src)))
+            return os.stat_result(self.eval("%s('%s')" % (self.helper("stat"), src)))
         except TransportExecError as e:
             raise _convert_filesystem_error(e, src) from None
 
@@ -121,15 +178,68 @@ class Transport:
             return False
 
     def fs_printfile(self, src, chunk_size=256):
-        cmd = (
-            "with open('%s') as f:\n while 1:\n"
-            "  b=f.read(%u)\n  if not b:break\n  print(b,end='')" % (src, chunk_size)
-        )
         try:
+            cmd = "%s('%s',%u)" % (self.helper("cat"), src, chunk_size)
             self.exec(cmd, data_consumer=stdout_write_bytes)
         except TransportExecError as e:
             raise _convert_filesystem_error(e, src) from None
 
+    def fs_tailfile(
+        self, src, num_lines=10, follow=False, chunk_size=512, data_consumer=None, notify=None
+    ):
+        if data_consumer is None:
+            data_consumer = stdout_write_bytes
+        escape = False
+
+        def tail_consumer(b):
+            nonlocal escape
+            b = b.replace(b"\x04", b"")
+            out = bytearray()
+            i = 0
+            while i < len(b):
+                if escape:
+                    escape = False
+                    if b[i] == ord("R"):
+                        if out:
+                            data_consumer(bytes(out))
+                            out = bytearray()
+                        if notify:
+                            notify("file truncated")
+                    else:
+                        out.append(b[i] ^ 0x10)
+                    i += 1
+                j = b.find(b"\x10", i)
+                if j < 0:
+                    out.extend(b[i:])
+                    break
+                out.extend(b[i:j])
+                escape = True
+                i = j + 1
+            if out:
+                data_consumer(bytes(out))
+
+        try:
+            cmd = "%s('%s',%u,%u,%u)" % (
+                self.helper("tail"),
+                src,
+                num_lines,
+                follow,
+                chunk_size,
+            )
+            self.exec_raw_no_follow(cmd)
+            try:
+                ret, ret_err = self.follow(timeout=None, data_consumer=tail_consumer)
+            except KeyboardInterrupt:
+                # Stop the device-side loop and wait for it to finish, so the
+                # raw REPL is ready for any subsequent commands.
+                self.write_ctrl_c()
+                ret, ret_err = self.follow(timeout=None, data_consumer=tail_consumer)
+                ret_err = None
+            if ret_err:
+                raise TransportExecError(ret, ret_err.decode())
+        except TransportExecError as e:
+            raise _convert_filesystem_error(e, src) from None
+
     def fs_readfile(self, src, chunk_size=256, progress_callback=None):
         if progress_callback:
             src_size = self.fs_stat(src).st_size
@@ -137,7 +247,7 @@ class Transport:
         contents = bytearray()
 
         try:
-            self.exec("f=open('%s','rb')\nr=f.read" % src)
+            self.exec("%s('%s')" % (self.helper("ropen"), src))
             while True:
                 chunk = self.eval("r({})".format(chunk_size))
                 if not chunk:
@@ -157,7 +267,7 @@ class Transport:
             written = 0
 
         try:
-            self.exec("f=open('%s','wb')\nw=f.write" % dest)
+            self.exec("%s('%s')" % (self.helper("wopen"), dest))
             while data:
                 chunk = data[:chunk_size]
                 self.exec("w(" + repr(chunk) + ")")
@@ -195,17 +305,11 @@ class Transport:
 
     def fs_hashfile(self, path, algo, chunk_size=256):
         try:
-            self.exec("import hashlib\nh = hashlib.{algo}()".format(algo=algo))
-        except TransportExecError:
+            digest = self.eval("%s('%s','%s',%u)" % (self.helper("hash"), path, algo, chunk_size))
+        except TransportExecError as e:
+            raise _convert_filesystem_error(e, path) from None
+        if digest is None:
             # hashlib (or hashlib.{algo}) not available on device. Do the hash locally.
             data = self.fs_readfile(path, chunk_size=chunk_size)
             return getattr(hashlib, algo)(data).digest()
-        try:
-            self.exec(
-                "buf = memoryview(bytearray({chunk_size}))\nwith open('{path}', 'rb') as f:\n while True:\n  n = f.readinto(buf)\n  if n == 0:\n   break\n  h.update(buf if n == {chunk_size} else buf[:n])\n".format(
-                    chunk_size=chunk_size, path=path
-                )
-            )
-            return self.eval("h.digest()")
-        except TransportExecError as e:
-            raise _convert_filesystem_error(e, path) from None
+        return digest
@@ -35,12 +35,13 @@
 # Once the API is stabilised, the idea is that mpremote can be used both
 # as a command line tool and a library for interacting with devices.
 
-import ast, io, os, re, struct, sys, time
+import ast, io, os, re, select, struct, sys, time
 import serial
 import serial.tools.list_ports
 from errno import EPERM, ENOTTY
 from .console import VT_ENABLED
 from .transport import TransportError, TransportExecError, Transport
+from .tracing import TracingSerial, traced
 
 
 VID_SILICON_LABS = 0x10C4
@@ -51,9 +52,14 @@ class SerialTransport(Transport):
 
     def __init__(self, device, baudrate=115200, wait=0, exclusive=True, timeout=None):
         self.in_raw_repl = False
+        self.exec_in_progress = False
         self.use_raw_paste = True
         self.device_name = device
+        self.serial_number = None
         self.mounted = False
+        self._read_pending = b""
+        self.installed_helpers = set()
+        self.tracer = None
 
         # Set options, and exclusive if pyserial supports it
         serial_kwargs = {
@@ -105,6 +111,13 @@ class SerialTransport(Transport):
         if delayed:
             print("")
 
+    def set_tracer(self, tracer):
+        self.tracer = tracer
+        if self.mounted:
+            self.serial.orig_serial = TracingSerial(self.serial.orig_serial, tracer)
+        else:
+            self.serial = TracingSerial(self.serial, tracer)
+
     def close(self):
         # ESP Windows quirk: Prevent target from resetting when Windows clears DTR before RTS
         try:
@@ -136,16 +149,23 @@ class SerialTransport(Transport):
         assert isinstance(timeout_overall, (type(None), int, float))
 
         data = b""
+        stall_start = None
         begin_overall_s = begin_char_s = time.monotonic()
         while True:
+            if stall_start is not None and (
+                data.endswith(ending) or self._read_pending or self.serial.inWaiting() > 0
+            ):
+                self.tracer.add("stall", "transport", stall_start, time.perf_counter())
+                stall_start = None
             if data.endswith(ending):
                 break
-            elif self.serial.inWaiting() > 0:
-                new_data = self.serial.read(1)
+            elif self._read_pending or self.serial.inWaiting() > 0:
                 if data_consumer:
+                    new_data = self._read_available(ending)
                     data_consumer(new_data)
                     data = new_data
                 else:
+                    new_data = self._read_available(None)
                     data = data + new_data
                 begin_char_s = time.monotonic()
             else:
@@ -156,13 +176,63 @@ class SerialTransport(Transport):
                     and time.monotonic() >= begin_overall_s + timeout_overall
                 ):
                     break
-                time.sleep(0.01)
+                if self.tracer is not None and stall_start is None:
+                    stall_start = time.perf_counter()
+                self._wait_for_data(0.01)
+        if stall_start is not None:
+            self.tracer.add("stall", "transport", stall_start, time.perf_counter())
         return data
 
+    def _wait_for_data(self, timeout):
+        # Wait until the serial port has data, or the timeout expires.  Ports
+        # without a selectable file descriptor (eg on Windows) are polled.
+        fd = getattr(self.serial, "fd", None)
+        if fd is None or os.name == "nt":
+            time.sleep(timeout)
+        else:
+            select.select([fd], [], [], timeout)
+
+    def _read_available(self, ending):
+        # Without an ending, read a single byte.  With a (single byte) ending,
+        # read everything that is available up to and including the ending, so
+        # that bulk output is not handled one byte at a time.  Any data that
+        # was read past the ending is kept for the next call.
+        if self._read_pending:
+            buf = self._read_pending
+        elif ending is None:
+            return self.serial.read(1)
+        else:
+            buf = self.serial.read(self.serial.inWaiting())
+        n = 1
+        if ending is not None:
+            n = buf.find(ending) + 1 or len(buf)
+        self._read_pending = buf[n:]
+        return buf[:n]
+
+    @traced("enter raw REPL")
     def enter_raw_repl(self, soft_reset=True, timeout_overall=10):
+        if self.in_raw_repl and not self.exec_in_progress and not self.mounted:
+            # Fast path: the device is idle at the raw REPL prompt, so there
+            # is no need to interrupt it and re-enter the raw REPL.
+            if soft_reset:
+                self.serial.write(b"\x04")  # ctrl-D: soft reset
+                data = self.read_until(1, b"soft reboot\r\n", timeout_overall=timeout_overall)
+                if not data.endswith(b"soft reboot\r\n"):
+                    print(data)
+                    raise TransportError("could not enter raw repl")
+                data = self.read_until(
+                    1, b"raw REPL; CTRL-B to exit\r\n", timeout_overall=timeout_overall
+                )
+                if not data.endswith(b"raw REPL; CTRL-B to exit\r\n"):
+                    print(data)
+                    raise TransportError("could not enter raw repl")
+                self.installed_helpers = set()
+            return
+
         self.serial.write(b"\r\x03")  # ctrl-C: interrupt any running program
 
         # flush input (without relying on serial.flushInput())
+        self._read_pending = b""
         n = self.serial.inWaiting()
         while n > 0:
             self.serial.read(n)
@@ -194,11 +264,19 @@ class SerialTransport(Transport):
             raise TransportError("could not enter raw repl")
 
         self.in_raw_repl = True
+        self.exec_in_progress = False
+        # The device state is unknown (or was reset), so any helpers must be
+        # installed again before they are used.
+        self.installed_helpers = set()
+
+    def write_ctrl_c(self):
+        self.serial.write(b"\x03")
 
     def exit_raw_repl(self):
         self.serial.write(b"\r\x02")  # ctrl-B: enter friendly REPL
         self.in_raw_repl = False
 
+    @traced("exec wait")
     def follow(self, timeout, data_consumer=None):
         # wait for normal output
         data = self.read_until(1, b"\x04", timeout=timeout, data_consumer=data_consumer)
@@ -213,6 +291,7 @@ class SerialTransport(Transport):
         data_err = data_err[:-1]
 
         # return normal and error output
+        self.exec_in_progress = False
         return data, data_err
 
     def raw_paste_write(self, command_bytes):
@@ -250,12 +329,15 @@ class SerialTransport(Transport):
         if not data.endswith(b"\x04"):
             raise TransportError("could not complete raw paste: {}".format(data))
 
+    @traced("exec send")
     def exec_raw_no_follow(self, command):
         if isinstance(command, bytes):
             command_bytes = command
         else:
             command_bytes = bytes(command, encoding="utf8")
 
+        self.exec_in_progress = True
+
         # check we have a prompt
         data = self.read_until(1, b">")
         if not data.endswith(b">"):
@@ -392,6 +474,7 @@ class SerialTransport(Transport):
 
         # Clear state while board remounts, it will be re-set once mounted.
         self.mounted = False
+        self.installed_helpers = set()
         self.serial = self.serial.orig_serial
 
         # Provide a message about the remount.
@@ -0,0 +1,58 @@
+#!/bin/bash
+set -e
+
+# Creates a RAM disk to hold the test files.
+cat << EOF > "${TMP}/ramdisk.py"
+class RAMBlockDev:
+    def __init__(self, block_size, num_blocks):
+        self.block_size = block_size
+        self.data = bytearray(block_size * num_blocks)
+
+    def readblocks(self, block_num, buf):
+        for i in range(len(buf)):
+            buf[i] = self.data[block_num * self.block_size + i]
+
+    def writeblocks(self, block_num, buf):
+        for i in range(len(buf)):
+            self.data[block_num * self.block_size + i] = buf[i]
+
+    def ioctl(self, op, arg):
+        if op == 4: # get number of blocks
+            return len(self.data) // self.block_size
+        if op == 5: # get block size
+            return self.block_size
+
+import os
+
+bdev = RAMBlockDev(512, 50)
+os.VfsFat.mkfs(bdev)
+os.mount(bdev, '/ramdisk')
+os.chdir('/ramdisk')
+EOF
+
+echo -----
+$MPREMOTE run "${TMP}/ramdisk.py"
+
+echo -----
+printf "line 1\nline 2\nline 3\n" > "${TMP}/a.txt"
+$MPREMOTE resume cp "${TMP}/a.txt" :a.txt
+$MPREMOTE resume tail a.txt
+$MPREMOTE resume tail -n 1 :a.txt
+$MPREMOTE resume tail -n 0 :a.txt
+
+# Test tail writing to a local file.
+echo -----
+$MPREMOTE resume tail -n 2 -o "${TMP}/b.txt" :a.txt
+cat "${TMP}/b.txt"
+
+# Test tail of binary data containing bytes that are special to mpremote.
+echo -----
+printf "\x00\x04\x10\x18\x10R\n" > "${TMP}/c.bin"
+$MPREMOTE resume cp "${TMP}/c.bin" :c.bin
+$MPREMOTE resume tail -o "${TMP}/d.bin" :c.bin
+cmp "${TMP}/c.bin" "${TMP}/d.bin" && echo "binary OK"
+
+echo -----
+$MPREMOTE resume tail :missing.txt || echo "expect error"
+
+echo -----
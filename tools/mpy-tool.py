@@ -340,6 +340,10 @@ class Opcode:
     for i in range(MP_BC_BINARY_OP_MULTI_NUM):
         mapping[MP_BC_BINARY_OP_MULTI + i] = "BINARY_OP %d %s" % (i, mp_binary_op_method_name[i])
 
+    # Instances are created for every opcode when bytecode is decoded, so use slots to
+    # keep them small.  The target and line attributes are set after decoding.
+    __slots__ = ("offset", "fmt", "opcode_byte", "arg", "extra_arg", "target", "line")
+
     def __init__(self, offset, fmt, opcode_byte, arg, extra_arg):
         self.offset = offset
         self.fmt = fmt
@@ -369,10 +373,14 @@ def mp_encode_uint(val, signed=False):
     return encoded
 
 
+def mp_opcode_format(opcode):
+    return (0x000003A4 >> (2 * ((opcode) >> 4))) & 3
+
+
 def mp_opcode_decode(bytecode, ip):
     opcode = bytecode[ip]
     ip_start = ip
-    f = (0x000003A4 >> (2 * ((opcode) >> 4))) & 3
+    f = mp_opcode_format(opcode)
     ip += 1
     arg = None
     extra_arg = None
@@ -541,6 +549,8 @@ def extract_prelude(bytecode, ip):
 
 
 class QStrType:
+    __slots__ = ("str", "qstr_esc", "qstr_id")
+
     def __init__(self, str):
         self.str = str
         self.qstr_esc = qstrutil.qstr_escape(self.str)
@@ -551,22 +561,27 @@ class GlobalQStrList:
     def __init__(self):
         # Initialise global list of qstrs with static qstrs
         self.qstrs = [None]  # MP_QSTRnull should never be referenced
+        # Index of qstrs by their string value, which keeps the first of any duplicates
+        self.qstrs_by_str = {}
         for n in qstrutil.static_qstr_list:
-            self.qstrs.append(QStrType(n))
+            q = QStrType(n)
+            self.qstrs.append(q)
+            self.qstrs_by_str.setdefault(n, q)
 
     def add(self, s):
-        q = QStrType(s)
-        self.qstrs.append(q)
+        # Return the existing qstr if there is one, so each string is only added once
+        q = self.qstrs_by_str.get(s)
+        if q is None:
+            q = QStrType(s)
+            self.qstrs.append(q)
+            self.qstrs_by_str[s] = q
         return q
 
     def get_by_index(self, i):
         return self.qstrs[i]
 
     def find_by_str(self, s):
-        for q in self.qstrs:
-            if q is not None and q.str == s:
-                return q
-        return None
+        return self.qstrs_by_str.get(s)
 
 
 class MPFunTable:
@@ -583,6 +598,7 @@ class CompiledModule:
         arch_flags,
         qstr_table,
         obj_table,
+        obj_table_data,
         raw_code,
         qstr_table_file_offset,
         obj_table_file_offset,
@@ -596,6 +612,7 @@ class CompiledModule:
         self.arch_flags = arch_flags
         self.qstr_table = qstr_table
         self.obj_table = obj_table
+        self.obj_table_data = obj_table_data
         self.raw_code = raw_code
         self.qstr_table_file_offset = qstr_table_file_offset
         self.obj_table_file_offset = obj_table_file_offset
@@ -720,6 +737,11 @@ class CompiledModule:
     def freeze_constant_obj(self, obj_name, obj):
         global const_str_content, const_int_content, const_obj_content
 
+        # Refer to the single copy of a constant that is shared with other modules.
+        shared_ref = shared_const_objs.get(shared_const_obj_key(obj))
+        if shared_ref is not None:
+            return shared_ref
+
         if isinstance(obj, MPFunTable):
             return "&mp_fun_table"
         elif obj is None:
@@ -881,6 +903,29 @@ class RawCode(object):
         MP_CODE_NATIVE_ASM: "MP_CODE_NATIVE_ASM",
     }
 
+    # There is one instance per function in every module, so use slots to keep them
+    # small.  The children and native_data attributes are set by read_raw_code().
+    __slots__ = (
+        "qstr_table",
+        "fun_data",
+        "prelude_offset",
+        "code_kind",
+        "offset_prelude_size",
+        "offset_source_info",
+        "offset_line_info",
+        "offset_closure_info",
+        "offset_opcodes",
+        "prelude_signature",
+        "prelude_size",
+        "names",
+        "scope_flags",
+        "n_pos_args",
+        "simple_name",
+        "escaped_name",
+        "children",
+        "native_data",
+    )
+
     def __init__(self, parent_name, qstr_table, fun_data, prelude_offset, code_kind):
         self.qstr_table = qstr_table
         self.fun_data = fun_data
@@ -1076,6 +1121,8 @@ class RawCode(object):
 
 
 class RawCodeBytecode(RawCode):
+    __slots__ = ("obj_table",)
+
     def __init__(self, parent_name, qstr_table, obj_table, fun_data):
         self.obj_table = obj_table
         super(RawCodeBytecode, self).__init__(
@@ -1215,6 +1262,8 @@ class RawCodeBytecode(RawCode):
 
 
 class RawCodeNative(RawCode):
+    __slots__ = ("type_sig", "fun_data_attributes")
+
     def __init__(
         self,
         parent_name,
@@ -1276,7 +1325,7 @@ class RawCodeNative(RawCode):
             return
         print("  prelude:", self.prelude_signature)
         print("  args:", [self.qstr_table[i].str for i in self.names[1:]])
-        print("  line info:", fun_data[self.offset_line_info : self.offset_opcodes])
+        print("  line info:", bytes_cons(fun_data[self.offset_line_info : self.offset_opcodes]))
         ip = 0
         while ip < self.prelude_offset:
             sz = 16
@@ -1339,6 +1388,8 @@ class MPYSegment:
     OBJ = 2
     CODE = 3
 
+    __slots__ = ("kind", "name", "start", "end")
+
     def __init__(self, kind, name, start, end):
         self.kind = kind
         self.name = name
@@ -1347,26 +1398,47 @@ class MPYSegment:
 
 
 class MPYReader:
+    # The whole file is read into memory in one go and then decoded directly from
+    # that buffer.  Data returned by read_bytes() is a memoryview slice of the buffer,
+    # so that bytecode and machine code are not copied until they need to be.
     def __init__(self, filename, fileobj):
         self.filename = filename
-        self.fileobj = fileobj
+        self.data = bytes_cons(fileobj.read())
+        self.view = memoryview(self.data)
+        self.pos = 0
 
     def tell(self):
-        return self.fileobj.tell()
+        return self.pos
 
     def read_byte(self):
-        return bytes_cons(self.fileobj.read(1))[0]
+        try:
+            b = self.data[self.pos]
+        except IndexError:
+            raise MPYReadError(self.filename, "unexpected end of file")
+        self.pos += 1
+        return b
 
     def read_bytes(self, n):
-        return bytes_cons(self.fileobj.read(n))
+        pos = self.pos
+        if pos + n > len(self.data):
+            raise MPYReadError(self.filename, "unexpected end of file")
+        self.pos = pos + n
+        return self.view[pos : pos + n]
 
     def read_uint(self):
+        data = self.data
+        pos = self.pos
         i = 0
-        while True:
-            b = self.read_byte()
-            i = (i << 7) | (b & 0x7F)
-            if b & 0x80 == 0:
-                break
+        try:
+            while True:
+                b = data[pos]
+                pos += 1
+                i = (i << 7) | (b & 0x7F)
+                if b & 0x80 == 0:
+                    break
+        except IndexError:
+            raise MPYReadError(self.filename, "unexpected end of file")
+        self.pos = pos
         return i
 
 
@@ -1410,10 +1482,9 @@ def read_obj(reader, segments):
         if obj_type == MP_PERSISTENT_OBJ_STR:
             obj = str_cons(buf, "utf8")
             if len(obj) < PERSISTENT_STR_INTERN_THRESHOLD:
-                if not global_qstrs.find_by_str(obj):
-                    global_qstrs.add(obj)
+                global_qstrs.add(obj)
         elif obj_type == MP_PERSISTENT_OBJ_BYTES:
-            obj = buf
+            obj = bytes_cons(buf)
         elif obj_type == MP_PERSISTENT_OBJ_INT:
             obj = int(str_cons(buf, "ascii"), 10)
         elif obj_type == MP_PERSISTENT_OBJ_FLOAT:
@@ -1441,8 +1512,10 @@ def read_raw_code(reader, parent_name, qstr_table, obj_table, segments):
     if kind == MP_CODE_BYTECODE:
         # Create bytecode raw code.
         rc = RawCodeBytecode(parent_name, qstr_table, obj_table, fun_data)
+        rc.native_data = b""
     else:
         # Create native raw code.
+        native_data_offset = reader.tell()
         native_scope_flags = 0
         native_n_pos_args = 0
         native_type_sig = 0
@@ -1485,6 +1558,9 @@ def read_raw_code(reader, parent_name, qstr_table, obj_table, segments):
             native_type_sig,
         )
 
+        # Keep the encoded native-specific data so the raw code can be written out again.
+        rc.native_data = reader.view[native_data_offset : reader.tell()]
+
     # Add a segment for the raw code data.
     segments.insert(
         segments_len,
@@ -1512,7 +1588,7 @@ def read_mpy(filename):
         segments = []
 
         # Read and verify the header.
-        header = reader.read_bytes(4)
+        header = bytes_cons(reader.read_bytes(4))
         if header[0] != ord("M"):
             raise MPYReadError(filename, "not a valid .mpy file")
         if header[1] != config.MPY_VERSION:
@@ -1547,8 +1623,12 @@ def read_mpy(filename):
         # Read objects and construct object table.
         obj_table_file_offset = reader.tell()
         obj_table = []
+        obj_table_data = []
         for i in range(n_obj):
+            obj_start = reader.tell()
             obj_table.append(read_obj(reader, segments))
+            # Keep the encoded object, so identical objects can be found when merging.
+            obj_table_data.append(bytes_cons(reader.view[obj_start : reader.tell()]))
 
         # Compute the compiled-module escaped name.
         cm_escaped_name = qstr_table[0].str.replace("/", "_")[:-3]
@@ -1565,6 +1645,7 @@ def read_mpy(filename):
         arch_flags,
         qstr_table,
         obj_table,
+        obj_table_data,
         raw_code,
         qstr_table_file_offset,
         obj_table_file_offset,
@@ -1583,7 +1664,485 @@ def disassemble_mpy(compiled_modules):
         cm.disassemble()
 
 
-def freeze_mpy(firmware_qstr_idents, compiled_modules):
+# Opcodes that may allocate memory on the heap each time they run.
+OPCODES_ALLOC = (
+    Opcode.MP_BC_LOAD_ATTR,
+    Opcode.MP_BC_GET_ITER,
+    Opcode.MP_BC_BUILD_TUPLE,
+    Opcode.MP_BC_BUILD_LIST,
+    Opcode.MP_BC_BUILD_MAP,
+    Opcode.MP_BC_BUILD_SET,
+    Opcode.MP_BC_BUILD_SLICE,
+    Opcode.MP_BC_STORE_COMP,
+    Opcode.MP_BC_MAKE_FUNCTION,
+    Opcode.MP_BC_MAKE_FUNCTION_DEFARGS,
+    Opcode.MP_BC_MAKE_CLOSURE,
+    Opcode.MP_BC_MAKE_CLOSURE_DEFARGS,
+    Opcode.MP_BC_CALL_FUNCTION_VAR_KW,
+    Opcode.MP_BC_CALL_METHOD_VAR_KW,
+)
+
+
+def format_profile_opcode(rc, opcode):
+    name = Opcode.mapping[opcode.opcode_byte]
+    if opcode.fmt == MP_BC_FORMAT_QSTR:
+        name += " " + rc.qstr_table[opcode.arg].str
+    elif opcode.opcode_byte == Opcode.MP_BC_LOAD_CONST_OBJ:
+        name += " " + repr(rc.obj_table[opcode.arg])
+    elif opcode.fmt == MP_BC_FORMAT_VAR_UINT:
+        name += " %d" % opcode.arg
+    return name
+
+
+def profile_raw_code(rc, source_file, profile, results):
+    # Join the profile entry of a bytecode function with its opcodes, and add the
+    # function to results if it was executed.  Each opcode is assumed to run as many
+    # times as its line was entered, which is exact for straight-line code.
+    if rc.code_kind == MP_CODE_BYTECODE:
+        opcodes = decode_bytecode(memoryview(rc.fun_data)[rc.offset_opcodes :])
+        decode_lineinfo_opcodes(
+            memoryview(rc.fun_data)[rc.offset_line_info : rc.offset_closure_info], opcodes
+        )
+        entry = profile.pop((source_file, rc.simple_name.str, opcodes[0].line), None)
+        if entry is not None:
+            line_counts = {}
+            for line, count in entry["lines"].items():
+                line_counts[int(line)] = count
+
+            # Find the opcodes that are inside a loop, ie covered by a backwards jump.
+            in_loop = set()
+            for opcode in opcodes:
+                if opcode.fmt == MP_BC_FORMAT_OFFSET and opcode.target.offset <= opcode.offset:
+                    for other in opcodes:
+                        if opcode.target.offset <= other.offset <= opcode.offset:
+                            in_loop.add(other)
+
+            opcode_counts = {}
+            alloc_in_loop = []
+            total = 0
+            for opcode in opcodes:
+                count = line_counts.get(opcode.line, 0)
+                name = Opcode.mapping[opcode.opcode_byte].split()
+                # Group the opcodes with an encoded argument, but keep the operator.
+                name = " ".join(name[:1] + name[2:])
+                opcode_counts[name] = opcode_counts.get(name, 0) + count
+                total += count
+                if count and opcode in in_loop and opcode.opcode_byte in OPCODES_ALLOC:
+                    alloc_in_loop.append((count, opcode.line, format_profile_opcode(rc, opcode)))
+            results.append(
+                (total, rc, entry["calls"], opcodes, line_counts, opcode_counts, alloc_in_loop)
+            )
+
+    for child in rc.children:
+        profile_raw_code(child, source_file, profile, results)
+
+
+def profile_mpy(compiled_modules, profile_file, max_rows=10):
+    # Print a report of the hot paths in each executed function, from the profile
+    # written by tools/settrace_profile.py.
+    import json
+
+    with open(profile_file) as f:
+        profile = {}
+        for entry in json.load(f):
+            profile[(entry["file"], entry["name"], entry["firstlineno"])] = entry
+
+    results = []
+    for cm in compiled_modules:
+        profile_raw_code(cm.raw_code, cm.source_file.str, profile, results)
+    results.sort(key=lambda result: -result[0])
+
+    for total, rc, calls, opcodes, line_counts, opcode_counts, alloc_in_loop in results:
+        print(
+            "function %s (%s:%d): %d calls, ~%d opcodes executed"
+            % (rc.simple_name.str, rc.qstr_table[0].str, opcodes[0].line, calls, total)
+        )
+
+        print("  hot lines:")
+        print("  %8s %6s  %s" % ("count", "line", "opcodes"))
+        for line, count in sorted(line_counts.items(), key=lambda x: -x[1])[:max_rows]:
+            line_opcodes = [format_profile_opcode(rc, op) for op in opcodes if op.line == line]
+            print("  %8d %6d  %s" % (count, line, ", ".join(line_opcodes)))
+
+        print("  opcodes:")
+        for name, count in sorted(opcode_counts.items(), key=lambda x: -x[1])[:max_rows]:
+            if count:
+                print("  %8d  %s" % (count, name))
+
+        if alloc_in_loop:
+            print("  allocating opcodes in loops:")
+            alloc_in_loop.sort(key=lambda x: -x[0])
+            for count, line, name in alloc_in_loop[:max_rows]:
+                print("  %8d %6d  %s" % (count, line, name))
+        print()
+
+    # Any remaining entries for these modules don't match the code in the .mpy files.
+    source_files = set(cm.source_file.str for cm in compiled_modules)
+    unmatched = [key for key in profile if key[0] in source_files]
+    if unmatched:
+        print(
+            "warning: %d profiled functions not found, the profile may be out of date"
+            % len(unmatched)
+        )
+
+
+def stats_raw_code(rc, stats):
+    stats["raw_code"] += 1
+    if rc.code_kind == MP_CODE_BYTECODE:
+        stats["bytecode_size"] += len(rc.fun_data)
+    else:
+        stats["native_size"] += len(rc.fun_data)
+    for child in rc.children:
+        stats_raw_code(child, stats)
+
+
+def stats_mpy_file(filename):
+    # Return a dict of statistics about a single .mpy file.  The header fields are
+    # reported even if the file can't be loaded by this version of the tool, and any
+    # error is reported in the dict rather than raised.  This may run in a worker
+    # process forked by stats_mpy().
+    stats = {"file": filename, "compatible": False, "error": None}
+    try:
+        with open(filename, "rb") as f:
+            header = bytes_cons(f.read(4))
+        if len(header) < 4 or header[0] != ord("M"):
+            raise MPYReadError(filename, "not a valid .mpy file")
+        arch = (header[2] >> 2) & 0x2F
+        stats["version"] = header[1]
+        stats["sub_version"] = header[2] & 3 if arch != MP_NATIVE_ARCH_NONE else None
+        if arch == MP_NATIVE_ARCH_NONE:
+            stats["arch"] = None
+        elif arch < len(MP_NATIVE_ARCH_NAMES):
+            stats["arch"] = MP_NATIVE_ARCH_NAMES[arch].lower()
+        else:
+            stats["arch"] = arch
+        stats["small_int_bits"] = header[3]
+
+        # Each file is checked on its own, so may have any native architecture.
+        config.native_arch = MP_NATIVE_ARCH_NONE
+        cm = read_mpy(filename)
+
+        stats["compatible"] = True
+        stats["arch_flags"] = cm.arch_flags
+        stats["n_qstr"] = len(cm.qstr_table)
+        stats["n_obj"] = len(cm.obj_table)
+        stats["raw_code"] = 0
+        stats["bytecode_size"] = 0
+        stats["native_size"] = 0
+        stats_raw_code(cm.raw_code, stats)
+    except MPYReadError as er:
+        stats["error"] = er.msg
+    except Exception as er:
+        # A corrupt file can fail in many ways while being parsed, and each of them
+        # should be reported against that file without stopping the others.
+        stats["error"] = "%s: %s" % (type(er).__name__, er)
+    return stats
+
+
+def stats_mpy_files(paths, files, top_level=True):
+    # Expand any directories in the given paths, recursively, to the .mpy files within
+    # them.  Only os.listdir() and os.stat() are used so this also runs under MicroPython.
+    import os
+
+    for path in paths:
+        try:
+            is_dir = os.stat(path)[0] & 0o170000 == 0o040000
+        except OSError:
+            # Let stats_mpy_file() report the error.
+            is_dir = False
+        if is_dir:
+            names = sorted(os.listdir(path))
+            stats_mpy_files([path.rstrip("/") + "/" + name for name in names], files, False)
+        elif top_level or path.endswith(".mpy"):
+            files.append(path)
+
+
+def stats_mpy(paths, jobs=1):
+    # Print statistics about each .mpy file as a line of JSON, and return the number
+    # of files that had an error.
+    import json
+
+    files = []
+    stats_mpy_files(paths, files)
+
+    pool = None
+    if jobs > 1 and len(files) > 1:
+        try:
+            import multiprocessing
+
+            pool = multiprocessing.get_context("fork").Pool(jobs)
+        except (ImportError, AttributeError, ValueError):
+            pass
+
+    num_errors = 0
+    try:
+        if pool is None:
+            results = map(stats_mpy_file, files)
+        else:
+            chunksize = max(1, min(64, len(files) // (jobs * 4)))
+            results = pool.imap(stats_mpy_file, files, chunksize)
+        for stats in results:
+            if stats["error"] is not None:
+                num_errors += 1
+            print(json.dumps(stats))
+    finally:
+        if pool is not None:
+            pool.terminate()
+
+    return num_errors
+
+
+def shared_const_obj_key(obj):
+    # Return a key identifying a constant object that can be shared between modules, or
+    # None if the object does not need any ROM data of its own (eg a qstr or small int).
+    if is_str_type(obj):
+        if len(obj) and not global_qstrs.find_by_str(obj):
+            return ("str", obj)
+    elif is_bytes_type(obj):
+        if len(obj):
+            return ("bytes", obj)
+    elif isinstance(obj, float):
+        # Compare the bit pattern, so that eg 0.0 and -0.0 are different constants.
+        return ("float", struct.pack("<d", obj))
+    elif is_int_type(obj):
+        if not mp_small_int_fits(obj):
+            return ("int", obj)
+    return None
+
+
+def freeze_shared_constants(compiled_modules):
+    # Output a single copy of each constant object that is used more than once, within
+    # a module or across modules, and record in shared_const_objs how modules refer to
+    # it.  Returns a list of (number of uses, byte size) for each shared constant.
+    global shared_const_objs
+    shared_const_objs = {}
+
+    # Count the uses of each constant, keeping them in order of first use so the output
+    # is deterministic.
+    uses = {}
+    ordered_keys = []
+
+    def add_obj(cm, obj):
+        if type(obj) is tuple:
+            for sub_obj in obj:
+                add_obj(cm, sub_obj)
+            return
+        key = shared_const_obj_key(obj)
+        if key is None:
+            pass
+        elif key in uses:
+            uses[key][2] += 1
+        else:
+            uses[key] = [cm, obj, 1]
+            ordered_keys.append(key)
+
+    for cm in compiled_modules:
+        for obj in cm.obj_table:
+            add_obj(cm, obj)
+
+    shared = []
+    for key in ordered_keys:
+        cm, obj, num_uses = uses[key]
+        if num_uses < 2:
+            continue
+        if not shared:
+            print()
+            print("// constants used more than once")
+        size = const_str_content + const_int_content + const_obj_content
+        shared_const_objs[key] = cm.freeze_constant_obj("const_shared_obj_%u" % len(shared), obj)
+        size = const_str_content + const_int_content + const_obj_content - size
+        shared.append((num_uses, size))
+    return shared
+
+
+def freeze_sizes():
+    # Return the values of the byte size counters that are accumulated per module.
+    return (
+        bc_content,
+        const_str_content,
+        const_int_content,
+        const_obj_content,
+        const_table_ptr_content,
+        raw_code_count,
+        raw_code_content,
+    )
+
+
+def freeze_size_report(compiled_modules, module_sizes, new_qstrs, shared_consts):
+    # Print the ROM size of each module, broken down by kind of data.  New qstrs are
+    # counted against the first module that uses them.
+    qstr_sizes = {}
+    for _, qstr_esc, _, qbytes in new_qstrs:
+        qstr_sizes[qstr_esc] = (
+            config.MICROPY_QSTR_BYTES_IN_HASH + config.MICROPY_QSTR_BYTES_IN_LEN + len(qbytes) + 1
+        )
+
+    rows = []
+    for cm, sizes in zip(compiled_modules, module_sizes):
+        qstr_size = 0
+        for q in cm.qstr_table:
+            qstr_size += qstr_sizes.pop(q.qstr_esc, 0)
+        bc, const_str, const_int, const_obj, const_table_ptr, _, raw_code = sizes
+        row = (
+            qstr_size,
+            len(cm.qstr_table) * 2 + const_table_ptr * 4,
+            bc,
+            const_str + const_int + const_obj,
+            raw_code,
+        )
+        rows.append((sum(row),) + row + (cm.source_file.str,))
+    rows.sort(key=lambda row: -row[0])
+
+    print()
+    print("size report:")
+    print(
+        "%8s %8s %8s %8s %8s %8s  %s"
+        % ("total", "qstrs", "tables", "bytecode", "consts", "raw code", "module")
+    )
+    for row in rows:
+        print("%8d %8d %8d %8d %8d %8d  %s" % row)
+    shared_size = 0
+    saved_size = 0
+    for num_uses, size in shared_consts:
+        shared_size += size
+        saved_size += (num_uses - 1) * size
+    print(
+        "shared constants: %d objects, %d bytes, %d bytes saved"
+        % (len(shared_consts), shared_size, saved_size)
+    )
+
+
+def freeze_module(idx):
+    # Freeze a single module and return its C code, along with the values of the
+    # byte size counters for that module.  This may run in a worker process forked
+    # by freeze_mpy(), in which case freeze_compiled_modules, the global qstrs and
+    # the shared constants are inherited from the parent.
+    global \
+        bc_content, \
+        const_str_content, \
+        const_int_content, \
+        const_obj_content, \
+        const_table_ptr_content, \
+        raw_code_count, \
+        raw_code_content
+    bc_content = 0
+    const_str_content = 0
+    const_int_content = 0
+    const_obj_content = 0
+    const_table_ptr_content = 0
+    raw_code_count = 0
+    raw_code_content = 0
+
+    stdout = sys.stdout
+    sys.stdout = io.StringIO()
+    try:
+        freeze_compiled_modules[idx].freeze(idx)
+        fragment = sys.stdout.getvalue()
+    except FreezeError as er:
+        # The exception refers to the raw code so can't be passed back as-is.
+        return None, er.msg
+    finally:
+        sys.stdout = stdout
+
+    return fragment, freeze_sizes()
+
+
+def freeze_modules_parallel(indices, jobs):
+    # Freeze the given modules using a pool of worker processes, and return the result
+    # of freeze_module() for each one in order.  Returns None if this is not possible,
+    # eg when running under MicroPython.
+    try:
+        import multiprocessing
+
+        # Workers need the state from reading the .mpy files, so must be forked.
+        ctx = multiprocessing.get_context("fork")
+    except (ImportError, AttributeError, ValueError):
+        return None
+
+    chunksize = max(1, len(indices) // (jobs * 4))
+    with ctx.Pool(jobs) as pool:
+        return pool.map(freeze_module, indices, chunksize)
+
+
+def freeze_cache_key(cm, base_key):
+    # The frozen code for a module depends on more than its .mpy file.  It also
+    # depends on the target config and version of this tool (hashed in base_key),
+    # the path of the .mpy file (which is printed in the output), the escaped names
+    # given to its raw code (which are unique across all modules), which of its str
+    # constants are qstrs in any of the modules, and which of its constants are
+    # shared with other modules.
+    import hashlib
+
+    h = hashlib.sha256(base_key)
+    h.update(bytes_cons(cm.mpy_source_file + "\n", "utf8"))
+    with open(cm.mpy_source_file, "rb") as f:
+        h.update(f.read())
+
+    def add_raw_code(rc):
+        h.update(bytes_cons(rc.escaped_name + "\n", "utf8"))
+        for child in rc.children:
+            add_raw_code(child)
+
+    def add_obj(obj):
+        if type(obj) is tuple:
+            for sub_obj in obj:
+                add_obj(sub_obj)
+        else:
+            if is_str_type(obj):
+                h.update(b"1" if global_qstrs.find_by_str(obj) else b"0")
+            shared_ref = shared_const_objs.get(shared_const_obj_key(obj), "")
+            h.update(bytes_cons(shared_ref + "\n", "utf8"))
+
+    add_raw_code(cm.raw_code)
+    for obj in cm.obj_table:
+        add_obj(obj)
+    return str_cons(hexlify(h.digest()), "ascii")
+
+
+def freeze_cache_load(compiled_modules, cache_dir, results):
+    # Fill in results with the frozen code for each module that is in the cache and
+    # still valid, and return the cache keys of all modules.
+    import hashlib, json
+
+    with open(__file__, "rb") as f:
+        base_key = hashlib.sha256(f.read()).digest()
+    base_key += bytes_cons(
+        repr(
+            (
+                config.MICROPY_QSTR_BYTES_IN_HASH,
+                config.MICROPY_LONGINT_IMPL,
+                config.MPZ_DIG_SIZE,
+                config.native_arch,
+                config.optimize,
+            )
+        ),
+        "ascii",
+    )
+
+    cache_keys = []
+    for idx, cm in enumerate(compiled_modules):
+        key = freeze_cache_key(cm, base_key)
+        cache_keys.append(key)
+        try:
+            with open(cache_dir + "/" + cm.escaped_name + ".json") as f:
+                entry = json.load(f)
+            if entry["key"] == key:
+                results[idx] = (entry["code"], tuple(entry["sizes"]))
+        except (OSError, ValueError, KeyError):
+            pass
+    return cache_keys
+
+
+def freeze_cache_save(cm, cache_dir, key, result):
+    import json, os
+
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir)
+    with open(cache_dir + "/" + cm.escaped_name + ".json", "w") as f:
+        json.dump({"key": key, "code": result[0], "sizes": result[1]}, f)
+
+
+def freeze_mpy(firmware_qstr_idents, compiled_modules, jobs=1, cache_dir=None, size_report=False):
     # add to qstrs
     new = {}
     for q in global_qstrs.qstrs:
@@ -1692,9 +2251,54 @@ def freeze_mpy(firmware_qstr_idents, compiled_modules):
     print("    },")
     print("};")
 
+    # Identical constants, in the same or different modules, are only frozen once.
+    shared_consts = freeze_shared_constants(compiled_modules)
+    shared_consts_sizes = freeze_sizes()
+
     # Freeze all modules.
-    for idx, cm in enumerate(compiled_modules):
-        cm.freeze(idx)
+    global freeze_compiled_modules
+    freeze_compiled_modules = compiled_modules
+    if jobs <= 1 and cache_dir is None:
+        module_sizes = []
+        for idx, cm in enumerate(compiled_modules):
+            sizes_before = freeze_sizes()
+            cm.freeze(idx)
+            module_sizes.append([b - a for a, b in zip(sizes_before, freeze_sizes())])
+    else:
+        # Each module is frozen independently, so the frozen code for each one can be
+        # taken from the cache or generated by worker processes, then printed in order.
+        results = [None] * len(compiled_modules)
+        if cache_dir is not None:
+            cache_keys = freeze_cache_load(compiled_modules, cache_dir, results)
+        missing = [idx for idx, result in enumerate(results) if result is None]
+        frozen = None
+        if jobs > 1 and len(missing) > 1:
+            frozen = freeze_modules_parallel(missing, min(jobs, len(missing)))
+        if frozen is None:
+            frozen = [freeze_module(idx) for idx in missing]
+        for idx, result in zip(missing, frozen):
+            if result[0] is None:
+                raise FreezeError(compiled_modules[idx], result[1])
+            results[idx] = result
+            if cache_dir is not None:
+                freeze_cache_save(compiled_modules[idx], cache_dir, cache_keys[idx], result)
+        # Start from the sizes of the shared constants, then add those of each module.
+        sizes = list(shared_consts_sizes)
+        module_sizes = []
+        for fragment, fragment_sizes in results:
+            print(fragment, end="")
+            module_sizes.append(fragment_sizes)
+            for i, size in enumerate(fragment_sizes):
+                sizes[i] += size
+        (
+            bc_content,
+            const_str_content,
+            const_int_content,
+            const_obj_content,
+            const_table_ptr_content,
+            raw_code_count,
+            raw_code_content,
+        ) = sizes
 
     # Print separator, separating individual modules from global data structures.
     print()
@@ -1770,11 +2374,13 @@ def freeze_mpy(firmware_qstr_idents, compiled_modules):
             + mp_frozen_mpy_content_size
         )
     )
+    if size_report:
+        freeze_size_report(compiled_modules, module_sizes, new, shared_consts)
     print("*/")
 
 
-def adjust_bytecode_qstr_obj_indices(bytecode_in, qstr_table_base, obj_table_base):
-    # Expand bytcode to a list of opcodes.
+def decode_bytecode(bytecode_in):
+    # Expand bytcode to a list of opcodes, with jump opcodes linked to their destination.
     opcodes = []
     labels = {}
     ip = 0
@@ -1785,26 +2391,26 @@ def adjust_bytecode_qstr_obj_indices(bytecode_in, qstr_table_base, obj_table_bas
         opcodes.append(opcode)
         ip += sz
         if fmt == MP_BC_FORMAT_OFFSET:
-            opcode.arg += ip
+            # The offset is relative to the end of the offset itself, which comes before
+            # any extra byte (UNWIND_JUMP has the number of handlers to unwind after it).
+            opcode.arg += ip - (extra_arg is not None)
 
     # Link jump opcodes to their destination.
     for opcode in opcodes:
         if opcode.fmt == MP_BC_FORMAT_OFFSET:
             opcode.target = labels[opcode.arg]
 
-    # Adjust bytcode as required.
-    for opcode in opcodes:
-        if opcode.fmt == MP_BC_FORMAT_QSTR:
-            opcode.arg += qstr_table_base
-        elif opcode.opcode_byte == Opcode.MP_BC_LOAD_CONST_OBJ:
-            opcode.arg += obj_table_base
+    return opcodes
+
 
-    # Write out new bytecode.
+def encode_bytecode(opcodes):
+    # Write out bytecode for a list of opcodes, iterating until all jump offsets are
+    # stable.  The offset of each opcode is updated to its position in the output.
     offset_changed = True
     while offset_changed:
         offset_changed = False
         overflow = False
-        bytecode_out = b""
+        bytecode_out = bytearray()
         for opcode in opcodes:
             ip = len(bytecode_out)
             if opcode.offset != ip:
@@ -1818,23 +2424,36 @@ def adjust_bytecode_qstr_obj_indices(bytecode_in, qstr_table_base, obj_table_bas
     if overflow:
         raise Exception("bytecode overflow")
 
-    return bytecode_out
+    return bytes_cons(bytecode_out)
+
+
+def adjust_bytecode_qstr_obj_indices(bytecode_in, qstr_map, obj_map):
+    opcodes = decode_bytecode(bytecode_in)
+
+    # Adjust bytcode as required, mapping old qstr/obj table indices to new ones.
+    for opcode in opcodes:
+        if opcode.fmt == MP_BC_FORMAT_QSTR:
+            opcode.arg = qstr_map[opcode.arg]
+        elif opcode.opcode_byte == Opcode.MP_BC_LOAD_CONST_OBJ:
+            opcode.arg = obj_map[opcode.arg]
+
+    return encode_bytecode(opcodes)
 
 
-def rewrite_raw_code(rc, qstr_table_base, obj_table_base):
+def rewrite_raw_code(rc, qstr_map, obj_map):
     if rc.code_kind != MP_CODE_BYTECODE:
         raise Exception("can only rewrite bytecode")
 
     source_info = bytearray()
     for arg in rc.names:
-        source_info.extend(mp_encode_uint(qstr_table_base + arg))
+        source_info.extend(mp_encode_uint(qstr_map[arg]))
 
-    closure_info = rc.fun_data[rc.offset_closure_info : rc.offset_opcodes]
+    closure_info = bytes_cons(rc.fun_data[rc.offset_closure_info : rc.offset_opcodes])
 
     bytecode_in = memoryview(rc.fun_data)[rc.offset_opcodes :]
-    bytecode_out = adjust_bytecode_qstr_obj_indices(bytecode_in, qstr_table_base, obj_table_base)
+    bytecode_out = adjust_bytecode_qstr_obj_indices(bytecode_in, qstr_map, obj_map)
 
-    prelude_signature = rc.fun_data[: rc.offset_prelude_size]
+    prelude_signature = bytes_cons(rc.fun_data[: rc.offset_prelude_size])
     prelude_size = encode_prelude_size(len(source_info), len(closure_info))
 
     fun_data = prelude_signature + prelude_size + source_info + closure_info + bytecode_out
@@ -1845,17 +2464,548 @@ def rewrite_raw_code(rc, qstr_table_base, obj_table_base):
     if rc.children:
         output += mp_encode_uint(len(rc.children))
         for child in rc.children:
-            output += rewrite_raw_code(child, qstr_table_base, obj_table_base)
+            output += rewrite_raw_code(child, qstr_map, obj_map)
+
+    return output
+
+
+# Opcodes after which execution does not continue with the following opcode.
+OPCODES_NO_FALLTHROUGH = (
+    Opcode.MP_BC_JUMP,
+    Opcode.MP_BC_RETURN_VALUE,
+    Opcode.MP_BC_RAISE_LAST,
+    Opcode.MP_BC_RAISE_OBJ,
+    Opcode.MP_BC_RAISE_FROM,
+)
+
+# Opcodes that push a value on the stack and have no other effect.
+OPCODES_PURE_PUSH = (
+    Opcode.MP_BC_LOAD_CONST_FALSE,
+    Opcode.MP_BC_LOAD_CONST_NONE,
+    Opcode.MP_BC_LOAD_CONST_TRUE,
+    Opcode.MP_BC_LOAD_CONST_SMALL_INT,
+    Opcode.MP_BC_LOAD_CONST_STRING,
+    Opcode.MP_BC_LOAD_CONST_OBJ,
+    Opcode.MP_BC_DUP_TOP,
+)
+
+
+def opcode_small_int(opcode):
+    # Return the value loaded by a LOAD_CONST_SMALL_INT opcode, or None for other opcodes.
+    i = opcode.opcode_byte - Opcode.MP_BC_LOAD_CONST_SMALL_INT_MULTI
+    if 0 <= i < Opcode.MP_BC_LOAD_CONST_SMALL_INT_MULTI_NUM:
+        return i - Opcode.MP_BC_LOAD_CONST_SMALL_INT_MULTI_EXCESS
+    if opcode.opcode_byte == Opcode.MP_BC_LOAD_CONST_SMALL_INT:
+        return opcode.arg
+    return None
+
+
+def opcode_const_truth(opcode):
+    # Return the truth value of the constant loaded by an opcode, or None if unknown.
+    if opcode.opcode_byte == Opcode.MP_BC_LOAD_CONST_TRUE:
+        return True
+    if opcode.opcode_byte in (Opcode.MP_BC_LOAD_CONST_FALSE, Opcode.MP_BC_LOAD_CONST_NONE):
+        return False
+    value = opcode_small_int(opcode)
+    if value is None:
+        return None
+    return value != 0
+
+
+def opcode_local_num(opcode, multi, multi_num, opcode_n):
+    i = opcode.opcode_byte - multi
+    if 0 <= i < multi_num:
+        return i
+    if opcode.opcode_byte == opcode_n:
+        return opcode.arg
+    return None
+
+
+def set_opcode(opcode, opcode_byte, arg=None):
+    opcode.opcode_byte = opcode_byte
+    opcode.fmt = mp_opcode_format(opcode_byte)
+    opcode.arg = arg
+    opcode.extra_arg = None
+
+
+def set_opcode_const(opcode, value):
+    # Change an opcode to load the given bool or small int constant.
+    if value is True:
+        set_opcode(opcode, Opcode.MP_BC_LOAD_CONST_TRUE)
+    elif value is False:
+        set_opcode(opcode, Opcode.MP_BC_LOAD_CONST_FALSE)
+    elif (
+        -Opcode.MP_BC_LOAD_CONST_SMALL_INT_MULTI_EXCESS
+        <= value
+        < Opcode.MP_BC_LOAD_CONST_SMALL_INT_MULTI_NUM
+        - Opcode.MP_BC_LOAD_CONST_SMALL_INT_MULTI_EXCESS
+    ):
+        set_opcode(
+            opcode,
+            Opcode.MP_BC_LOAD_CONST_SMALL_INT_MULTI
+            + value
+            + Opcode.MP_BC_LOAD_CONST_SMALL_INT_MULTI_EXCESS,
+        )
+    else:
+        set_opcode(opcode, Opcode.MP_BC_LOAD_CONST_SMALL_INT, value)
+
+
+def fold_unary_op(op, a):
+    # Return the result of a unary operation on a small int, or None if it can't be folded.
+    if op == 0:  # __pos__
+        return a
+    elif op == 1:  # __neg__
+        return -a
+    elif op == 2:  # __invert__
+        return ~a
+    else:  # <not>
+        return not a
+
+
+def fold_binary_op(op, a, b):
+    # Return the result of a binary operation on two small ints, or None if it can't be
+    # folded, eg because it would raise an exception or give a float or big int.
+    if op >= 22:
+        # Use the in-place version of the operation, which is the same for ints.
+        op -= 13
+    if op == 0:
+        return a < b
+    elif op == 1:
+        return a > b
+    elif op == 2:
+        return a == b
+    elif op == 3:
+        return a <= b
+    elif op == 4:
+        return a >= b
+    elif op == 5:
+        return a != b
+    elif op == 9:
+        return a | b
+    elif op == 10:
+        return a ^ b
+    elif op == 11:
+        return a & b
+    elif op == 12 and 0 <= b <= 16:
+        return a << b
+    elif op == 13 and b >= 0:
+        return a >> b
+    elif op == 14:
+        return a + b
+    elif op == 15:
+        return a - b
+    elif op == 16:
+        return a * b
+    elif op == 18 and b != 0:
+        return a // b
+    elif op == 20 and b != 0:
+        return a % b
+    elif op == 21 and 0 <= b <= 16 and -16 <= a <= 16:
+        return a**b
+    return None
+
+
+def jump_targets(opcodes):
+    return set(opcode.target for opcode in opcodes if opcode.fmt == MP_BC_FORMAT_OFFSET)
+
+
+def remove_opcodes(opcodes, start, end):
+    # Remove opcodes[start:end], and make any jumps to them go to the following opcode.
+    removed = set(opcodes[start:end])
+    following = opcodes[end]
+    del opcodes[start:end]
+    for opcode in opcodes:
+        if opcode.fmt == MP_BC_FORMAT_OFFSET and opcode.target in removed:
+            opcode.target = following
+
+
+def optimize_fold(opcodes):
+    # Fold constant expressions and branches, and remove values pushed only to be popped.
+    # Opcodes that are removed, other than the first in a sequence, must not be jump
+    # targets, and there must be an opcode following the sequence.
+    changed = False
+    targets = jump_targets(opcodes)
+    i = 0
+    while i < len(opcodes) - 2:
+        opcode = opcodes[i]
+        next1 = opcodes[i + 1]
+        next2 = opcodes[i + 2]
+        a = opcode_small_int(opcode)
+        b = opcode_small_int(next1)
+        unary_op = next1.opcode_byte - Opcode.MP_BC_UNARY_OP_MULTI
+        binary_op = next2.opcode_byte - Opcode.MP_BC_BINARY_OP_MULTI
+        truth = opcode_const_truth(opcode)
+        result = None
+        if a is not None and next1 not in targets:
+            if (
+                b is not None
+                and 0 <= binary_op < Opcode.MP_BC_BINARY_OP_MULTI_NUM
+                and next2 not in targets
+                and i + 3 < len(opcodes)
+            ):
+                result = fold_binary_op(binary_op, a, b)
+                remove_end = i + 3
+            elif 0 <= unary_op < Opcode.MP_BC_UNARY_OP_MULTI_NUM:
+                result = fold_unary_op(unary_op, a)
+                remove_end = i + 2
+        if result is not None and (type(result) is bool or mp_small_int_fits(result)):
+            set_opcode_const(opcode, result)
+            remove_opcodes(opcodes, i + 1, remove_end)
+        elif (
+            truth is not None
+            and next1.opcode_byte
+            in (Opcode.MP_BC_POP_JUMP_IF_TRUE, Opcode.MP_BC_POP_JUMP_IF_FALSE)
+            and next1 not in targets
+            and next1.target is not next1
+        ):
+            if truth == (next1.opcode_byte == Opcode.MP_BC_POP_JUMP_IF_TRUE):
+                # The branch is always taken.
+                set_opcode(opcode, Opcode.MP_BC_JUMP)
+                opcode.target = next1.target
+                remove_opcodes(opcodes, i + 1, i + 2)
+            else:
+                # The branch is never taken.
+                remove_opcodes(opcodes, i, i + 2)
+        elif (
+            (opcode.opcode_byte in OPCODES_PURE_PUSH or a is not None)
+            and next1.opcode_byte == Opcode.MP_BC_POP_TOP
+            and next1 not in targets
+        ):
+            remove_opcodes(opcodes, i, i + 2)
+        elif opcode.opcode_byte == Opcode.MP_BC_JUMP and opcode.target is next1:
+            remove_opcodes(opcodes, i, i + 1)
+        else:
+            i += 1
+            continue
+        changed = True
+        targets = jump_targets(opcodes)
+    return changed
+
+
+def optimize_jumps(opcodes):
+    # Make jumps that go to an unconditional jump go straight to its destination.
+    changed = False
+    for opcode in opcodes:
+        if opcode.opcode_byte in (
+            Opcode.MP_BC_JUMP,
+            Opcode.MP_BC_POP_JUMP_IF_TRUE,
+            Opcode.MP_BC_POP_JUMP_IF_FALSE,
+        ):
+            target = opcode.target
+            seen = set()
+            while target.opcode_byte == Opcode.MP_BC_JUMP and target not in seen:
+                seen.add(target)
+                target = target.target
+            if target is not opcode.target:
+                opcode.target = target
+                changed = True
+    return changed
+
+
+def optimize_unreachable(opcodes):
+    # Remove opcodes that can't be reached from the start of the function.  Exception
+    # handlers are reached by the jump of the opcode that sets them up.
+    index = {}
+    for i, opcode in enumerate(opcodes):
+        index[opcode] = i
+    reachable = set()
+    pending = [0]
+    while pending:
+        i = pending.pop()
+        while i < len(opcodes) and i not in reachable:
+            reachable.add(i)
+            opcode = opcodes[i]
+            if opcode.fmt == MP_BC_FORMAT_OFFSET:
+                pending.append(index[opcode.target])
+            if opcode.opcode_byte in OPCODES_NO_FALLTHROUGH:
+                break
+            i += 1
+    if len(reachable) == len(opcodes):
+        return False
+    opcodes[:] = [opcode for i, opcode in enumerate(opcodes) if i in reachable]
+    return True
+
+
+def optimize_dead_stores(opcodes, cell_locals):
+    # Replace stores to local variables that are never loaded with a POP_TOP.  Deleting
+    # a local counts as a load, because it raises an exception if the local is unbound.
+    used = set(cell_locals)
+    for opcode in opcodes:
+        if opcode.opcode_byte in (
+            Opcode.MP_BC_DELETE_FAST,
+            Opcode.MP_BC_LOAD_DEREF,
+            Opcode.MP_BC_STORE_DEREF,
+            Opcode.MP_BC_DELETE_DEREF,
+        ):
+            used.add(opcode.arg)
+        else:
+            used.add(
+                opcode_local_num(
+                    opcode,
+                    Opcode.MP_BC_LOAD_FAST_MULTI,
+                    Opcode.MP_BC_LOAD_FAST_MULTI_NUM,
+                    Opcode.MP_BC_LOAD_FAST_N,
+                )
+            )
+    changed = False
+    for opcode in opcodes:
+        local_num = opcode_local_num(
+            opcode,
+            Opcode.MP_BC_STORE_FAST_MULTI,
+            Opcode.MP_BC_STORE_FAST_MULTI_NUM,
+            Opcode.MP_BC_STORE_FAST_N,
+        )
+        if local_num is not None and local_num not in used:
+            set_opcode(opcode, Opcode.MP_BC_POP_TOP)
+            changed = True
+    return changed
+
+
+def decode_lineinfo_opcodes(line_info, opcodes):
+    # Set the source line number of each opcode from the encoded line info.
+    bc_offset = 0
+    source_line = 1
+    i = 0
+    while line_info:
+        bc_increment, line_increment, line_info = RawCode.decode_lineinfo(line_info)
+        bc_offset += bc_increment
+        while i < len(opcodes) and opcodes[i].offset < bc_offset:
+            opcodes[i].line = source_line
+            i += 1
+        source_line += line_increment
+    while i < len(opcodes):
+        opcodes[i].line = source_line
+        i += 1
+
+
+# See py/emitbc.c:emit_write_code_info_bytes_lines.
+def encode_lineinfo_opcodes(opcodes):
+    line_info = bytearray()
+    last_offset = 0
+    last_line = 1
+    for opcode in opcodes:
+        if opcode.line <= last_line:
+            continue
+        bytes_to_skip = opcode.offset - last_offset
+        lines_to_skip = opcode.line - last_line
+        while bytes_to_skip > 0 or lines_to_skip > 0:
+            if lines_to_skip <= 6 or bytes_to_skip > 0xF:
+                # Use 0b0LLBBBBB encoding.
+                b = min(bytes_to_skip, 0x1F)
+                if b < bytes_to_skip:
+                    l = 0
+                else:
+                    l = min(lines_to_skip, 0x3)
+                line_info.append(b | l << 5)
+            else:
+                # Use 0b1LLLBBBB 0bLLLLLLLL encoding.
+                b = min(bytes_to_skip, 0xF)
+                l = min(lines_to_skip, 0x7FF)
+                line_info.append(0x80 | b | (l >> 4) & 0x70)
+                line_info.append(l & 0xFF)
+            bytes_to_skip -= b
+            lines_to_skip -= l
+        last_offset = opcode.offset
+        last_line = opcode.line
+    return line_info
+
+
+def optimize_raw_code(rc):
+    # Optimise the bytecode of a raw code and its children, keeping the line info in sync.
+    if rc.code_kind == MP_CODE_BYTECODE:
+        opcodes = decode_bytecode(memoryview(rc.fun_data)[rc.offset_opcodes :])
+        decode_lineinfo_opcodes(
+            memoryview(rc.fun_data)[rc.offset_line_info : rc.offset_closure_info], opcodes
+        )
+        closure_info = bytes_cons(rc.fun_data[rc.offset_closure_info : rc.offset_opcodes])
+
+        changed = False
+        while True:
+            # Run all passes until none of them make any changes.
+            pass_changed = optimize_dead_stores(opcodes, closure_info)
+            pass_changed |= optimize_fold(opcodes)
+            pass_changed |= optimize_jumps(opcodes)
+            pass_changed |= optimize_unreachable(opcodes)
+            if not pass_changed:
+                break
+            changed = True
+
+        if changed:
+            bytecode = encode_bytecode(opcodes)
+            source_info = bytes_cons(rc.fun_data[rc.offset_source_info : rc.offset_line_info])
+            source_info += encode_lineinfo_opcodes(opcodes)
+            rc.fun_data = (
+                bytes_cons(rc.fun_data[: rc.offset_prelude_size])
+                + encode_prelude_size(len(source_info), len(closure_info))
+                + source_info
+                + closure_info
+                + bytecode
+            )
+            (
+                rc.offset_prelude_size,
+                rc.offset_source_info,
+                rc.offset_line_info,
+                rc.offset_closure_info,
+                rc.offset_opcodes,
+                rc.prelude_signature,
+                rc.prelude_size,
+                rc.names,
+            ) = extract_prelude(rc.fun_data, 0)
+
+    for child in rc.children:
+        optimize_raw_code(child)
+
+
+def write_raw_code(rc):
+    # Encode a raw code and its children in the same form as they are in a .mpy file.
+    output = mp_encode_uint(
+        len(rc.fun_data) << 3 | bool(len(rc.children)) << 2 | (rc.code_kind - MP_CODE_BYTECODE)
+    )
+    output += rc.fun_data
+    output += rc.native_data
+
+    if rc.children:
+        output += mp_encode_uint(len(rc.children))
+        for child in rc.children:
+            output += write_raw_code(child)
 
     return output
 
 
-def merge_mpy(compiled_modules, output_file):
+def merge_concat_tables(compiled_modules):
+    # Concatenate the qstr and object tables from all compiled modules, copied verbatim.
+    # Returns the number of qstrs and objects, the encoded tables, and for each module
+    # the new indices of its qstrs and objects.
+    n_qstr = 0
+    n_obj = 0
+    index_maps = []
+    for cm in compiled_modules:
+        index_maps.append(
+            (
+                list(range(n_qstr, n_qstr + len(cm.qstr_table))),
+                list(range(n_obj, n_obj + len(cm.obj_table))),
+            )
+        )
+        n_qstr += len(cm.qstr_table)
+        n_obj += len(cm.obj_table)
+
+    tables = bytearray()
+
+    def copy_section(file, offset, offset2):
+        with open(file, "rb") as f:
+            f.seek(offset)
+            tables.extend(f.read(offset2 - offset))
+
+    for cm in compiled_modules:
+        copy_section(cm.mpy_source_file, cm.qstr_table_file_offset, cm.obj_table_file_offset)
+    for cm in compiled_modules:
+        copy_section(cm.mpy_source_file, cm.obj_table_file_offset, cm.raw_code_file_offset)
+
+    return n_qstr, n_obj, tables, index_maps
+
+
+def merge_shared_tables(compiled_modules):
+    # Build a single qstr table and object table for all compiled modules, containing
+    # each distinct qstr and object once.  Entries are ordered by the number of uses,
+    # so the most used ones get the smallest (1-byte) indices, and unused entries are
+    # dropped.  Returns the same values as merge_concat_tables().
+    #
+    # The first qstr is the source file name, which is used by the merged module.  If
+    # the first module contains native code then its indices can't be changed, so its
+    # tables go first, unchanged.
+    first_cm = compiled_modules[0]
+    first_is_native = (first_cm.header[2] >> 2) & 0x2F != 0
+    if first_is_native:
+        qstrs = [q.str for q in first_cm.qstr_table]
+        objs = list(first_cm.obj_table_data)
+    else:
+        qstrs = [first_cm.qstr_table[0].str]
+        objs = []
+    qstr_index = {}
+    for i, q in enumerate(qstrs):
+        qstr_index.setdefault(q, i)
+    obj_index = {}
+    for i, obj in enumerate(objs):
+        obj_index.setdefault(obj, i)
+
+    # Count the uses of each qstr and object by bytecode.  The uses map each entry to
+    # [number of uses, order of first use].
+    qstr_uses = {}
+    obj_uses = {}
+
+    def add_use(uses, key):
+        if key in uses:
+            uses[key][0] += 1
+        else:
+            uses[key] = [1, len(uses)]
+
+    def count_uses(cm, rc):
+        if rc.code_kind == MP_CODE_BYTECODE:
+            for i in rc.names:
+                add_use(qstr_uses, cm.qstr_table[i].str)
+            for opcode in decode_bytecode(memoryview(rc.fun_data)[rc.offset_opcodes :]):
+                if opcode.fmt == MP_BC_FORMAT_QSTR:
+                    add_use(qstr_uses, cm.qstr_table[opcode.arg].str)
+                elif opcode.opcode_byte == Opcode.MP_BC_LOAD_CONST_OBJ:
+                    add_use(obj_uses, cm.obj_table_data[opcode.arg])
+        for child in rc.children:
+            count_uses(cm, child)
+
+    for cm in compiled_modules:
+        count_uses(cm, cm.raw_code)
+
+    # Add the used entries, most used first, then in order of first use.
+    for q in sorted(qstr_uses, key=lambda q: (-qstr_uses[q][0], qstr_uses[q][1])):
+        if q not in qstr_index:
+            qstr_index[q] = len(qstrs)
+            qstrs.append(q)
+    for obj in sorted(obj_uses, key=lambda obj: (-obj_uses[obj][0], obj_uses[obj][1])):
+        if obj not in obj_index:
+            obj_index[obj] = len(objs)
+            objs.append(obj)
+
+    # Encode the tables.  A qstr that is static in the firmware is referred to by its
+    # index, as done by mpy-cross.
+    static_qstrs = {}
+    for i, q in enumerate(qstrutil.static_qstr_list):
+        static_qstrs.setdefault(q, i + 1)
+    tables = bytearray()
+    for q in qstrs:
+        if q in static_qstrs:
+            tables.extend(mp_encode_uint(static_qstrs[q] << 1 | 1))
+        else:
+            q_bytes = bytes_cons(q, "utf8")
+            tables.extend(mp_encode_uint(len(q_bytes) << 1))
+            tables.extend(q_bytes)
+            tables.append(0)
+    for obj in objs:
+        tables.extend(obj)
+
+    index_maps = []
+    for cm in compiled_modules:
+        index_maps.append(
+            (
+                [qstr_index.get(q.str) for q in cm.qstr_table],
+                [obj_index.get(obj) for obj in cm.obj_table_data],
+            )
+        )
+    if first_is_native:
+        index_maps[0] = (
+            list(range(len(first_cm.qstr_table))),
+            list(range(len(first_cm.obj_table))),
+        )
+
+    return len(qstrs), len(objs), tables, index_maps
+
+
+def merge_mpy(compiled_modules, output_file, share_tables=False):
     merged_mpy = bytearray()
 
     if len(compiled_modules) == 1:
-        with open(compiled_modules[0].mpy_source_file, "rb") as f:
-            merged_mpy.extend(f.read())
+        cm = compiled_modules[0]
+        with open(cm.mpy_source_file, "rb") as f:
+            merged_mpy.extend(f.read(cm.raw_code_file_offset))
+        merged_mpy.extend(write_raw_code(cm.raw_code))
     else:
         main_cm_idx = None
         arch_flags = 0
@@ -1891,24 +3041,13 @@ def merge_mpy(compiled_modules, output_file):
         if arch_flags != 0:
             merged_mpy.extend(mp_encode_uint(arch_flags))
 
-        n_qstr = 0
-        n_obj = 0
-        for cm in compiled_modules:
-            n_qstr += len(cm.qstr_table)
-            n_obj += len(cm.obj_table)
+        if share_tables:
+            n_qstr, n_obj, tables, index_maps = merge_shared_tables(compiled_modules)
+        else:
+            n_qstr, n_obj, tables, index_maps = merge_concat_tables(compiled_modules)
         merged_mpy.extend(mp_encode_uint(n_qstr))
         merged_mpy.extend(mp_encode_uint(n_obj))
-
-        # Copy verbatim the qstr and object tables from all compiled modules.
-        def copy_section(file, offset, offset2):
-            with open(file, "rb") as f:
-                f.seek(offset)
-                merged_mpy.extend(f.read(offset2 - offset))
-
-        for cm in compiled_modules:
-            copy_section(cm.mpy_source_file, cm.qstr_table_file_offset, cm.obj_table_file_offset)
-        for cm in compiled_modules:
-            copy_section(cm.mpy_source_file, cm.obj_table_file_offset, cm.raw_code_file_offset)
+        merged_mpy.extend(tables)
 
         bytecode = bytearray()
         bytecode.append(0b00000000)  # prelude signature
@@ -1927,17 +3066,12 @@ def merge_mpy(compiled_modules, output_file):
         merged_mpy.extend(bytecode)
         merged_mpy.extend(mp_encode_uint(len(compiled_modules)))  # n_children
 
-        qstr_table_base = 0
-        obj_table_base = 0
-        for cm in compiled_modules:
-            if qstr_table_base == 0 and obj_table_base == 0:
-                with open(cm.mpy_source_file, "rb") as f:
-                    f.seek(cm.raw_code_file_offset)
-                    merged_mpy.extend(f.read())
+        for cm, (qstr_map, obj_map) in zip(compiled_modules, index_maps):
+            if qstr_map == list(range(len(qstr_map))) and obj_map == list(range(len(obj_map))):
+                # The indices are unchanged, so the raw code can be written as-is.
+                merged_mpy.extend(write_raw_code(cm.raw_code))
             else:
-                merged_mpy.extend(rewrite_raw_code(cm.raw_code, qstr_table_base, obj_table_base))
-            qstr_table_base += len(cm.qstr_table)
-            obj_table_base += len(cm.obj_table)
+                merged_mpy.extend(rewrite_raw_code(cm.raw_code, qstr_map, obj_map))
 
     if output_file is None:
         sys.stdout.buffer.write(merged_mpy)
@@ -2078,6 +3212,15 @@ class PrintJson(PrintShim):
         return retval
 
 
+def cpu_count():
+    try:
+        import os
+
+        return os.cpu_count() or 1
+    except (ImportError, AttributeError):
+        return 1
+
+
 def main(args=None):
     global global_qstrs
 
@@ -2100,6 +3243,16 @@ def main(args=None):
     cmd_parser.add_argument(
         "--merge", action="store_true", help="merge multiple .mpy files into one"
     )
+    cmd_parser.add_argument(
+        "--merge-shared-tables",
+        action="store_true",
+        help="with --merge, use one qstr and object table for all files, without duplicates",
+    )
+    cmd_parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="validate files and directories of .mpy files, printing statistics as JSON lines",
+    )
     cmd_parser.add_argument(
         "-e", "--extract", metavar="BASE", type=str, help="write segments into separate files"
     )
@@ -2128,8 +3281,36 @@ def main(args=None):
         type=int,
         help="architecture flags value to set in the output file (strips existing flags if not present)",
     )
+    cmd_parser.add_argument(
+        "--optimize",
+        action="store_true",
+        help="optimise bytecode: fold constants, thread jumps, remove dead code and stores",
+    )
+    cmd_parser.add_argument(
+        "--jobs",
+        metavar="N",
+        type=int,
+        help="number of processes to use with --freeze and --stats (default: number of CPUs)",
+    )
+    cmd_parser.add_argument(
+        "--cache-dir",
+        metavar="DIR",
+        help="directory in which to cache the frozen code for each module",
+    )
+    cmd_parser.add_argument(
+        "--profile",
+        metavar="FILE",
+        help="report hot lines and opcodes using a profile from tools/settrace_profile.py",
+    )
+    cmd_parser.add_argument(
+        "--size-report",
+        action="store_true",
+        help="include the ROM size of each frozen module in the summary at the end",
+    )
     cmd_parser.add_argument("-o", "--output", default=None, help="output file")
-    cmd_parser.add_argument("files", nargs="+", help="input .mpy files")
+    cmd_parser.add_argument(
+        "files", nargs="+", help="input .mpy files (or directories of them, with --stats)"
+    )
     args = cmd_parser.parse_args(args)
 
     # set config values relevant to target machine
@@ -2141,6 +3322,7 @@ def main(args=None):
     config.MPZ_DIG_SIZE = args.mmpz_dig_size
     config.native_arch = MP_NATIVE_ARCH_NONE
     config.arch_flags = args.march_flags
+    config.optimize = args.optimize
 
     # set config values for qstrs, and get the existing base set of qstrs
     # already in the firmware
@@ -2157,6 +3339,14 @@ def main(args=None):
     # Create initial list of global qstrs.
     global_qstrs = GlobalQStrList()
 
+    if args.stats:
+        jobs = args.jobs
+        if jobs is None:
+            jobs = cpu_count()
+        if stats_mpy(args.files, jobs):
+            sys.exit(1)
+        return
+
     # Load all .mpy files.
     try:
         compiled_modules = [read_mpy(file) for file in args.files]
@@ -2164,6 +3354,10 @@ def main(args=None):
         print(er, file=sys.stderr)
         sys.exit(1)
 
+    if args.optimize:
+        for cm in compiled_modules:
+            optimize_raw_code(cm.raw_code)
+
     if args.json:
         if args.freeze:
             print_shim = PrintJson(sys.stdout, language_id="c")
@@ -2185,15 +3379,30 @@ def main(args=None):
                 print()
             disassemble_mpy(compiled_modules)
 
+        if args.profile:
+            if args.hexdump or args.disassemble:
+                print()
+            profile_mpy(compiled_modules, args.profile)
+
         if args.freeze:
+            jobs = args.jobs
+            cache_dir = args.cache_dir
+            if args.json:
+                # The JSON output collects annotations in this process.
+                jobs = 1
+                cache_dir = None
+            elif jobs is None:
+                jobs = cpu_count()
             try:
-                freeze_mpy(firmware_qstr_idents, compiled_modules)
+                freeze_mpy(
+                    firmware_qstr_idents, compiled_modules, jobs, cache_dir, args.size_report
+                )
             except FreezeError as er:
                 print(er, file=sys.stderr)
                 sys.exit(1)
 
     if args.merge:
-        merge_mpy(compiled_modules, args.output)
+        merge_mpy(compiled_modules, args.output, args.merge_shared_tables)
 
     if args.extract:
         extract_segments(compiled_modules, args.extract, args.extract_only)
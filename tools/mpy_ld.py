@@ -28,7 +28,7 @@
 Link .o files to .mpy
 """
 
-import sys, os, struct, re
+import sys, os, struct, re, hashlib, json
 from elftools.elf import elffile
 import ar_util
 
@@ -365,14 +365,23 @@ def log(level, msg):
 # Qstr extraction
 
 
-def extract_qstrs(source_files):
-    def read_qstrs(f):
-        with open(f) as f:
-            vals = set()
-            for line in f:
-                for m in re.finditer(r"MP_QSTR_[A-Za-z0-9_]*", line):
-                    vals.add(m.group())
-            return vals
+def extract_qstrs(source_files, cache=None):
+    # The optional cache maps each source file to the hash of its content and
+    # the qstrs it contains, so only files that changed need to be scanned.
+    if cache is None:
+        cache = {}
+
+    def read_qstrs(filename):
+        with open(filename, "rb") as f:
+            data = f.read()
+        h = hashlib.sha256(data).hexdigest()
+        entry = cache.get(filename)
+        if entry is None or entry[0] != h:
+            vals = sorted(
+                set(m.group().decode() for m in re.finditer(rb"MP_QSTR_[A-Za-z0-9_]*", data))
+            )
+            entry = cache[filename] = [h, vals]
+        return entry[1]
 
     static_qstrs = ["MP_QSTR_" + qstrutil.qstr_escape(q) for q in qstrutil.static_qstr_list]
 
@@ -408,6 +417,49 @@ class Section:
         return Section(elfsec.name, elfsec.data(), elfsec.data_alignment, filename)
 
 
+class Relocation:
+    __slots__ = ("offset", "info_type", "addend", "sym", "computed_reloc")
+
+    def __init__(self, offset, info_type, addend, sym):
+        self.offset = offset
+        self.info_type = info_type
+        self.addend = addend
+        self.sym = sym
+
+    def __repr__(self):
+        return "Relocation(offset=0x{:x}, type={}, addend={}, sym={})".format(
+            self.offset, self.info_type, self.addend, self.sym.name
+        )
+
+    @staticmethod
+    def from_elfsec(elf, elfsec, symtab):
+        # Decode the raw REL/RELA entries in one go, rather than having pyelftools
+        # parse each one into a container, which is very slow for large sections.
+        if elf.elfclass == 32:
+            fmt, sym_shift, type_mask = "II", 8, 0xFF
+        else:
+            fmt, sym_shift, type_mask = "QQ", 32, 0xFFFFFFFF
+        is_rela = elfsec.header.sh_type == "SHT_RELA"
+        if is_rela:
+            fmt += "i" if elf.elfclass == 32 else "q"
+        entry = struct.Struct(("<" if elf.little_endian else ">") + fmt)
+        if elfsec.header.sh_entsize != entry.size:
+            raise LinkError(
+                "{}: unexpected entry size {}".format(elfsec.name, elfsec.header.sh_entsize)
+            )
+        data = elfsec.data()
+        if is_rela:
+            return [
+                Relocation(offset, info & type_mask, addend, symtab[info >> sym_shift])
+                for offset, info, addend in entry.iter_unpack(data)
+            ]
+        else:
+            return [
+                Relocation(offset, info & type_mask, 0, symtab[info >> sym_shift])
+                for offset, info in entry.iter_unpack(data)
+            ]
+
+
 class GOTEntry:
     def __init__(self, name, sym, link_addr=0):
         self.name = name
@@ -470,7 +522,7 @@ def build_got_generic(env):
             s = r.sym
             if not (
                 s.entry["st_info"]["bind"] in ("STB_GLOBAL", "STB_WEAK")
-                and r["r_info_type"] in env.arch.arch_got
+                and r.info_type in env.arch.arch_got
             ):
                 continue
             s_type = s.entry["st_info"]["type"]
@@ -495,19 +547,19 @@ def build_got_xtensa(env):
             s = r.sym
             s_type = s.entry["st_info"]["type"]
             assert s_type in ("STT_NOTYPE", "STT_FUNC", "STT_OBJECT", "STT_SECTION"), s_type
-            assert r["r_info_type"] in env.arch.arch_got
-            assert r["r_offset"] % env.arch.word_size == 0
+            assert r.info_type in env.arch.arch_got
+            assert r.offset % env.arch.word_size == 0
             # This entry is a global pointer
-            existing = struct.unpack_from("<I", sec.data, r["r_offset"])[0]
+            existing = struct.unpack_from("<I", sec.data, r.offset)[0]
             if s_type == "STT_SECTION":
-                assert r["r_addend"] == 0
+                assert r.addend == 0
                 name = "{}+0x{:x}".format(s.section.name, existing)
             else:
                 assert existing == 0
                 name = s.name
-                if r["r_addend"] != 0:
-                    name = "{}+0x{:x}".format(name, r["r_addend"])
-            idx = "{}+0x{:x}".format(sec.filename, r["r_offset"])
+                if r.addend != 0:
+                    name = "{}+0x{:x}".format(name, r.addend)
+            idx = "{}+0x{:x}".format(sec.filename, r.offset)
             env.xt_literals[idx] = name
             if name in env.got_entries:
                 # Deduplicate GOT entries
@@ -606,13 +658,9 @@ def do_relocation_text(env, text_addr, r):
     s = r.sym
     s_bind = s.entry["st_info"]["bind"]
     s_type = s.entry["st_info"]["type"]
-    r_offset = r["r_offset"] + text_addr
-    r_info_type = r["r_info_type"]
-    try:
-        # only for RELA sections
-        r_addend = r["r_addend"]
-    except KeyError:
-        r_addend = 0
+    r_offset = r.offset + text_addr
+    r_info_type = r.info_type
+    r_addend = r.addend
 
     # Default relocation type and name for logging
     reloc_type = "le32"
@@ -801,66 +849,67 @@ def do_relocation_text(env, text_addr, r):
         log(LOG_LEVEL_3, "  {:08x} {} == {:08x}".format(r_offset, log_name, value))
 
 
+# Relocation types for absolute pointers in data, per architecture
+DATA_RELOC_TYPES = {
+    "EM_386": (R_386_32,),
+    "EM_X86_64": (R_X86_64_64,),
+    "EM_ARM": (R_ARM_ABS32,),
+    "EM_XTENSA": (R_XTENSA_32,),
+    "EM_RISCV": (R_RISCV_32, R_RISCV_64),
+}
+
+
 def do_relocation_data(env, text_addr, r):
-    s = r.sym
-    s_type = s.entry["st_info"]["type"]
-    r_offset = r["r_offset"] + text_addr
-    r_info_type = r["r_info_type"]
-    try:
-        # only for RELA sections
-        r_addend = r["r_addend"]
-    except KeyError:
-        r_addend = 0
+    do_relocations_data(env, text_addr, (r,))
+
+
+def do_relocations_data(env, text_addr, relocs):
+    # Work out everything that is the same for all relocations up front, so that
+    # large tables of pointers in .data.rel.ro can be processed quickly.
+    reloc_types = DATA_RELOC_TYPES.get(env.arch.name, ())
+    word_size = env.arch.word_size
+    if word_size == 4:
+        word = struct.Struct("<i")
+    elif word_size == 8:
+        word = struct.Struct("<q")
+    if env.arch.separate_rodata:
+        data = env.full_rodata
+        base = ".rodata"
+    else:
+        data = env.full_text
+        base = ".text"
+    mpy_relocs = env.mpy_relocs
+    log_relocs = log_level >= LOG_LEVEL_3
+
+    for r in relocs:
+        if r.info_type not in reloc_types:
+            # Unknown/unsupported relocation
+            assert 0, r.info_type
 
-    if (
-        env.arch.name == "EM_386"
-        and r_info_type == R_386_32
-        or env.arch.name == "EM_X86_64"
-        and r_info_type == R_X86_64_64
-        or env.arch.name == "EM_ARM"
-        and r_info_type == R_ARM_ABS32
-        or env.arch.name == "EM_XTENSA"
-        and r_info_type == R_XTENSA_32
-        or env.arch.name == "EM_RISCV"
-        and r_info_type in (R_RISCV_32, R_RISCV_64)
-    ):
         # Relocation in data.rel.ro to internal/external symbol
-        if env.arch.word_size == 4:
-            struct_type = "<i"
-        elif env.arch.word_size == 8:
-            struct_type = "<q"
+        s = r.sym
+        r_offset = r.offset + text_addr
         if hasattr(s, "resolved"):
             s = s.resolved
         sec = s.section
-        assert r_offset % env.arch.word_size == 0
-        addr = sec.addr + s["st_value"] + r_addend
-        if s_type == "STT_SECTION":
-            log_name = sec.name
-        else:
-            log_name = s.name
-        log(LOG_LEVEL_3, "  {:08x} -> {} {:08x}".format(r_offset, log_name, addr))
-        if env.arch.separate_rodata:
-            data = env.full_rodata
-        else:
-            data = env.full_text
-        (existing,) = struct.unpack_from(struct_type, data, r_offset)
+        assert r_offset % word_size == 0
+        addr = sec.addr + s["st_value"] + r.addend
+        if log_relocs:
+            if r.sym.entry["st_info"]["type"] == "STT_SECTION":
+                log_name = sec.name
+            else:
+                log_name = s.name
+            log(LOG_LEVEL_3, "  {:08x} -> {} {:08x}".format(r_offset, log_name, addr))
         if sec.name.startswith((".text", ".rodata", ".data.rel.ro", ".bss")):
-            struct.pack_into(struct_type, data, r_offset, existing + addr)
+            (existing,) = word.unpack_from(data, r_offset)
+            word.pack_into(data, r_offset, existing + addr)
             kind = sec.name
         elif sec.name == ".external.mp_fun_table":
             assert addr == 0
             kind = s.mp_fun_table_offset
         else:
             assert 0, sec.name
-        if env.arch.separate_rodata:
-            base = ".rodata"
-        else:
-            base = ".text"
-        env.mpy_relocs.append((base, r_offset, kind))
-
-    else:
-        # Unknown/unsupported relocation
-        assert 0, r_info_type
+        mpy_relocs.append((base, r_offset, kind))
 
 
 RISCV_RELOCATIONS_TYPE_MAP = {
@@ -902,12 +951,9 @@ def process_riscv32_relocation(env, text_addr, r):
     if hasattr(s, "resolved"):
         s = s.resolved
 
-    r_offset = r["r_offset"] + text_addr
-    r_info_type = r["r_info_type"]
-    try:
-        r_addend = r["r_addend"]
-    except KeyError:
-        r_addend = 0
+    r_offset = r.offset + text_addr
+    r_info_type = r.info_type
+    r_addend = r.addend
 
     if r_info_type == R_RISCV_GOT_HI20:
         got_entry = env.got_entries[s.name]
@@ -942,9 +988,9 @@ def process_riscv32_relocation(env, text_addr, r):
     ):
         parent = None
         for potential_parent in s.section.reloc:
-            if potential_parent["r_offset"] != s["st_value"]:
+            if potential_parent.offset != s["st_value"]:
                 continue
-            if potential_parent["r_info_type"] not in (
+            if potential_parent.info_type not in (
                 R_RISCV_GOT_HI20,
                 R_RISCV_PCREL_HI20,
                 R_RISCV_HI20,
@@ -1133,12 +1179,13 @@ def process_riscv32_relocation(env, text_addr, r):
     return addr, value
 
 
-def load_object_file(env, f, felf):
+def load_object_file(env, f, felf, symtab=None):
     elf = elffile.ELFFile(f)
     env.check_arch(elf["e_machine"])
 
-    # Get symbol table
-    symtab = list(elf.get_section_by_name(".symtab").iter_symbols())
+    # Get symbol table, if not already loaded
+    if symtab is None:
+        symtab = list(elf.get_section_by_name(".symtab").iter_symbols())
 
     # Load needed sections from ELF file
     sections_shndx = {}  # maps elf shndx to Section object
@@ -1164,9 +1211,7 @@ def load_object_file(env, f, felf):
             if shndx in sections_shndx:
                 sec = sections_shndx[shndx]
                 sec.reloc_name = s.name
-                sec.reloc = list(s.iter_relocations())
-                for r in sec.reloc:
-                    r.sym = symtab[r["r_info_sym"]]
+                sec.reloc = Relocation.from_elfsec(elf, s, symtab)
 
     # Link symbols to their sections, and update known and unresolved symbols
     dup_errors = []
@@ -1316,13 +1361,13 @@ def link_objects(env, native_qstr_vals_len):
             LOG_LEVEL_3,
             "{}: {} relocations via {}:".format(sec.filename, sec.name, sec.reloc_name),
         )
-        for r in sec.reloc:
-            if sec.name.startswith((".text", ".rodata")):
+        if sec.name.startswith((".text", ".rodata")):
+            for r in sec.reloc:
                 do_relocation_text(env, sec.addr, r)
-            elif sec.name.startswith(".data.rel.ro"):
-                do_relocation_data(env, sec.addr, r)
-            else:
-                assert 0, sec.name
+        elif sec.name.startswith(".data.rel.ro"):
+            do_relocations_data(env, sec.addr, sec.reloc)
+        else:
+            assert 0, sec.name
 
 
 ################################################################################
@@ -1502,21 +1547,50 @@ def do_preprocess(args):
     if args.output is None:
         assert args.files[0].endswith(".c")
         args.output = args.files[0][:-1] + "config.h"
-    static_qstrs, qstr_vals = extract_qstrs(args.files)
-    with open(args.output, "w") as f:
-        print(
-            "#include <stdint.h>\n"
-            "typedef uintptr_t mp_uint_t;\n"
-            "typedef intptr_t mp_int_t;\n"
-            "typedef uintptr_t mp_off_t;",
-            file=f,
-        )
-        for i, q in enumerate(static_qstrs):
-            print("#define %s (%u)" % (q, i + 1), file=f)
-        for i, q in enumerate(sorted(qstr_vals)):
-            print("#define %s (mp_native_qstr_table[%d])" % (q, i + 1), file=f)
-        print("extern const uint16_t mp_native_qstr_table[];", file=f)
-        print("extern const mp_uint_t mp_native_obj_table[];", file=f)
+
+    # Load the per-file qstr cache from a previous run, if there is one.
+    cache_file = args.output + ".qstrs.json"
+    try:
+        with open(cache_file) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+    old_cache = dict(cache)
+
+    static_qstrs, qstr_vals = extract_qstrs(args.files, cache)
+
+    lines = [
+        "#include <stdint.h>",
+        "typedef uintptr_t mp_uint_t;",
+        "typedef intptr_t mp_int_t;",
+        "typedef uintptr_t mp_off_t;",
+    ]
+    for i, q in enumerate(static_qstrs):
+        lines.append("#define %s (%u)" % (q, i + 1))
+    for i, q in enumerate(sorted(qstr_vals)):
+        lines.append("#define %s (mp_native_qstr_table[%d])" % (q, i + 1))
+    lines.append("extern const uint16_t mp_native_qstr_table[];")
+    lines.append("extern const mp_uint_t mp_native_obj_table[];")
+    content = "\n".join(lines) + "\n"
+
+    # Only write the header if it changed, so that everything depending on it
+    # isn't needlessly rebuilt.
+    try:
+        with open(args.output) as f:
+            changed = f.read() != content
+    except OSError:
+        changed = True
+    if changed:
+        with open(args.output, "w") as f:
+            f.write(content)
+    else:
+        log(LOG_LEVEL_2, "{} is unchanged".format(args.output))
+
+    # Save the cache, dropping any files that are no longer used.
+    cache = {f: cache[f] for f in args.files}
+    if cache != old_cache:
+        with open(cache_file, "w") as f:
+            json.dump(cache, f)
 
 
 def do_link(args):
@@ -1545,7 +1619,7 @@ def do_link(args):
             # Load archive info
             archives = []
             for item in args.libs:
-                archives.extend(ar_util.load_archive(item))
+                archives.extend(ar_util.load_archive(item, args.verify_lib_cache))
             # List symbols to look for
             syms = set(sym.name for sym in env.unresolved_syms)
             # Resolve symbols from libs
@@ -1555,7 +1629,7 @@ def do_link(args):
                 obj_name = ar.fn + ":" + obj
                 log(LOG_LEVEL_2, "using " + obj_name)
                 with ar.open(obj) as f:
-                    load_object_file(env, f, obj_name)
+                    load_object_file(env, f, obj_name, ar.load_symtab(obj))
 
         link_objects(env, len(native_qstr_vals))
         build_mpy(env, args.output, native_qstr_vals, args.arch_flags)
@@ -1651,6 +1725,11 @@ def main():
     cmd_parser.add_argument(
         "--libs", "-l", dest="libs", action="append", help="static .a libraries to link"
     )
+    cmd_parser.add_argument(
+        "--verify-lib-cache",
+        action="store_true",
+        help="check the content of static libraries, not just their timestamp, against the cache",
+    )
     cmd_parser.add_argument(
         "--output", "-o", default=None, help="output .mpy file (default to input with .o->.mpy)"
     )
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+#
+# This file is part of the MicroPython project, http://micropython.org/
+#
+# The MIT License (MIT)
+#
+# Copyright (c) 2026 agent
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+This script benchmarks mpy-tool.py on a large synthetic set of .mpy files.
+
+It generates a set of Python modules with a mix of shared and unique names
+and string constants, compiles them with mpy-cross, then times mpy-tool.py
+over the resulting .mpy files and reports the time taken per module.
+
+Typical usage is:
+
+    $ make -C mpy-cross
+    $ ./tools/mpy_tool_bench.py -n 400
+
+Extra arguments after -- are passed through to mpy-tool.py, eg:
+
+    $ ./tools/mpy_tool_bench.py -n 400 -- -d
+
+With --memory the peak memory allocated by mpy-tool.py, as measured by
+tracemalloc, is reported instead of the time taken.  Only the main process is
+measured, so freezing is done with --jobs 1.  Use --max-peak to fail if the peak
+is above a limit, eg to catch regressions in CI:
+
+    $ ./tools/mpy_tool_bench.py -n 400 --memory --max-peak 100
+
+"""
+
+import argparse, os, subprocess, sys, tempfile, time
+
+TOP = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MPY_TOOL = os.path.join(TOP, "tools", "mpy-tool.py")
+MPY_CROSS = os.path.join(TOP, "mpy-cross", "build", "mpy-cross")
+
+# Runs mpy-tool.py under tracemalloc and writes the peak memory to a file.
+MEMORY_DRIVER = """
+import runpy, sys, tracemalloc
+peak_file = sys.argv.pop(1)
+sys.argv.pop(0)
+sys.path.insert(0, sys.argv[0].rsplit("/", 1)[0])
+tracemalloc.start()
+try:
+    runpy.run_path(sys.argv[0], run_name="__main__")
+finally:
+    with open(peak_file, "w") as f:
+        f.write(str(tracemalloc.get_traced_memory()[1]))
+"""
+
+
+def make_module_source(index, num_funcs):
+    lines = ["import sys", "", "SHARED = ('shared_%d', 'common', 'value')" % (index % 7)]
+    for f in range(num_funcs):
+        lines.extend(
+            [
+                "",
+                "def func_%d_%d(arg_%d, key=None):" % (index, f, f),
+                "    name = 'module_%d_str_%d'" % (index, f),
+                "    long_str = 'a longer string constant that is not interned %d_%d'"
+                % (index, f),
+                "    if key == 'attr_%d':" % (f % 13),
+                "        return arg_%d.attr_%d" % (f, f % 13),
+                "    return (name, long_str, %d, %d.5, b'bytes_%d')" % (f, f, f),
+            ]
+        )
+    lines.extend(
+        [
+            "",
+            "class Class%d:" % index,
+            "    def method_%d(self):" % (index % 11),
+            "        return SHARED",
+            "",
+        ]
+    )
+    return "\n".join(lines)
+
+
+def make_mpy_files(dir, num_modules, num_funcs, mpy_cross):
+    mpy_files = []
+    for index in range(num_modules):
+        name = "bench_mod_%d" % index
+        py_file = os.path.join(dir, name + ".py")
+        mpy_file = os.path.join(dir, name + ".mpy")
+        with open(py_file, "w") as f:
+            f.write(make_module_source(index, num_funcs))
+        subprocess.check_call([mpy_cross, "-s", name + ".py", "-o", mpy_file, py_file])
+        mpy_files.append(mpy_file)
+    return mpy_files
+
+
+def run_mpy_tool(mpy_files, tool_args):
+    t0 = time.perf_counter()
+    subprocess.check_call(
+        [sys.executable, MPY_TOOL] + tool_args + mpy_files, stdout=subprocess.DEVNULL
+    )
+    return time.perf_counter() - t0
+
+
+def run_mpy_tool_memory(mpy_files, tool_args, dir):
+    peak_file = os.path.join(dir, "peak.txt")
+    subprocess.check_call(
+        [sys.executable, "-c", MEMORY_DRIVER, peak_file, MPY_TOOL] + tool_args + mpy_files,
+        stdout=subprocess.DEVNULL,
+    )
+    with open(peak_file) as f:
+        return int(f.read())
+
+
+def main():
+    cmd_parser = argparse.ArgumentParser(description="Benchmark mpy-tool.py.")
+    cmd_parser.add_argument(
+        "-n", "--modules", type=int, default=400, help="number of modules (default 400)"
+    )
+    cmd_parser.add_argument(
+        "--funcs", type=int, default=20, help="number of functions per module (default 20)"
+    )
+    cmd_parser.add_argument(
+        "-r", "--repeat", type=int, default=3, help="number of timed runs (default 3)"
+    )
+    cmd_parser.add_argument(
+        "--memory", action="store_true", help="measure peak memory instead of time"
+    )
+    cmd_parser.add_argument(
+        "--max-peak", metavar="MB", type=float, help="with --memory, fail if the peak is above MB"
+    )
+    cmd_parser.add_argument("-q", "--qstr-header", help="qstr header file to freeze against")
+    cmd_parser.add_argument("--mpy-cross", default=MPY_CROSS, help="mpy-cross binary to use")
+    cmd_parser.add_argument("tool_args", nargs="*", help="arguments for mpy-tool.py")
+    args = cmd_parser.parse_args()
+
+    tool_args = args.tool_args or ["-f"]
+    if args.qstr_header:
+        tool_args += ["-q", args.qstr_header]
+    if args.memory and "-f" in tool_args:
+        tool_args += ["--jobs", "1"]
+
+    with tempfile.TemporaryDirectory() as dir:
+        print("generating %d modules..." % args.modules)
+        mpy_files = make_mpy_files(dir, args.modules, args.funcs, args.mpy_cross)
+
+        print("running mpy-tool.py %s" % " ".join(tool_args))
+        if args.memory:
+            peak = run_mpy_tool_memory(mpy_files, tool_args, dir) / 1024 / 1024
+            print("peak: %.2f MB, %.1f kB per module" % (peak, peak * 1024 / args.modules))
+            if args.max_peak is not None and peak > args.max_peak:
+                print("peak is above the limit of %.2f MB" % args.max_peak)
+                sys.exit(1)
+            return
+
+        times = []
+        for _ in range(args.repeat):
+            times.append(run_mpy_tool(mpy_files, tool_args))
+            print("  %.3f s" % times[-1])
+
+    best = min(times)
+    print("best: %.3f s, %.3f ms per module" % (best, best * 1000 / args.modules))
+
+
+if __name__ == "__main__":
+    main()
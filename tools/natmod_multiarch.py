@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+#
+# This file is part of the MicroPython project, http://micropython.org/
+#
+# The MIT License (MIT)
+#
+# Copyright (c) 2026 agent
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+This script builds a dynamic native module for several architectures at once.
+
+The module's own Makefile (which includes py/dynruntime.mk) is run once per
+architecture, all of them concurrently, each with its own build directory.
+The qstr configuration header generated by `mpy_ld.py --preprocess` does not
+depend on the architecture, so it is generated once up front and shared by all
+the builds.  Typical usage is:
+
+    $ ./tools/natmod_multiarch.py -C examples/natmod/features2 -a x64,armv7m
+
+This produces features2-x64.mpy and features2-armv7m.mpy in the module's
+directory (or the directory given by -o) and prints a table of the code and
+data sizes reported by the linker for each architecture.  Any VAR=VALUE
+arguments are passed through to make for every architecture.
+"""
+
+import argparse
+import concurrent.futures
+import os
+import subprocess
+import sys
+
+DEFAULT_ARCHES = ("x64", "armv6m", "armv7m", "armv7emsp", "xtensawin", "rv32imc")
+
+SIZE_FIELDS = (
+    ("text", "text size:"),
+    ("rodata", "rodata size:"),
+    ("bss", "bss size:"),
+    ("got", "GOT entries:"),
+)
+
+
+class BuildError(Exception):
+    pass
+
+
+def run_make(args, make_vars, goal=None):
+    cmd = [args.make, "--no-print-directory", "-C", args.directory]
+    cmd.extend("{}={}".format(k, v) for k, v in make_vars)
+    if goal is not None:
+        cmd.append(goal)
+    return subprocess.run(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True
+    )
+
+
+def get_module_name(args):
+    # Let the module's Makefile tell us the value of MOD.
+    res = subprocess.run(
+        [
+            args.make,
+            "--no-print-directory",
+            "-s",
+            "-C",
+            args.directory,
+            "--eval=natmod-multiarch-mod: ; @echo $(MOD)",
+            "ARCH=" + args.arch[0],
+            "natmod-multiarch-mod",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        universal_newlines=True,
+    )
+    mod = res.stdout.strip().splitlines()[-1:] if res.returncode == 0 else None
+    if not mod or not mod[0]:
+        raise BuildError("could not get MOD from Makefile:\n" + res.stdout)
+    return mod[0]
+
+
+def parse_sizes(output):
+    sizes = {}
+    for line in output.splitlines():
+        for name, prefix in SIZE_FIELDS:
+            if line.startswith(prefix):
+                sizes[name] = int(line[len(prefix) :])
+    return sizes
+
+
+def build_arch(args, common_vars, mod, arch):
+    mpy_file = os.path.join(args.output, "{}-{}.mpy".format(mod, arch))
+    make_vars = [
+        ("ARCH", arch),
+        ("BUILD", os.path.join(args.build, arch)),
+        ("MPY_FILE", mpy_file),
+    ]
+    res = run_make(args, make_vars + common_vars)
+    if res.returncode != 0:
+        return arch, None, res.stdout
+    sizes = parse_sizes(res.stdout)
+    sizes["mpy"] = os.stat(os.path.join(args.directory, mpy_file)).st_size
+    return arch, sizes, res.stdout
+
+
+def print_size_table(mod, results):
+    fields = ["mpy"] + [name for name, _ in SIZE_FIELDS]
+    print("{:<12}".format(mod) + "".join("{:>9}".format(f) for f in fields))
+    for arch, sizes in results:
+        if sizes is None:
+            print("{:<12}{:>9}".format(arch, "failed"))
+        else:
+            print(
+                "{:<12}".format(arch) + "".join("{:>9}".format(sizes.get(f, "-")) for f in fields)
+            )
+
+
+def main():
+    cmd_parser = argparse.ArgumentParser(
+        description="Build a dynamic native module for several architectures concurrently."
+    )
+    cmd_parser.add_argument(
+        "-C", "--directory", default=".", help="directory of the native module's Makefile"
+    )
+    cmd_parser.add_argument(
+        "-a",
+        "--arch",
+        default=",".join(DEFAULT_ARCHES),
+        help="comma-separated list of architectures (default: %(default)s)",
+    )
+    cmd_parser.add_argument(
+        "-o",
+        "--output",
+        default=".",
+        help="output directory for the .mpy files, relative to the module directory",
+    )
+    cmd_parser.add_argument(
+        "-b",
+        "--build",
+        default="build",
+        help="build directory, relative to the module directory (default: %(default)s)",
+    )
+    cmd_parser.add_argument(
+        "-j", "--jobs", type=int, default=0, help="number of architectures to build at once"
+    )
+    cmd_parser.add_argument("-v", "--verbose", action="store_true", help="show make output")
+    cmd_parser.add_argument("--make", default="make", help="make program to use")
+    cmd_parser.add_argument("vars", nargs="*", help="VAR=VALUE arguments passed to make")
+    args = cmd_parser.parse_args()
+
+    args.arch = [a for a in args.arch.split(",") if a]
+    if not args.arch:
+        cmd_parser.error("no architectures given")
+    common_vars = []
+    for var in args.vars:
+        if "=" not in var:
+            cmd_parser.error("expected VAR=VALUE, got '{}'".format(var))
+        common_vars.append(tuple(var.split("=", 1)))
+
+    try:
+        mod = get_module_name(args)
+    except BuildError as er:
+        print("error:", er, file=sys.stderr)
+        sys.exit(1)
+
+    # Generate the qstr configuration header once, it's the same for all
+    # architectures.  Each per-arch build then finds it up to date.
+    config_h = os.path.join(args.build, mod + ".config.h")
+    common_vars.append(("CONFIG_H", config_h))
+    res = run_make(
+        args,
+        [("ARCH", args.arch[0]), ("BUILD", os.path.join(args.build, args.arch[0]))] + common_vars,
+        config_h,
+    )
+    if args.verbose or res.returncode != 0:
+        print(res.stdout, end="")
+    if res.returncode != 0:
+        print("error: failed to generate", config_h, file=sys.stderr)
+        sys.exit(1)
+
+    os.makedirs(os.path.join(args.directory, args.output), exist_ok=True)
+
+    results = []
+    with concurrent.futures.ThreadPoolExecutor(args.jobs or len(args.arch)) as executor:
+        futures = [executor.submit(build_arch, args, common_vars, mod, arch) for arch in args.arch]
+        for future in futures:
+            arch, sizes, output = future.result()
+            if args.verbose or sizes is None:
+                print("==== {} ====".format(arch))
+                print(output, end="")
+            results.append((arch, sizes))
+
+    print_size_table(mod, results)
+
+    if any(sizes is None for _, sizes in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env micropython
+#
+# This file is part of the MicroPython project, http://micropython.org/
+#
+# The MIT License (MIT)
+#
+# Copyright (c) 2026 agent
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""
+This script imports a module under MicroPython with sys.settrace enabled, and
+counts the number of calls to each function and the number of times execution
+enters each line of each function.  The counts are written out as JSON, to be
+joined with the disassembly of the module's .mpy file by mpy-tool.py.
+
+It must be run by a MicroPython build with MICROPY_PY_SYS_SETTRACE enabled, eg
+the coverage variant of the unix port.  Typical usage is:
+
+    $ mpy-cross mymodule.py
+    $ micropython tools/settrace_profile.py -o profile.json mymodule [ARGS...]
+    $ ./tools/mpy-tool.py --profile profile.json mymodule.mpy
+
+The module is imported from the current directory with sys.argv set to the
+module name followed by ARGS, so the code to profile must run at import time.
+"""
+
+import json
+import sys
+
+
+def main():
+    args = sys.argv[1:]
+    output = "profile.json"
+    if len(args) >= 2 and args[0] == "-o":
+        output = args[1]
+        args = args[2:]
+    if not args:
+        print("usage: settrace_profile.py [-o OUTPUT] MODULE [ARGS...]")
+        sys.exit(2)
+
+    # Map (file, function name, first line) to [number of calls, {line: count}].
+    functions = {}
+
+    def trace(frame, event, arg):
+        code = frame.f_code
+        key = (code.co_filename, code.co_name, code.co_firstlineno)
+        try:
+            func = functions[key]
+        except KeyError:
+            func = functions[key] = [0, {}]
+        if event == "call":
+            func[0] += 1
+        elif event == "line":
+            lines = func[1]
+            lines[frame.f_lineno] = lines.get(frame.f_lineno, 0) + 1
+        return trace
+
+    sys.argv[:] = args
+    sys.path.insert(0, "")
+    sys.settrace(trace)
+    try:
+        __import__(args[0])
+    finally:
+        sys.settrace(None)
+        profile = []
+        for (filename, name, firstlineno), (calls, lines) in functions.items():
+            profile.append(
+                {
+                    "file": filename,
+                    "name": name,
+                    "firstlineno": firstlineno,
+                    "calls": calls,
+                    "lines": {str(line): count for line, count in lines.items()},
+                }
+            )
+        with open(output, "w") as f:
+            json.dump(profile, f)
+
+
+main()